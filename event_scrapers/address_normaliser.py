@@ -0,0 +1,93 @@
+"""
+Canonical address keys for geocode caches and lookup tables.
+
+Source data writes the same place many ways: "Shop 12, 59 Brisbane Road,",
+"shop 12 / 59 Brisbane Rd", "12/59 Brisbane Rd". Every spelling that becomes
+its own cache key costs another rate-limited geocoder call, so keys are built
+from a canonical form instead:
+
+    - lower case, punctuation folded to spaces, whitespace collapsed
+    - street type and direction abbreviations expanded (Rd → road, Cnr → corner)
+    - unit / shop / level prefixes dropped ("Shop 12, 59 ..." → "59 ...")
+    - number ranges folded to the first number ("12-54 Goodna Rd" → "12 goodna road")
+
+    >>> address_key('Shop 12, 59 Brisbane Rd', 'REDBANK', '4301')
+    '59 brisbane road|redbank|4301'
+"""
+
+import re
+
+# Abbreviation → full word, applied per word after punctuation is removed
+ABBREVIATIONS = {
+    # street types (G-NAF spells these out)
+    'st': 'street', 'steet': 'street', 'rd': 'road', 'ave': 'avenue', 'av': 'avenue',
+    'dr': 'drive', 'drv': 'drive', 'ct': 'court', 'crt': 'court', 'cres': 'crescent',
+    'cr': 'crescent', 'pde': 'parade', 'pl': 'place', 'tce': 'terrace', 'hwy': 'highway',
+    'cct': 'circuit', 'cl': 'close', 'bvd': 'boulevard', 'blvd': 'boulevard',
+    'esp': 'esplanade', 'gr': 'grove', 'ln': 'lane', 'wy': 'way', 'sq': 'square',
+    'mwy': 'motorway', 'pkwy': 'parkway', 'rdwy': 'roadway', 'gdns': 'gardens',
+    # qualifiers
+    'cnr': 'corner', 'nth': 'north', 'sth': 'south', 'mt': 'mount',
+}
+
+_UNIT_WORDS = r'(?:shop|unit|suite|ste|level|lvl|lot|apt|apartment|flat|office|u|g|kiosk|tenancy)'
+# The whole unit number, then a separator and the street number ("Shop 12, 59 ...",
+# "Unit 3 45 ..."); "Lot 25 Smith Rd" has no street number and is left alone
+_UNIT_PREFIX_RE = re.compile(rf'^\s*{_UNIT_WORDS}\s*[a-z]?\d+[a-z]?(?!\d)(?:\s*[,/]\s*|\s+)(?=\d)')
+_SLASH_UNIT_RE = re.compile(r'^\s*[a-z]?\d+[a-z]?\s*/\s*(?=\d)')    # "12/59 ..." → "59 ..."
+_LEADING_PLACE_RE = re.compile(r'^[^\d]*?,\s*(?=\d)')                 # "Cultural Precinct, 10 ..." → "10 ..."
+_RANGE_RE = re.compile(r'^(\d+[a-z]?)\s*-\s*\d+[a-z]?\b')
+_PUNCTUATION_RE = re.compile(r'[^a-z0-9 ]+')
+_LOCALITY_LINE_RE = re.compile(r'^(.*?)[,\s]+(qld|nsw|act|vic|tas|sa|wa|nt)\s+(\d{4})\s*$')
+
+
+def _words(text):
+    text = (text or '').lower().replace('&', ' and ')
+    return _PUNCTUATION_RE.sub(' ', text).split()
+
+
+def canonical_place(text):
+    """Suburb / postcode / state: lower case, punctuation folded, whitespace collapsed"""
+    return ' '.join(_words(text))
+
+
+def canonical_street(address):
+    """Canonical 'number street type' for an address line"""
+    text = (address or '').strip().lower()
+    text = _UNIT_PREFIX_RE.sub('', text)
+    text = _SLASH_UNIT_RE.sub('', text)
+    text = _LEADING_PLACE_RE.sub('', text)
+    text = _RANGE_RE.sub(r'\1', text)
+    return ' '.join(ABBREVIATIONS.get(word, word) for word in _words(text))
+
+
+def address_key(address, suburb, postcode=''):
+    """'street|suburb|postcode' cache key from canonical parts"""
+    return f"{canonical_street(address)}|{canonical_place(suburb)}|{canonical_place(postcode)}"
+
+
+def rekey(key):
+    """Canonicalise an existing 'address|suburb|postcode' key"""
+    address, _, rest = key.partition('|')
+    suburb, _, postcode = rest.partition('|')
+    return address_key(address, suburb, postcode)
+
+
+def split_location(text):
+    """
+    Split a multi-line location ("59 Brisbane Rd\\nRedbank, QLD 4301") into
+    (street, suburb, state, postcode); parts it can't find are ''
+    """
+    lines = [line.strip() for line in (text or '').split('\n') if line.strip()]
+    if not lines:
+        return '', '', '', ''
+    match = _LOCALITY_LINE_RE.match(lines[-1].lower())
+    if not match:
+        return ', '.join(lines), '', '', ''
+    return ', '.join(lines[:-1]), match.group(1), match.group(2), match.group(3)
+
+
+def location_key(text):
+    """Canonical key for a free-text multi-line location"""
+    street, suburb, _, postcode = split_location(text)
+    return address_key(street, suburb, postcode)
@@ -0,0 +1,71 @@
+"""
+Bulk extraction of repeated cards (event listings, playgroup results) from a
+Selenium page in a single execute_script call.
+
+Looping over cards with find_element / .text / get_attribute costs one
+WebDriver HTTP round-trip per call; with hundreds of cards that is thousands of
+RPCs. extract_cards runs one JavaScript snippet that walks every card in the
+browser and returns all the requested fields as JSON.
+
+Field specs (relative to each card):
+    'h2 a'                           → trimmed visible text of the first match
+    ('h2 a', 'href')                 → attribute of the first match (href/src are absolute)
+    ('.series > div', {...fields})   → list of nested records, one per match
+An empty selector ('' or None) means the card element itself. Missing
+elements give None (or [] for nested lists).
+"""
+
+_EXTRACT_JS = """
+var cardSelector = arguments[0], spec = arguments[1];
+
+function extract(root, fields) {
+    var out = {};
+    fields.forEach(function (f) {
+        var name = f[0], selector = f[1], kind = f[2], arg = f[3];
+        if (kind === 'list') {
+            out[name] = Array.prototype.map.call(root.querySelectorAll(selector), function (el) {
+                return extract(el, arg);
+            });
+            return;
+        }
+        var el = selector ? root.querySelector(selector) : root;
+        if (!el) {
+            out[name] = null;
+        } else if (kind === 'text') {
+            out[name] = (el.innerText || el.textContent || '').trim();
+        } else if (arg === 'href' || arg === 'src') {
+            out[name] = el[arg] || el.getAttribute(arg);
+        } else {
+            out[name] = el.getAttribute(arg);
+        }
+    });
+    return out;
+}
+
+return Array.prototype.map.call(document.querySelectorAll(cardSelector), function (card) {
+    return extract(card, spec);
+});
+"""
+
+
+def _compile(fields):
+    """Turn a {name: spec} dict into the [name, selector, kind, arg] lists the script expects"""
+    compiled = []
+    for name, field in fields.items():
+        if isinstance(field, str) or field is None:
+            compiled.append([name, field or '', 'text', None])
+            continue
+        selector, what = field
+        if isinstance(what, dict):
+            compiled.append([name, selector or '', 'list', _compile(what)])
+        else:
+            compiled.append([name, selector or '', 'attr', what])
+    return compiled
+
+
+def extract_cards(driver, card_selector, fields):
+    """
+    Extract fields from every element matching card_selector (CSS) in one round-trip
+    Returns a list of dicts, one per card, in document order
+    """
+    return driver.execute_script(_EXTRACT_JS, card_selector, _compile(fields)) or []
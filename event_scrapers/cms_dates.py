@@ -0,0 +1,94 @@
+"""
+Parser for the council CMS multi-date markup shared by Lake Mac, MidCoast and
+Dungog event pages:
+
+    <div class="multi-date-list-container">
+      <ul class="future-events-list">
+        <li class="multi-date-item"
+            data-start-year="2025" data-start-month="3" data-start-day="14"
+            data-start-hour="10" data-start-mins="30"
+            data-end-year="2025" data-end-month="3" data-end-day="14"
+            data-end-hour="11" data-end-mins="30">...</li>
+
+Works on already-parsed BeautifulSoup markup (static HTML or a single
+driver.page_source), reading each <li>'s attributes once instead of one
+WebDriver get_attribute round-trip per field.
+"""
+
+from datetime import datetime
+from typing import List, NamedTuple, Optional
+
+FUTURE_DATE_ITEMS = 'ul.future-events-list li.multi-date-item'
+
+
+class DateOccurrence(NamedTuple):
+    start: datetime
+    end: Optional[datetime]   # None when the item has no end time
+    has_time: bool            # False when data-start-hour/mins were missing (start is midnight)
+    text: str                 # visible text of the <li>
+
+
+def _int(attrs, key):
+    try:
+        return int(attrs[key])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def parse_date_item(item) -> Optional[DateOccurrence]:
+    """
+    Parse one li.multi-date-item
+    Returns None if the start date is missing or invalid
+    """
+    attrs = item.attrs
+    year, month, day = _int(attrs, 'data-start-year'), _int(attrs, 'data-start-month'), _int(attrs, 'data-start-day')
+    if not (year and month and day):
+        return None
+
+    hour, mins = _int(attrs, 'data-start-hour'), _int(attrs, 'data-start-mins')
+    has_time = hour is not None and mins is not None
+
+    try:
+        start = datetime(year, month, day, hour or 0, mins or 0)
+    except ValueError:
+        return None
+
+    # End date defaults to the start date; an end is only known if its time is
+    end = None
+    end_hour, end_mins = _int(attrs, 'data-end-hour'), _int(attrs, 'data-end-mins')
+    if end_hour is not None and end_mins is not None:
+        try:
+            end = datetime(
+                _int(attrs, 'data-end-year') or year,
+                _int(attrs, 'data-end-month') or month,
+                _int(attrs, 'data-end-day') or day,
+                end_hour, end_mins,
+            )
+        except ValueError:
+            end = None
+
+    return DateOccurrence(start, end, has_time, item.get_text(strip=True))
+
+
+def parse_date_items(items) -> List[DateOccurrence]:
+    """Parse a sequence of li.multi-date-item elements, skipping unparseable ones"""
+    occurrences = []
+    for item in items:
+        occurrence = parse_date_item(item)
+        if occurrence:
+            occurrences.append(occurrence)
+    return occurrences
+
+
+def future_date_items(root):
+    """The li.multi-date-item elements of the future-events list under root (soup or element)"""
+    container = root.find('div', class_='multi-date-list-container')
+    if container is None:
+        # Some pages (e.g. MidCoast multi-location items) have the list without the container
+        container = root
+    return container.select(FUTURE_DATE_ITEMS)
+
+
+def future_occurrences(root) -> List[DateOccurrence]:
+    """All parseable future occurrences listed under root"""
+    return parse_date_items(future_date_items(root))
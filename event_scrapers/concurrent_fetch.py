@@ -0,0 +1,39 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from rate_limit import HostRateLimiter
+
+
+# Runs a fetch function over many URLs on a bounded thread pool, with a
+# token-bucket budget per host standing in for fixed sleeps between requests
+class ConcurrentFetcher:
+    def __init__(self, max_workers=4, requests_per_second=2.0, burst=1):
+        self.max_workers = max(1, max_workers)
+        self.limiter = HostRateLimiter(requests_per_second, burst)
+
+    # Per-source settings, overridable with <SOURCE>_MAX_WORKERS / <SOURCE>_REQUESTS_PER_SECOND
+    @classmethod
+    def for_source(cls, source, max_workers=4, requests_per_second=2.0, burst=1):
+        prefix = source.upper()
+        return cls(
+            max_workers=int(os.getenv(f'{prefix}_MAX_WORKERS', max_workers)),
+            requests_per_second=float(os.getenv(f'{prefix}_REQUESTS_PER_SECOND', requests_per_second)),
+            burst=burst,
+        )
+
+    # Call fetch(item) for every item, waiting for url_of(item)'s host budget first.
+    # Results come back in input order; an item whose fetch raises gives None
+    def map(self, fetch, items, url_of=lambda item: item):
+        def run(item):
+            url = url_of(item)
+            self.limiter.wait(url)
+            try:
+                return fetch(item)
+            except Exception as e:
+                print(f"✗ Error fetching {url}: {e}")
+                return None
+
+        items = list(items)
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            return list(executor.map(run, items))
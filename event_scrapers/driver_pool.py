@@ -0,0 +1,282 @@
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import threading
+import os
+
+DEFAULT_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+
+# URL patterns (DevTools Network.setBlockedURLs syntax) for each kind of resource
+# the scrapers never need
+RESOURCE_PATTERNS = {
+    'images': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico'],
+    'fonts': ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'],
+    'css': ['*.css'],
+    'media': ['*.mp4', '*.webm', '*.mp3', '*.m4a'],
+    'trackers': [
+        '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+        '*facebook.net*', '*connect.facebook.com*', '*hotjar.com*', '*clarity.ms*',
+        '*siteimproveanalytics*', '*youtube.com/embed*',
+    ],
+}
+
+# Blocking profiles chosen per lease
+#   full:  parse-only scrapers (BeautifulSoup on page_source)
+#   light: keeps CSS so is_displayed() / element_to_be_clickable still behave
+BLOCKING_PROFILES = {
+    'none': [],
+    'light': ['images', 'fonts', 'media', 'trackers'],
+    'full': ['images', 'fonts', 'css', 'media', 'trackers'],
+}
+
+# Force one profile for every lease (e.g. 'none' when debugging a scraper)
+BLOCKING_OVERRIDE = os.getenv('DRIVER_BLOCK_RESOURCES')
+
+
+def blocked_url_patterns(profile='none', allow=()):
+    """
+    URL patterns blocked by a profile
+    allow: resource kinds (e.g. 'css') or individual patterns to leave unblocked
+    """
+    profile = BLOCKING_OVERRIDE or profile
+    if profile not in BLOCKING_PROFILES:
+        raise ValueError(f"Unknown resource blocking profile: {profile}")
+
+    allow = set(allow)
+    patterns = []
+    for kind in BLOCKING_PROFILES[profile]:
+        if kind not in allow:
+            patterns.extend(p for p in RESOURCE_PATTERNS[kind] if p not in allow)
+    return patterns
+
+
+def build_chrome_options(headless=True, user_agent=None, window_size='1920,1080'):
+    """
+    Chrome options shared by every Selenium scraper (CI-safe headless setup)
+    user_agent: override Chrome's own user agent (None keeps it)
+    """
+    options = Options()
+    if headless:
+        options.add_argument('--headless=new')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument(f'--window-size={window_size}')
+    if user_agent:
+        options.add_argument(f'--user-agent={user_agent}')
+    return options
+
+
+class PooledChrome(webdriver.Chrome):
+    """Chrome driver that counts page loads so the pool knows when to recycle it"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.page_loads = 0
+        self.blocked_urls = []
+
+    def get(self, url):
+        self.page_loads += 1
+        return super().get(url)
+
+    def set_blocked_urls(self, patterns):
+        """Block matching requests via DevTools (skipped if unchanged since last lease)"""
+        patterns = list(patterns)
+        if patterns == self.blocked_urls:
+            return
+        self.execute_cdp_cmd('Network.enable', {})
+        self.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+        self.blocked_urls = patterns
+
+
+class DriverPool:
+    """
+    Pool of warm headless Chrome instances leased out to scrapers
+    Args:
+        size: maximum number of browsers alive at once
+        max_page_loads: recycle a browser after this many driver.get() calls
+        headless: run browsers without a GUI
+        user_agent: user agent sent by every browser in the pool (None: Chrome's own)
+        warm: start all browsers up front instead of on first lease
+        private: pool belongs to a single scraper and is closed with it
+    """
+
+    def __init__(self, size=2, max_page_loads=100, headless=True, user_agent=None,
+                 warm=False, private=False):
+        self.size = size
+        self.max_page_loads = max_page_loads
+        self.headless = headless
+        self.user_agent = user_agent
+        self.private = private
+
+        self._idle = []
+        self._created = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        if warm:
+            self._warm_up()
+
+    def _warm_up(self):
+        """Start every browser in parallel so startup cost is paid once"""
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            drivers = list(executor.map(lambda _: self._start_driver(), range(self.size)))
+        with self._cond:
+            self._idle.extend(drivers)
+            self._created += len(drivers)
+        print(f"✓ Started {len(drivers)} warm Chrome instance(s)")
+
+    def _start_driver(self):
+        options = build_chrome_options(headless=self.headless, user_agent=self.user_agent)
+        try:
+            return PooledChrome(options=options)
+        except Exception as e:
+            print(f"Error setting up Chrome driver: {e}")
+            print("\nMake sure you have Chrome and ChromeDriver installed.")
+            raise
+
+    def _quit_driver(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _is_alive(self, driver):
+        """A crashed browser or dead chromedriver fails even the cheapest command"""
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _replace_if_needed(self, driver):
+        """Recycle browsers that are worn out (too many page loads) or have crashed"""
+        worn_out = getattr(driver, 'page_loads', 0) >= self.max_page_loads
+        if not worn_out and self._is_alive(driver):
+            return driver
+
+        reason = 'recycling after page-load limit' if worn_out else 'restarting crashed browser'
+        print(f"  ↻ Chrome pool: {reason}")
+        self._quit_driver(driver)
+        return self._start_driver()
+
+    def acquire(self, block=True, timeout=None, blocking='none', allow=()):
+        """
+        Lease a healthy driver
+        blocking / allow: resource blocking profile for this lease (see BLOCKING_PROFILES)
+        Returns None if block=False (or timeout expires) and every browser is in use
+        """
+        patterns = blocked_url_patterns(blocking, allow)
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("DriverPool is closed")
+                if self._idle:
+                    driver = self._idle.pop()
+                    break
+                if self._created < self.size:
+                    self._created += 1
+                    driver = None
+                    break
+                if not block or not self._cond.wait(timeout):
+                    return None
+
+        try:
+            driver = self._start_driver() if driver is None else self._replace_if_needed(driver)
+        except Exception:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise
+
+        try:
+            driver.set_blocked_urls(patterns)
+        except Exception as e:
+            # Blocking is an optimisation only - never fail a lease over it
+            print(f"  ⚠ Chrome pool: could not apply resource blocking: {e}")
+        return driver
+
+    def release(self, driver, broken=False):
+        """Return a leased driver; broken or crashed drivers are discarded"""
+        if driver is None:
+            return
+
+        if not broken:
+            try:
+                # Undo per-scraper settings so the next lease starts clean
+                driver.implicitly_wait(0)
+                driver.delete_all_cookies()
+            except Exception:
+                broken = True
+
+        with self._cond:
+            if broken or self._closed:
+                self._created -= 1
+                discard = True
+            else:
+                self._idle.append(driver)
+                discard = False
+            self._cond.notify()
+
+        if discard:
+            self._quit_driver(driver)
+
+    @contextmanager
+    def lease(self, blocking='none', allow=()):
+        """with pool.lease() as driver: ..."""
+        driver = self.acquire(blocking=blocking, allow=allow)
+        broken = False
+        try:
+            yield driver
+        except Exception:
+            broken = not self._is_alive(driver)
+            raise
+        finally:
+            self.release(driver, broken=broken)
+
+    def close(self):
+        """Quit every idle browser; drivers still leased are quit when released"""
+        with self._cond:
+            self._closed = True
+            drivers, self._idle = self._idle, []
+            self._created -= len(drivers)
+            self._cond.notify_all()
+        for driver in drivers:
+            self._quit_driver(driver)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def acquire_driver(driver_pool=None, headless=True, user_agent=None, pool_size=1,
+                   blocking='none', allow=()):
+    """
+    Lease a driver for a scraper
+    Uses the shared driver_pool when one is given (batch runs), otherwise starts a
+    private pool (one browser unless the scraper asks for more parallel workers)
+    headless / user_agent / pool_size only apply to a private pool; a shared pool's
+    browsers keep the settings it was created with (a warning is printed if they differ)
+    blocking / allow: resource blocking profile for this lease (see BLOCKING_PROFILES)
+    Returns (pool, driver)
+    """
+    if driver_pool is not None and (driver_pool.headless, driver_pool.user_agent) != (headless, user_agent):
+        print(f"⚠ Shared driver pool ignores headless={headless} / user agent '{user_agent}' "
+              f"(pool: headless={driver_pool.headless}, '{driver_pool.user_agent}')")
+    pool = driver_pool or DriverPool(size=pool_size, headless=headless, user_agent=user_agent, private=True)
+    return pool, pool.acquire(blocking=blocking, allow=allow)
+
+
+def release_driver(pool, driver):
+    """Give a driver back to its pool, shutting down private pools"""
+    if pool is None:
+        return
+    pool.release(driver)
+    if pool.private:
+        pool.close()
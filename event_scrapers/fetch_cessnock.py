@@ -1,7 +1,14 @@
 import requests
 import json
 import os
-from datetime import datetime
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
+from rate_limit import TokenBucket
+from keyword_matcher import FAMILY_KEYWORDS, KeywordMatcher
 
 # Venue mapping with coordinates
 VENUE_COORDINATES = {
@@ -99,35 +106,6 @@ VENUE_COORDINATES = {
     }
 }
 
-# Family-friendly event keywords (case insensitive)
-FAMILY_KEYWORDS = [
-    'family',
-    'toddler',
-    'babies',
-    'baby',
-    'bubs',
-    'bubba',
-    'mummabubba',
-    'kids',
-    'teen',
-    'art starter',
-    'art play',
-    'art explorers',
-    'storytime',
-    'rhymetime',
-    'dungeons',
-    'lego',
-    'code',
-    'stem',
-    'steam',
-    'children',
-    'school holiday',
-    'playgroup',
-    'rock',
-    'rhyme',
-    'story stomp'
-]
-
 # All organizer IDs to fetch events from
 ORGANIZER_IDS = [
     "17689152323",   # Cessnock City Library
@@ -147,15 +125,88 @@ ORGANIZER_IDS = [
     "74588539343"    # Newcastle Birth Movement
 ]
 
+# Eventbrite allows 2,000 calls per hour per token; organizers are fetched
+# in parallel but every page request draws from one shared bucket
+RATE_LIMIT_PER_HOUR = 2000
+RATE_LIMIT_BURST = 50
+MAX_CONCURRENT_ORGANIZERS = 4
+
+# Responses worth retrying with backoff (rate limited or transient server errors)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
 # Initialize Eventbrite API client
 class EventbriteAPI:
-    def __init__(self, api_token):
+    def __init__(self, api_token, pool_size=MAX_CONCURRENT_ORGANIZERS, max_retries=4,
+                 backoff_base=1.0, backoff_max=60.0, timeout=30):
         self.api_token = api_token
         self.base_url = "https://www.eventbriteapi.com/v3"
         self.headers = {
             'Authorization': f'Bearer {api_token}',
             'Content-Type': 'application/json'
         }
+        self.rate_limiter = TokenBucket(RATE_LIMIT_PER_HOUR / 3600, capacity=RATE_LIMIT_BURST)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+
+        # One keep-alive session shared by all worker threads; pool sized to the worker count
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+
+    # Rate-limited GET against the Eventbrite API, retrying 429/5xx and connection errors
+    def _get(self, url, params):
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(self._backoff_delay(attempt))
+                continue
+
+            if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                return response
+
+            delay = self._retry_after(response)
+            if delay is None:
+                delay = self._backoff_delay(attempt)
+            print(f"  ⚠ HTTP {response.status_code} from Eventbrite, retrying in {delay:.1f}s "
+                  f"({attempt + 1}/{self.max_retries})")
+            time.sleep(delay)
+
+    # Exponential backoff with full jitter
+    def _backoff_delay(self, attempt):
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    # Seconds to wait from a Retry-After header (delta-seconds or HTTP date), if present
+    def _retry_after(self, response):
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return min(self.backoff_max, max(0.0, float(value)))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return min(self.backoff_max, max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds()))
+        except (TypeError, ValueError):
+            return None
+
+    def close(self):
+        self.session.close()
+
+    # Get events for several organizers concurrently; results keep the order of organizer_ids
+    def get_organizers_events(self, organizer_ids, max_workers=MAX_CONCURRENT_ORGANIZERS, **kwargs):
+        if max_workers <= 1:
+            return [self.get_organizer_events(organizer_id, **kwargs) for organizer_id in organizer_ids]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda organizer_id: self.get_organizer_events(organizer_id, **kwargs), organizer_ids))
 
     # Get all events for a specific organizer
     def get_organizer_events(self, organizer_id, status='all', order_by='start_asc', filter_keywords=None):
@@ -167,7 +218,7 @@ class EventbriteAPI:
         try:
             while True:
                 params['page'] = page
-                response = requests.get(url, headers=self.headers, params=params)
+                response = self._get(url, params)
                 response.raise_for_status()
                 
                 data = response.json()
@@ -205,14 +256,14 @@ class EventbriteAPI:
     
     # Filter raw events by keywords BEFORE parsing
     def _filter_by_keywords(self, raw_events, keywords):
+        matcher = keywords if isinstance(keywords, KeywordMatcher) else KeywordMatcher(keywords)
         filtered = []
         for event in raw_events:
-            name = event.get('name', {}).get('text', '')
-            description = event.get('description', {}).get('text', '')
-            search_text = (name + " " + description).lower()
+            name = (event.get('name') or {}).get('text') or ''
+            description = (event.get('description') or {}).get('text') or ''
             
-            # Check if any keyword matches
-            if any(keyword.lower() in search_text for keyword in keywords):
+            # Single compiled scan per field
+            if matcher.matches(name) or matcher.matches(description):
                 filtered.append(event)
         
         return filtered
@@ -300,9 +351,9 @@ def main():
     
     # Get live events from all organizers with keyword filtering
     print(f"Fetching events from {len(ORGANIZER_IDS)} organizers...")
-    for organizer_id in ORGANIZER_IDS:
-        print(f"Fetching events for organizer {organizer_id}...")
-        events = api.get_organizer_events(organizer_id, status='live', filter_keywords=FAMILY_KEYWORDS)
+    results = api.get_organizers_events(ORGANIZER_IDS, status='live', filter_keywords=FAMILY_KEYWORDS)
+    for organizer_id, events in zip(ORGANIZER_IDS, results):
+        print(f"Fetched events for organizer {organizer_id}...")
         all_events.extend(events)
         print(f"  Found {len(events)} family-friendly events")
     
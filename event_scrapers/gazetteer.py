@@ -0,0 +1,224 @@
+"""
+Offline address gazetteer: street address → (lat, lng) from a local SQLite
+index, so bulk geocoding doesn't need one rate-limited Nominatim call per
+address.
+
+The index is built once from a downloadable address extract (OpenAddresses,
+a flattened G-NAF export, or OSM addr:* points exported to CSV) and keyed on
+canonical street + suburb + postcode (see address_normaliser). Nominatim is
+only needed for the addresses the extract doesn't cover.
+
+Build (plain or .gz CSV; column names are detected, see COLUMN_ALIASES):
+    python gazetteer.py build au-addresses.csv.gz --states QLD NSW
+
+Look up:
+    gazetteer = Gazetteer.open()          # None if no index has been built
+    gazetteer.lookup('Shop 3, 45 Main Rd', 'Springwood', '4127')
+
+Environment variables:
+    GAZETTEER_DB — index location (default <state dir>/gazetteer.sqlite)
+"""
+
+import argparse
+import csv
+import gzip
+import os
+import sqlite3
+import sys
+import time
+from address_normaliser import canonical_place, canonical_street
+from state_paths import STATE_DIR
+
+DEFAULT_DB_PATH = os.getenv('GAZETTEER_DB', os.path.join(STATE_DIR, 'gazetteer.sqlite'))
+
+# Source column names accepted for each field (matched case-insensitively)
+COLUMN_ALIASES = {
+    'number':      ['number', 'number_first', 'housenumber', 'addr:housenumber', 'house_number'],
+    'street':      ['street', 'street_address', 'addr:street'],
+    'street_name': ['street_name'],
+    'street_type': ['street_type', 'street_type_code', 'street_type_name'],
+    'suburb':      ['locality_name', 'suburb', 'locality', 'city', 'addr:suburb', 'addr:city'],
+    'postcode':    ['postcode', 'addr:postcode', 'post_code'],
+    'state':       ['state', 'state_abbreviation', 'region', 'addr:state'],
+    'latitude':    ['latitude', 'lat', 'y'],
+    'longitude':   ['longitude', 'lon', 'lng', 'x'],
+}
+
+
+class Gazetteer:
+    """
+    Read-only lookups against a built gazetteer index
+    Args:
+        path: SQLite index built by build_index
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        self.db = sqlite3.connect(f'file:{path}?mode=ro', uri=True, check_same_thread=False)
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def open(cls, path=DEFAULT_DB_PATH):
+        """The gazetteer at path, or None if it hasn't been built"""
+        if not os.path.exists(path):
+            return None
+        try:
+            gazetteer = cls(path)
+            count = gazetteer.db.execute('SELECT COUNT(*) FROM addresses').fetchone()[0]
+        except sqlite3.Error as e:
+            print(f"⚠ Could not open gazetteer {path} ({e}); geocoding online only")
+            return None
+        print(f"✓ Gazetteer loaded: {count:,} addresses")
+        return gazetteer
+
+    def lookup(self, address, suburb, postcode=''):
+        """(lat, lng) for the address, or None if it isn't in the index"""
+        street = canonical_street(address)
+        suburb = canonical_place(suburb)
+        if not street or not suburb:
+            self.misses += 1
+            return None
+
+        row = self.db.execute(
+            'SELECT latitude, longitude FROM addresses WHERE street = ? AND suburb = ? AND postcode = ?',
+            (street, suburb, canonical_place(postcode)),
+        ).fetchone()
+        if row is None:
+            # Postcodes in source data are sometimes stale; the suburb is enough
+            row = self.db.execute(
+                'SELECT latitude, longitude FROM addresses WHERE street = ? AND suburb = ? LIMIT 1',
+                (street, suburb),
+            ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0], row[1]
+
+    def close(self):
+        self.db.close()
+
+
+def _resolve_columns(fieldnames):
+    lowered = {name.strip().lower(): name for name in fieldnames}
+    columns = {}
+    for field, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in lowered:
+                columns[field] = lowered[alias]
+                break
+    return columns
+
+
+def _open_text(path):
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8-sig', newline='')
+    return open(path, encoding='utf-8-sig', newline='')
+
+
+def build_index(csv_path, db_path=DEFAULT_DB_PATH, states=None, batch_size=50000):
+    """
+    Build the gazetteer index from an address CSV, replacing any existing one
+    states: keep only rows whose state column is one of these (e.g. ['QLD', 'NSW'])
+    Returns the number of addresses indexed
+    """
+    started = time.time()
+    states = {s.upper() for s in states} if states else None
+    tmp_path = f"{db_path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+    db = sqlite3.connect(tmp_path)
+    db.execute('PRAGMA journal_mode = OFF')
+    db.execute('PRAGMA synchronous = OFF')
+    db.execute('''
+        CREATE TABLE addresses (
+            street    TEXT NOT NULL,
+            suburb    TEXT NOT NULL,
+            postcode  TEXT NOT NULL,
+            state     TEXT,
+            latitude  REAL NOT NULL,
+            longitude REAL NOT NULL,
+            PRIMARY KEY (street, suburb, postcode)
+        ) WITHOUT ROWID
+    ''')
+
+    read = 0
+    with _open_text(csv_path) as f:
+        reader = csv.DictReader(f)
+        columns = _resolve_columns(reader.fieldnames or [])
+        missing = [field for field in ('number', 'suburb', 'latitude', 'longitude') if field not in columns]
+        if 'street' not in columns and 'street_name' not in columns:
+            missing.append('street')
+        if missing:
+            raise ValueError(f"{csv_path}: no column for {', '.join(missing)} (have {reader.fieldnames})")
+        if states and 'state' not in columns:
+            print(f"⚠ No state column in {csv_path}; --states ignored")
+            states = None
+
+        def column(row, field):
+            name = columns.get(field)
+            return (row.get(name) or '').strip() if name else ''
+
+        batch = []
+        for row in reader:
+            read += 1
+            state = column(row, 'state').upper()
+            if states and state not in states:
+                continue
+            street = column(row, 'street') or f"{column(row, 'street_name')} {column(row, 'street_type')}"
+            key = canonical_street(f"{column(row, 'number')} {street}")
+            suburb = canonical_place(column(row, 'suburb'))
+            try:
+                lat, lng = float(column(row, 'latitude')), float(column(row, 'longitude'))
+            except ValueError:
+                continue
+            if not key or not suburb:
+                continue
+
+            batch.append((key, suburb, canonical_place(column(row, 'postcode')), state or None, lat, lng))
+            if len(batch) >= batch_size:
+                db.executemany('INSERT OR IGNORE INTO addresses VALUES (?, ?, ?, ?, ?, ?)', batch)
+                batch = []
+                print(f"  {read:,} rows read...")
+        db.executemany('INSERT OR IGNORE INTO addresses VALUES (?, ?, ?, ?, ?, ?)', batch)
+
+    db.commit()
+    count = db.execute('SELECT COUNT(*) FROM addresses').fetchone()[0]
+    db.close()
+    os.replace(tmp_path, db_path)
+    print(f"✓ Indexed {count:,} addresses from {read:,} rows in {time.time() - started:.0f}s → {db_path}")
+    return count
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='Build or query the offline address gazetteer')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help='index an address CSV (.csv or .csv.gz)')
+    build.add_argument('csv_path')
+    build.add_argument('--db', default=DEFAULT_DB_PATH)
+    build.add_argument('--states', nargs='*', help='keep only these states, e.g. QLD NSW')
+
+    query = commands.add_parser('lookup', help='look up one address')
+    query.add_argument('address')
+    query.add_argument('suburb')
+    query.add_argument('postcode', nargs='?', default='')
+    query.add_argument('--db', default=DEFAULT_DB_PATH)
+
+    args = parser.parse_args(argv)
+    if args.command == 'build':
+        build_index(args.csv_path, args.db, args.states)
+        return True
+
+    gazetteer = Gazetteer.open(args.db)
+    result = gazetteer.lookup(args.address, args.suburb, args.postcode) if gazetteer else None
+    print(result if result else '✗ Not found')
+    return result is not None
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main(sys.argv[1:]) else 1)
@@ -0,0 +1,177 @@
+"""
+Persistent geocode store shared by every scraper that geocodes addresses.
+
+Results are kept in a local SQLite file under the scraper state directory
+(persisted by the CI cache), keyed on the canonical address key from
+address_normaliser, so an address geocoded by one source is a hit for all of
+them. "No match" answers are cached too, and retried once they are older than
+the negative TTL. A "no match" only means the recording source's own queries
+failed, so it is honoured only for lookups from that same source; others treat
+it as a miss and try their own (e.g. suburb-level) fallbacks. Transient errors
+are never stored.
+
+sync_from_supabase merges the Supabase geocode_cache table into the store.
+Callers run it on every start: the local file only reaches the next CI run
+when a job succeeds, while geocodes flushed to Supabase by an interrupted run
+are already there. The store doesn't talk to Supabase otherwise.
+
+    store = GeocodeStore()
+    known = store.lookup_many(keys, source='nominatim')   # key → (lat, lng) / (None, None) for own negatives
+    store.put(key, lat, lng, source='nominatim')
+    store.report()
+
+Environment variables:
+    GEOCODE_STORE_PATH         — store location (default <state dir>/geocodes.sqlite)
+    GEOCODE_NEGATIVE_TTL_DAYS  — how long a "no match" answer is trusted (default 30)
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from address_normaliser import rekey
+from state_paths import STATE_DIR
+
+DEFAULT_STORE_PATH = os.getenv('GEOCODE_STORE_PATH', os.path.join(STATE_DIR, 'geocodes.sqlite'))
+NEGATIVE_TTL_DAYS = float(os.getenv('GEOCODE_NEGATIVE_TTL_DAYS', '30'))
+
+_LOOKUP_CHUNK = 500   # keys per IN (...) query, below SQLite's parameter limit
+
+
+class GeocodeStore:
+    """
+    address key → (lat, lng) with negative caching
+    Args:
+        path: SQLite file (created if missing)
+        negative_ttl_days: age after which a cached "no match" is ignored
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH, negative_ttl_days=NEGATIVE_TTL_DAYS):
+        self.path = path
+        self.negative_ttl = negative_ttl_days * 86400
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute('''
+            CREATE TABLE IF NOT EXISTS geocodes (
+                address_key TEXT PRIMARY KEY,
+                latitude    REAL,
+                longitude   REAL,
+                source      TEXT,
+                updated_at  REAL NOT NULL
+            ) WITHOUT ROWID
+        ''')
+        self.db.execute('CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)')
+        self.db.commit()
+
+    def __len__(self):
+        with self.lock:
+            return self.db.execute('SELECT COUNT(*) FROM geocodes').fetchone()[0]
+
+    def _usable(self, latitude, entry_source, updated_at, source, now):
+        if latitude is not None:
+            return True
+        return entry_source == source and now - updated_at < self.negative_ttl
+
+    def lookup(self, key, source=None):
+        """
+        (lat, lng) if known, (None, None) for a fresh negative recorded by source,
+        None if it needs geocoding
+        """
+        return self.lookup_many([key], source).get(key)
+
+    def lookup_many(self, keys, source=None):
+        """
+        Batch lookup: dict of key → (lat, lng) / (None, None) for the keys the store can answer
+        Negatives are only returned when they were recorded by source
+        """
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        now = time.time()
+        with self.lock:
+            for i in range(0, len(keys), _LOOKUP_CHUNK):
+                chunk = keys[i:i + _LOOKUP_CHUNK]
+                rows = self.db.execute(
+                    f"SELECT address_key, latitude, longitude, source, updated_at FROM geocodes "
+                    f"WHERE address_key IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                )
+                for key, lat, lng, entry_source, updated_at in rows:
+                    if self._usable(lat, entry_source, updated_at, source, now):
+                        found[key] = (lat, lng)
+
+            for key in keys:
+                result = found.get(key)
+                if result is None:
+                    self.misses += 1
+                elif result[0] is None:
+                    self.negative_hits += 1
+                else:
+                    self.hits += 1
+        return found
+
+    def put(self, key, latitude, longitude, source=''):
+        """Store a result; latitude None records a "no match" (retried after the TTL)"""
+        self.put_many([(key, latitude, longitude)], source)
+
+    def put_many(self, entries, source='', updated_at=None):
+        """Store (key, lat, lng) tuples in one transaction"""
+        updated_at = updated_at or time.time()
+        rows = [(key, lat, lng, source, updated_at) for key, lat, lng in entries]
+        with self.lock:
+            self.db.executemany('INSERT OR REPLACE INTO geocodes VALUES (?, ?, ?, ?, ?)', rows)
+            self.db.commit()
+            self.writes += len(rows)
+
+    def sync_from_supabase(self, supabase, table='geocode_cache', page_size=1000):
+        """
+        Copy every positive geocode from a Supabase table (address_key, latitude,
+        longitude) into the store, re-keying legacy keys. Local positives win;
+        local "no match" entries are replaced
+        Returns the number of rows read
+        """
+        read = 0
+        offset = 0
+        while True:
+            rows = (
+                supabase.table(table)
+                .select('address_key, latitude, longitude')
+                .range(offset, offset + page_size - 1)
+                .execute()
+            ).data
+            entries = [(rekey(r['address_key']), r['latitude'], r['longitude'])
+                       for r in rows if r.get('latitude') is not None]
+            with self.lock:
+                self.db.executemany(
+                    'INSERT INTO geocodes VALUES (?, ?, ?, ?, ?) '
+                    'ON CONFLICT (address_key) DO UPDATE SET latitude = excluded.latitude, '
+                    'longitude = excluded.longitude, source = excluded.source, updated_at = excluded.updated_at '
+                    'WHERE geocodes.latitude IS NULL',
+                    [(key, lat, lng, 'supabase', time.time()) for key, lat, lng in entries],
+                )
+                self.db.commit()
+            read += len(rows)
+            if len(rows) < page_size:
+                break
+            offset += page_size
+
+        with self.lock:
+            self.db.execute("INSERT OR REPLACE INTO meta VALUES ('supabase_synced_at', ?)", (str(time.time()),))
+            self.db.commit()
+        print(f"  Synced {read} entries from Supabase {table} into {self.path}")
+        return read
+
+    def report(self):
+        total = self.hits + self.negative_hits + self.misses
+        rate = f" ({self.hits / total:.0%} hit rate)" if total else ""
+        print(f"Geocode store: {self.hits} hits, {self.negative_hits} cached no-match, "
+              f"{self.misses} misses{rate}, {self.writes} written")
+
+    def close(self):
+        with self.lock:
+            self.db.close()
@@ -0,0 +1,31 @@
+"""
+Shared BeautifulSoup construction for the scrapers.
+
+Uses the lxml backend (C, several times faster than the pure-Python
+html.parser) when it is installed, and lets callers pass a SoupStrainer so only
+the subtree they actually read is built, e.g.
+
+    soup = make_soup(response.content, only=strainer('div', id='content_container_125662'))
+    content_div = soup.find('div', id='content_container_125662')
+
+Elements matched by the strainer keep their full subtree, so code that finds
+the container and walks into it works unchanged.
+"""
+
+from importlib.util import find_spec
+from bs4 import BeautifulSoup, SoupStrainer
+
+PARSER = 'lxml' if find_spec('lxml') else 'html.parser'
+
+
+def strainer(name=None, **attrs):
+    """SoupStrainer for the elements to keep (same arguments as soup.find)"""
+    return SoupStrainer(name, **attrs)
+
+
+def make_soup(markup, only=None):
+    """
+    Parse markup (bytes or str) with the fastest available parser
+    only: SoupStrainer restricting the tree to matching elements and their children
+    """
+    return BeautifulSoup(markup, PARSER, parse_only=only)
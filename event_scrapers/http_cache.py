@@ -0,0 +1,195 @@
+"""
+On-disk conditional-GET cache for the plain-HTTP scrapers.
+
+Bodies are stored as files next to a small SQLite index holding each URL's
+ETag / Last-Modified validators. The next run sends If-None-Match /
+If-Modified-Since; on 304 Not Modified the cached body is replayed as a normal
+200 response, so callers keep using response.content / .json() unchanged.
+The cache is capped in size and evicts least-recently-used entries.
+
+Lives under the scraper state directory so CI can persist it with
+actions/cache between runs.
+
+Environment variables:
+    HTTP_CACHE_DIR     — cache location (default <state dir>/http_cache)
+    HTTP_CACHE_MAX_MB  — size cap for cached bodies (default 50)
+    HTTP_CACHE         — set to 0 to bypass the cache entirely
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import requests
+from requests.structures import CaseInsensitiveDict
+from state_paths import STATE_DIR
+
+DEFAULT_CACHE_DIR = os.getenv('HTTP_CACHE_DIR', os.path.join(STATE_DIR, 'http_cache'))
+DEFAULT_MAX_BYTES = int(float(os.getenv('HTTP_CACHE_MAX_MB', '50')) * 1024 * 1024)
+CACHE_ENABLED = os.getenv('HTTP_CACHE', '1') != '0'
+
+# Response headers replayed with a cached body
+_KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+
+class HttpCache:
+    """
+    requests wrapper that revalidates cached pages instead of re-downloading them
+    Args:
+        session: requests.Session to send requests with (a new one if omitted)
+        headers: default headers added to the session
+        cache_dir: where the index and bodies are stored
+        max_bytes: total body size kept before LRU eviction
+        enabled: False sends plain GETs and never touches the disk
+    """
+
+    def __init__(self, session=None, headers=None, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES,
+                 enabled=CACHE_ENABLED):
+        self.session = session or requests.Session()
+        if headers:
+            self.session.headers.update(headers)
+        self.cache_dir = cache_dir
+        self.body_dir = os.path.join(cache_dir, 'bodies')
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.db = None
+
+        if enabled:
+            os.makedirs(self.body_dir, exist_ok=True)
+            self.db = sqlite3.connect(os.path.join(cache_dir, 'index.sqlite'), check_same_thread=False)
+            self.db.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    headers TEXT,
+                    size INTEGER NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+            self.db.commit()
+
+    def _body_path(self, url):
+        return os.path.join(self.body_dir, hashlib.sha256(url.encode('utf-8')).hexdigest())
+
+    def _lookup(self, url):
+        with self.lock:
+            return self.db.execute(
+                "SELECT etag, last_modified, headers FROM entries WHERE url = ?", (url,)
+            ).fetchone()
+
+    def _replay(self, url, headers_blob, response):
+        """Build a 200 response from the cached body (None if the body file is gone)"""
+        try:
+            with open(self._body_path(url), 'rb') as f:
+                body = f.read()
+        except OSError:
+            return None
+
+        cached = requests.Response()
+        cached.status_code = 200
+        cached.url = url
+        cached.request = response.request
+        cached.headers = CaseInsensitiveDict(
+            line.split(': ', 1) for line in (headers_blob or '').splitlines() if ': ' in line
+        )
+        cached._content = body
+        cached.encoding = requests.utils.get_encoding_from_headers(cached.headers)
+        cached.from_cache = True
+
+        with self.lock:
+            self.db.execute("UPDATE entries SET last_used = ? WHERE url = ?", (time.time(), url))
+            self.db.commit()
+        return cached
+
+    def _store(self, url, response):
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            # Nothing to revalidate with next time
+            return
+
+        body = response.content
+        tmp_path = self._body_path(url) + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(body)
+        os.replace(tmp_path, self._body_path(url))
+
+        headers_blob = '\n'.join(f"{k}: {response.headers[k]}" for k in _KEPT_HEADERS if k in response.headers)
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO entries (url, etag, last_modified, headers, size, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, headers_blob, len(body), time.time()),
+            )
+            self.db.commit()
+        self._evict()
+
+    def _evict(self):
+        """Drop least-recently-used entries until the cache fits in max_bytes"""
+        with self.lock:
+            total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            victims = []
+            for url, size in self.db.execute("SELECT url, size FROM entries ORDER BY last_used"):
+                if total <= self.max_bytes:
+                    break
+                victims.append(url)
+                total -= size
+            self.db.executemany("DELETE FROM entries WHERE url = ?", [(url,) for url in victims])
+            self.db.commit()
+
+        for url in victims:
+            try:
+                os.remove(self._body_path(url))
+            except OSError:
+                pass
+
+    def get(self, url, headers=None, **kwargs):
+        """
+        GET url, revalidating against the cached copy when there is one
+        Returns a requests.Response; replayed responses have from_cache = True
+        """
+        if not self.enabled:
+            return self.session.get(url, headers=headers, **kwargs)
+
+        request_headers = dict(headers or {})
+        entry = self._lookup(url)
+        if entry:
+            etag, last_modified, _ = entry
+            if etag:
+                request_headers['If-None-Match'] = etag
+            if last_modified:
+                request_headers['If-Modified-Since'] = last_modified
+
+        response = self.session.get(url, headers=request_headers, **kwargs)
+
+        if response.status_code == 304 and entry:
+            cached = self._replay(url, entry[2], response)
+            if cached is not None:
+                self.hits += 1
+                return cached
+            # Index entry without a body: fetch unconditionally
+            response = self.session.get(url, headers=headers, **kwargs)
+
+        self.misses += 1
+        response.from_cache = False
+        if response.status_code == 200:
+            self._store(url, response)
+        return response
+
+    def report(self):
+        """One-line summary for the scraper logs"""
+        if self.enabled:
+            print(f"HTTP cache: {self.hits} not modified (replayed), {self.misses} downloaded")
+
+    def close(self):
+        self.session.close()
+        if self.db is not None:
+            self.db.close()
+            self.db = None
@@ -1,7 +1,8 @@
 """
 import_childcare_qld.py
 ──────────────────────────────────────────────────────────────────────────────
-Downloads the ACECQA Queensland services CSV, geocodes new addresses via
+Downloads the ACECQA Queensland services CSV, geocodes new addresses from
+the offline gazetteer (gazetteer.py) where one has been built, falling back to
 Nominatim (using a Supabase-persisted cache so only NEW addresses hit the
 API), computes NQS scores, then truncates and reloads childcare_queensland.
 
@@ -9,20 +10,32 @@ Environment variables required:
     SUPABASE_URL   — your Supabase project URL
     SUPABASE_KEY   — your Supabase service role or anon key
 
+New geocodes are flushed to geocode_cache every GEOCODE_FLUSH_EVERY lookups
+or GEOCODE_FLUSH_SECONDS, and journalled to a local checkpoint file until they
+are, so an interrupted run keeps its (slow, rate-limited) progress and the
+next run resumes from it.
+
 Tables used:
     childcare_queensland  — main data table (truncated + reloaded each run)
-    geocode_cache         — persisted address → lat/lng lookup (append-only)
+    geocode_cache         — persisted address → lat/lng lookup (append-only),
+                            mirrored into the local geocode store (geocode_store.py)
 ──────────────────────────────────────────────────────────────────────────────
 """
 
 import csv
 import io
+import json
 import os
 import time
 import urllib.request
 import urllib.parse
 from datetime import datetime
 from supabase import create_client, Client
+from address_normaliser import address_key, canonical_place, rekey
+from gazetteer import Gazetteer
+from geocode_store import GeocodeStore
+from suburb_centroids import SuburbCentroids
+from state_paths import state_path
 
 # ── Config ────────────────────────────────────────────────────────────────────
 
@@ -35,6 +48,14 @@ NOMINATIM_URL   = 'https://nominatim.openstreetmap.org/search'
 NOMINATIM_AGENT = 'PlaygroundFinderMap/1.0 (contact@yoursite.com.au)'
 GEOCODE_DELAY   = 1.1   # seconds between Nominatim requests (rate limit: 1/s)
 
+GEOCODE_FLUSH_EVERY   = int(os.getenv('GEOCODE_FLUSH_EVERY', '50'))      # new geocodes per cache flush
+GEOCODE_FLUSH_SECONDS = float(os.getenv('GEOCODE_FLUSH_SECONDS', '300'))  # ...or this long since the last one
+GEOCODE_CHECKPOINT    = 'childcare_qld_geocodes.jsonl'  # local journal of unflushed geocodes
+
+# Suburb-level fallbacks are answered from this table (suburb_centroids.py)
+# before Nominatim; empty if it hasn't been built
+SUBURB_CENTROIDS = SuburbCentroids.load()
+
 BATCH_SIZE      = 200   # rows per Supabase insert batch
 TABLE_CHILDCARE = 'childcare_queensland'
 TABLE_GEOCACHE  = 'geocode_cache'
@@ -98,54 +119,53 @@ COL_MAP = {
 # ── Geocoding ─────────────────────────────────────────────────────────────────
 
 def make_address_key(row: dict) -> str:
-    addr    = (row.get('ServiceAddress') or '').strip().lower()
-    suburb  = (row.get('Suburb')         or '').strip().lower()
-    postcode = (row.get('Postcode')      or '').strip()
-    return f"{addr}|{suburb}|{postcode}"
+    """Canonical key, so 'Shop 3, 45 Main Rd' and '45 Main Road' share one cache entry."""
+    return address_key(row.get('ServiceAddress'), row.get('Suburb'), row.get('Postcode'))
+
+def nominatim_search(query: str) -> tuple:
+    """One rate-limited Nominatim query. Returns (lat, lng), (None, None) if nothing matched, or None on error."""
+    params  = urllib.parse.urlencode({'q': query, 'format': 'json', 'limit': '1', 'countrycodes': 'au'})
+    url     = f"{NOMINATIM_URL}?{params}"
+    req     = urllib.request.Request(url, headers={'User-Agent': NOMINATIM_AGENT})
+    try:
+        time.sleep(GEOCODE_DELAY)
+        with urllib.request.urlopen(req, timeout=10) as resp:
+            results = json.loads(resp.read().decode())
+            if results:
+                return float(results[0]['lat']), float(results[0]['lon'])
+        return None, None
+    except Exception as e:
+        print(f"  ⚠ Nominatim error for '{query}': {e}")
+        return None
+
+_SUBURB_FALLBACKS = {}   # (suburb, state, postcode) → (lat, lng) / (None, None), for this run
+
+def suburb_fallback(suburb: str, state: str, postcode: str) -> tuple:
+    """Suburb-level position from the local centroid table, else Nominatim.
+    Answers are memoised per run; errors (None) are not, so the suburb is retried."""
+    key = (suburb, state, postcode)
+    if key in _SUBURB_FALLBACKS:
+        return _SUBURB_FALLBACKS[key]
+    coords = SUBURB_CENTROIDS.lookup(suburb, postcode, state)
+    if coords is None:
+        coords = nominatim_search(f"{suburb} {state} {postcode}, Australia")
+    if coords is not None:
+        _SUBURB_FALLBACKS[key] = coords
+    return coords
 
 def geocode_address(address: str, suburb: str, state: str, postcode: str) -> tuple:
-    """Call Nominatim, try full address then suburb fallback. Returns (lat, lng) or (None, None)."""
-    for query in [
-        f"{address}, {suburb} {state} {postcode}, Australia",
-        f"{suburb} {state} {postcode}, Australia",
-    ]:
-        params  = urllib.parse.urlencode({'q': query, 'format': 'json', 'limit': '1', 'countrycodes': 'au'})
-        url     = f"{NOMINATIM_URL}?{params}"
-        req     = urllib.request.Request(url, headers={'User-Agent': NOMINATIM_AGENT})
-        try:
-            time.sleep(GEOCODE_DELAY)
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                import json
-                results = json.loads(resp.read().decode())
-                if results:
-                    return float(results[0]['lat']), float(results[0]['lon'])
-        except Exception as e:
-            print(f"  ⚠ Nominatim error for '{query}': {e}")
-    return None, None
+    """Call Nominatim for the full address, then fall back to the suburb.
+    Returns (lat, lng), (None, None) if nothing matched, or None if an error left it unknown."""
+    full = nominatim_search(f"{address}, {suburb} {state} {postcode}, Australia")
+    if full is not None and full[0] is not None:
+        return full
+    fallback = suburb_fallback(canonical_place(suburb).title(), state.strip().upper(), postcode.strip())
+    if fallback is None or (fallback[0] is None and full is None):
+        return None
+    return fallback
 
 # ── Supabase helpers ──────────────────────────────────────────────────────────
 
-def load_geocode_cache(supabase: Client) -> dict:
-    """Load all cached geocodes into a dict keyed by address_key."""
-    cache = {}
-    # Paginate through entire cache table
-    page_size = 1000
-    offset    = 0
-    while True:
-        rows = (
-            supabase.table(TABLE_GEOCACHE)
-            .select('address_key, latitude, longitude')
-            .range(offset, offset + page_size - 1)
-            .execute()
-        ).data
-        for row in rows:
-            cache[row['address_key']] = (row['latitude'], row['longitude'])
-        if len(rows) < page_size:
-            break
-        offset += page_size
-    print(f"  Loaded {len(cache)} entries from geocode cache")
-    return cache
-
 def save_geocode_cache(supabase: Client, new_entries: list):
     """Upsert new geocode entries into cache table."""
     if not new_entries:
@@ -157,6 +177,70 @@ def save_geocode_cache(supabase: Client, new_entries: list):
         ).execute()
     print(f"  Saved {len(new_entries)} new geocodes to cache")
 
+class GeocodeCheckpoint:
+    """
+    Batches new geocodes into geocode_cache upserts (every `every` entries or
+    `seconds`), journalling each one to a local file until its batch is saved.
+    Entries left in the journal by an interrupted run are resumed on start.
+    """
+
+    def __init__(self, supabase: Client, path: str = None,
+                 every: int = GEOCODE_FLUSH_EVERY, seconds: float = GEOCODE_FLUSH_SECONDS):
+        self.supabase   = supabase
+        self.path       = path or state_path(GEOCODE_CHECKPOINT)
+        self.every      = every
+        self.seconds    = seconds
+        self.pending    = self._load()
+        self.saved      = 0
+        self.last_flush = time.monotonic()
+        self.journal    = open(self.path, 'a', encoding='utf-8')
+
+    def _load(self) -> list:
+        entries = []
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        pass   # torn last line from a killed run
+        except FileNotFoundError:
+            pass
+        if entries:
+            print(f"  Resuming {len(entries)} unsaved geocodes from {self.path}")
+        return entries
+
+    def resumed(self) -> dict:
+        """address_key → (lat, lng) for journalled entries, to seed the cache"""
+        return {rekey(e['address_key']): (e['latitude'], e['longitude']) for e in self.pending}
+
+    def add(self, entry: dict):
+        self.pending.append(entry)
+        self.journal.write(json.dumps(entry) + '\n')
+        self.journal.flush()
+        if (len(self.pending) >= self.every
+                or time.monotonic() - self.last_flush >= self.seconds):
+            self.flush()
+
+    def flush(self):
+        """Upsert pending entries; the journal is cleared only once they are saved"""
+        self.last_flush = time.monotonic()
+        if not self.pending:
+            return
+        try:
+            save_geocode_cache(self.supabase, self.pending)
+        except Exception as e:
+            print(f"  ⚠ Geocode cache flush failed ({e}); kept {len(self.pending)} in {self.path}")
+            return
+        self.saved += len(self.pending)
+        self.pending = []
+        self.journal.seek(0)
+        self.journal.truncate()
+
+    def close(self):
+        self.flush()
+        self.journal.close()
+
 def insert_childcare(supabase: Client, rows: list):
     """Truncate table then insert all rows in batches."""
     print(f"\nTruncating {TABLE_CHILDCARE}...")
@@ -195,11 +279,17 @@ def main():
     csv_rows = list(reader)
     print(f"  Parsed {len(csv_rows):,} rows")
 
-    # ── Load geocode cache from Supabase ──────────────────────────────────────
-    print("\nLoading geocode cache from Supabase...")
-    geo_cache    = load_geocode_cache(supabase)
-    new_geocodes = []   # entries to save back after this run
+    # ── Geocode store (local SQLite, merged with Supabase every run) ──────────
+    print("\nLoading geocode store...")
+    store = GeocodeStore()
+    store.sync_from_supabase(supabase, TABLE_GEOCACHE)   # picks up flushes from interrupted runs
+    new_geocodes = GeocodeCheckpoint(supabase)   # saved back to Supabase in batches as we go
+    store.put_many([(k, lat, lng) for k, (lat, lng) in new_geocodes.resumed().items()], source='nominatim')
+    geo_cache    = store.lookup_many((make_address_key(r) for r in csv_rows), source='nominatim')
+    gazetteer    = Gazetteer.open()   # None → every miss goes to Nominatim
     geocode_hits = 0
+    geocode_known_fail = 0
+    geocode_local = 0
     geocode_miss = 0
     geocode_fail = 0
 
@@ -207,73 +297,98 @@ def main():
     print("\nProcessing rows...")
     output_rows = []
 
-    for i, raw_row in enumerate(csv_rows):
-        # Map CSV columns → Supabase columns
-        row = {}
-        for csv_col, db_col in COL_MAP.items():
-            val = raw_row.get(csv_col, '').strip()
-            row[db_col] = val if val else None
-
-        # Coerce integer fields
-        for int_field in ('number_of_approved_places',):
-            try:
-                row[int_field] = int(row[int_field]) if row[int_field] else None
-            except (ValueError, TypeError):
-                row[int_field] = None
-
-        # Coerce date fields
-        for date_field in ('service_approval_granted_date',):
-            val = row.get(date_field)
-            if val:
-                for fmt in ('%d/%m/%Y', '%Y-%m-%d', '%d-%m-%Y'):
-                    try:
-                        row[date_field] = datetime.strptime(val, fmt).date().isoformat()
-                        break
-                    except ValueError:
-                        continue
-                else:
-                    row[date_field] = None
-
-        # Compute NQS score
-        row['score'] = compute_score(raw_row)
-
-        # ── Geocode ───────────────────────────────────────────────────────────
-        key = make_address_key(raw_row)
-        if key in geo_cache:
-            lat, lng = geo_cache[key]
-            geocode_hits += 1
-        else:
-            if i % 50 == 0:
-                print(f"  Geocoding row {i+1}/{len(csv_rows)}...")
-            lat, lng = geocode_address(
+    # Flush whatever was geocoded even if the run dies partway through
+    try:
+        for i, raw_row in enumerate(csv_rows):
+            # Map CSV columns → Supabase columns
+            row = {}
+            for csv_col, db_col in COL_MAP.items():
+                val = raw_row.get(csv_col, '').strip()
+                row[db_col] = val if val else None
+
+            # Coerce integer fields
+            for int_field in ('number_of_approved_places',):
+                try:
+                    row[int_field] = int(row[int_field]) if row[int_field] else None
+                except (ValueError, TypeError):
+                    row[int_field] = None
+
+            # Coerce date fields
+            for date_field in ('service_approval_granted_date',):
+                val = row.get(date_field)
+                if val:
+                    for fmt in ('%d/%m/%Y', '%Y-%m-%d', '%d-%m-%Y'):
+                        try:
+                            row[date_field] = datetime.strptime(val, fmt).date().isoformat()
+                            break
+                        except ValueError:
+                            continue
+                    else:
+                        row[date_field] = None
+
+            # Compute NQS score
+            row['score'] = compute_score(raw_row)
+
+            # ── Geocode ───────────────────────────────────────────────────────
+            key = make_address_key(raw_row)
+            # The offline index is checked first: it is free, and exact where the
+            # cache may hold a stale "no match" or a suburb-level fallback
+            local = gazetteer.lookup(
                 raw_row.get('ServiceAddress', ''),
                 raw_row.get('Suburb',         ''),
-                raw_row.get('State',          'QLD'),
                 raw_row.get('Postcode',       ''),
-            )
-            if lat is not None:
-                geo_cache[key] = (lat, lng)
-                new_geocodes.append({
-                    'address_key': key,
-                    'latitude':    lat,
-                    'longitude':   lng,
-                })
-                geocode_miss += 1
+            ) if gazetteer else None
+            if local:
+                lat, lng = local
+                if geo_cache.get(key) != local:
+                    geo_cache[key] = local
+                    store.put(key, lat, lng, source='gazetteer')
+                geocode_local += 1
+            elif key in geo_cache:
+                lat, lng = geo_cache[key]
+                if lat is None:
+                    geocode_known_fail += 1   # no match last time; retried once the TTL lapses
+                else:
+                    geocode_hits += 1
             else:
-                geocode_fail += 1
+                if i % 50 == 0:
+                    print(f"  Geocoding row {i+1}/{len(csv_rows)}...")
+                result = geocode_address(
+                    raw_row.get('ServiceAddress', ''),
+                    raw_row.get('Suburb',         ''),
+                    raw_row.get('State',          'QLD'),
+                    raw_row.get('Postcode',       ''),
+                )
+                lat, lng = result or (None, None)
+                if result is not None:
+                    # Matches and definite no-matches are stored; errors are retried next run
+                    geo_cache[key] = result
+                    store.put(key, lat, lng, source='nominatim')
+                if lat is not None:
+                    new_geocodes.add({
+                        'address_key': key,
+                        'latitude':    lat,
+                        'longitude':   lng,
+                    })
+                    geocode_miss += 1
+                else:
+                    geocode_fail += 1
 
-        row['latitude']  = lat
-        row['longitude'] = lng
-        output_rows.append(row)
+            row['latitude']  = lat
+            row['longitude'] = lng
+            output_rows.append(row)
+    finally:
+        print("\nSaving new geocodes to cache...")
+        new_geocodes.close()
+        store.report()
+        store.close()
 
     print(f"\nGeocode summary:")
     print(f"  Cache hits  : {geocode_hits}")
+    print(f"  Gazetteer   : {geocode_local}")
     print(f"  New geocodes: {geocode_miss}")
     print(f"  Failed      : {geocode_fail}")
-
-    # ── Save new geocodes back to Supabase cache ──────────────────────────────
-    print("\nSaving new geocodes to cache...")
-    save_geocode_cache(supabase, new_geocodes)
+    print(f"  Known misses: {geocode_known_fail}")
 
     # ── Truncate + insert childcare table ─────────────────────────────────────
     insert_childcare(supabase, output_rows)
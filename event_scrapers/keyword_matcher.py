@@ -0,0 +1,64 @@
+import re
+from typing import Iterable, List, NamedTuple
+
+# Family-friendly event keywords shared by all scrapers (case insensitive)
+FAMILY_KEYWORDS = [
+    'family', 'toddler', 'babies', 'baby', 'bubs', 'bubba', 'mummabubba',
+    'kids', 'teen', 'art starter', 'art play', 'art explorers', 'storytime',
+    'rhymetime', 'dungeons', 'lego', 'code', 'stem', 'steam', 'children',
+    'school holiday', 'playgroup', 'rock', 'rhyme', 'story stomp'
+]
+
+
+class KeywordMatch(NamedTuple):
+    keyword: str
+    start: int
+    end: int
+
+
+class KeywordMatcher:
+    """
+    Matches a keyword set against text in a single scan
+    All keywords are compiled once into one case-insensitive alternation, longest
+    first, so overlapping keywords (e.g. 'rhymetime' / 'rhyme') report the longest
+    match at each position
+    Args:
+        keywords: substrings to look for
+        word_boundary: only match whole words instead of plain substrings
+    """
+
+    def __init__(self, keywords: Iterable[str], word_boundary: bool = False):
+        # Normalise and de-duplicate while keeping the first-seen order
+        self.keywords = list(dict.fromkeys(k.strip().lower() for k in keywords if k and k.strip()))
+        self.word_boundary = word_boundary
+
+        if self.keywords:
+            alternation = '|'.join(re.escape(k) for k in sorted(self.keywords, key=len, reverse=True))
+            if word_boundary:
+                alternation = rf'\b(?:{alternation})\b'
+            self.pattern = re.compile(alternation, re.IGNORECASE)
+        else:
+            self.pattern = None
+
+    def matches(self, text: str) -> bool:
+        """True if any keyword occurs in text"""
+        if not text or self.pattern is None:
+            return False
+        return self.pattern.search(text) is not None
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """Every (non-overlapping) keyword occurrence with its position in text"""
+        if not text or self.pattern is None:
+            return []
+        return [KeywordMatch(m.group(0).lower(), m.start(), m.end()) for m in self.pattern.finditer(text)]
+
+    def matched_keywords(self, text: str) -> List[str]:
+        """Distinct keywords found in text, in order of first occurrence"""
+        return list(dict.fromkeys(m.keyword for m in self.find_all(text)))
+
+    def __call__(self, text: str) -> bool:
+        return self.matches(text)
+
+
+# Shared matcher for the default keyword list
+FAMILY_MATCHER = KeywordMatcher(FAMILY_KEYWORDS)
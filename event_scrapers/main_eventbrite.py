@@ -1,13 +1,17 @@
 import os
-from fetch_cessnock import EventbriteAPI, ORGANIZER_IDS, FAMILY_KEYWORDS
+from fetch_cessnock import EventbriteAPI, ORGANIZER_IDS, FAMILY_KEYWORDS, MAX_CONCURRENT_ORGANIZERS
 from push_to_sb_cessnock import push_events_to_supabase
 from push_to_sb_cessnock import delete_past_events
 
-def main():
+def main(max_workers=None):
     # Configuration
     api_token = os.getenv("EVENTBRITE_API_TOKEN")
     table_name = "events_cessnock"
     
+    # Organizers fetched in parallel (set EVENTBRITE_MAX_WORKERS=1 to fetch one at a time)
+    if max_workers is None:
+        max_workers = int(os.getenv("EVENTBRITE_MAX_WORKERS", MAX_CONCURRENT_ORGANIZERS))
+    
     if not api_token:
         print("✗ Error: EVENTBRITE_API_TOKEN environment variable not set")
         return False
@@ -16,16 +20,21 @@ def main():
     print(f"\n[1/2] Fetching family-friendly events from Eventbrite...")
     print(f"      Organizers: {len(ORGANIZER_IDS)} total")
     print(f"      Keywords: {len(FAMILY_KEYWORDS)} filters applied")
+    print(f"      Workers: {max_workers}")
     
-    api = EventbriteAPI(api_token)
+    api = EventbriteAPI(api_token, pool_size=max(1, max_workers))
     all_events = []
     
-    # Get live events from all organizers with keyword filtering
-    for i, organizer_id in enumerate(ORGANIZER_IDS, 1):
-        print(f"      [{i}/{len(ORGANIZER_IDS)}] Fetching organizer {organizer_id}...", end=' ')
-        events = api.get_organizer_events(organizer_id, status='live', filter_keywords=FAMILY_KEYWORDS)
+    # Get live events from all organizers with keyword filtering (results stay in ORGANIZER_IDS order)
+    try:
+        results = api.get_organizers_events(
+            ORGANIZER_IDS, max_workers=max_workers, status='live', filter_keywords=FAMILY_KEYWORDS
+        )
+    finally:
+        api.close()
+    for i, (organizer_id, events) in enumerate(zip(ORGANIZER_IDS, results), 1):
+        print(f"      [{i}/{len(ORGANIZER_IDS)}] Organizer {organizer_id}: ✓ {len(events)} family events")
         all_events.extend(events)
-        print(f"✓ {len(events)} family events")
     
     # Clean up past events from database
     delete_past_events()
@@ -46,7 +55,10 @@ def main():
     
     # Step 2: Push to Supabase
     print(f"\n[2/2] Pushing events to Supabase...")
-    success = push_events_to_supabase(all_events, table_name=table_name)
+    # Only new/changed events are upserted unless EVENTBRITE_FULL_SYNC=1
+    # (everything is also pushed again every EVENTBRITE_FULL_SYNC_DAYS, default 7)
+    incremental = os.getenv("EVENTBRITE_FULL_SYNC", "0") != "1"
+    success = push_events_to_supabase(all_events, table_name=table_name, incremental=incremental)
     
     if success:
         print("\n" + "=" * 80)
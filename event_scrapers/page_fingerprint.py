@@ -0,0 +1,103 @@
+"""
+Skip re-parsing detail pages that haven't changed since the last run.
+
+FingerprintStore maps each URL to a hash of its normalised HTML plus the record
+the scraper parsed from it. When tonight's page hashes the same as last
+night's, the stored record is returned and BeautifulSoup never runs.
+
+Normalisation drops the parts of a page that change on every request without
+changing its content (scripts, styles, comments, nonces, whitespace), so a
+rotated analytics snippet doesn't count as a change. A parser version is mixed
+into the hash: bump it whenever the parsing code changes so stale records are
+re-parsed.
+
+The store is a JSON file under the scraper state directory (persisted by the
+CI cache). URLs not seen during a run are dropped when it is saved.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from state_paths import state_path
+
+_VOLATILE_RE = re.compile(
+    rb'<script\b.*?</script\s*>'
+    rb'|<style\b.*?</style\s*>'
+    rb'|<!--.*?-->'
+    rb'|\snonce="[^"]*"'
+    rb'|\sname="csrf[^"]*"\s+content="[^"]*"',
+    re.IGNORECASE | re.DOTALL,
+)
+_WHITESPACE_RE = re.compile(rb'\s+')
+
+
+def page_fingerprint(content, version='1'):
+    """sha256 of the page with volatile markup and whitespace removed"""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    normalised = _WHITESPACE_RE.sub(b' ', _VOLATILE_RE.sub(b'', content)).strip()
+    return hashlib.sha256(version.encode('utf-8') + b'\0' + normalised).hexdigest()
+
+
+class FingerprintStore:
+    """
+    URL → (normalised content hash, parsed record) for one scraper
+    Args:
+        name: scraper name, used for the state file name
+        version: parser version mixed into every hash
+        path: explicit state file (defaults to <state dir>/page_fingerprints_<name>.json)
+    """
+
+    def __init__(self, name, version='1', path=None):
+        self.path = path or state_path(f'page_fingerprints_{name}.json')
+        self.version = version
+        self.entries = self._load()
+        self.seen = {}
+        self.reused = 0
+        self.parsed = 0
+        self.lock = threading.Lock()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"⚠ Could not read page fingerprints {self.path} ({e}); re-parsing everything")
+            return {}
+
+    def get_or_parse(self, url, content, parse):
+        """
+        Return the stored record if url's content is unchanged, otherwise call
+        parse() and remember its result (None results are not stored)
+        Records must be JSON-serialisable
+        """
+        fingerprint = page_fingerprint(content, self.version)
+
+        with self.lock:
+            entry = self.entries.get(url)
+            if entry and entry.get('hash') == fingerprint:
+                self.seen[url] = entry
+                self.reused += 1
+                return json.loads(json.dumps(entry['record']))
+
+        record = parse()
+
+        with self.lock:
+            self.parsed += 1
+            if record is not None:
+                self.seen[url] = {'hash': fingerprint, 'record': record}
+        return record
+
+    def save(self):
+        """Write this run's fingerprints atomically (URLs not seen this run are dropped)"""
+        with self.lock:
+            entries = dict(self.seen)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, sort_keys=True, default=str)
+        os.replace(tmp_path, self.path)
+        print(f"Page fingerprints: {self.reused} unchanged (parse skipped), {self.parsed} parsed")
@@ -0,0 +1,117 @@
+"""
+Readiness-based waits for the Selenium scrapers.
+
+Each helper polls the browser for a concrete signal (an element is present,
+the document has loaded, the network has gone quiet, the DOM has stopped
+changing) and returns as soon as it holds, instead of sleeping for a fixed
+guess. Helpers return True when the page became ready and False on timeout;
+they never raise, so callers can carry on and parse whatever has rendered.
+"""
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+POLL_INTERVAL = 0.1
+
+# Records the time of the latest DOM mutation on window.__lastMutation
+# (installed once per document; a navigation discards it with the page)
+_INSTALL_MUTATION_OBSERVER = """
+if (!window.__mutationObserver) {
+    window.__lastMutation = performance.now();
+    window.__mutationObserver = new MutationObserver(function () {
+        window.__lastMutation = performance.now();
+    });
+    window.__mutationObserver.observe(document.documentElement, {
+        childList: true, subtree: true, attributes: true, characterData: true
+    });
+}
+return performance.now() - window.__lastMutation;
+"""
+
+# Milliseconds since the last resource (script, XHR, fetch, image...) finished
+_MS_SINCE_LAST_RESOURCE = """
+var entries = performance.getEntriesByType('resource');
+var last = 0;
+for (var i = 0; i < entries.length; i++) {
+    if (entries[i].responseEnd > last) { last = entries[i].responseEnd; }
+}
+return performance.now() - last;
+"""
+
+
+def _wait(driver, condition, timeout):
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(condition)
+        return True
+    except (TimeoutException, WebDriverException):
+        return False
+
+
+def wait_for_document_ready(driver, timeout=10):
+    """Wait until document.readyState is 'complete'"""
+    return _wait(
+        driver,
+        lambda d: d.execute_script("return document.readyState") == 'complete',
+        timeout,
+    )
+
+
+def wait_for_selector(driver, selector, timeout=10, by=By.CSS_SELECTOR, visible=False, clickable=False):
+    """
+    Wait until an element matching selector is present (or visible / clickable)
+    Returns the element, or None on timeout
+    """
+    if clickable:
+        condition = EC.element_to_be_clickable((by, selector))
+    elif visible:
+        condition = EC.visibility_of_element_located((by, selector))
+    else:
+        condition = EC.presence_of_element_located((by, selector))
+
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(condition)
+    except (TimeoutException, WebDriverException):
+        return None
+
+
+def wait_for_count_change(driver, selector, previous_count, timeout=10, by=By.CSS_SELECTOR):
+    """Wait until the number of elements matching selector differs from previous_count"""
+    return _wait(driver, lambda d: len(d.find_elements(by, selector)) != previous_count, timeout)
+
+
+def wait_for_staleness(driver, element, timeout=10):
+    """Wait until element is detached from the DOM (e.g. replaced after a pagination click)"""
+    return _wait(driver, EC.staleness_of(element), timeout)
+
+
+def wait_for_network_idle(driver, idle_ms=500, timeout=10):
+    """
+    Wait until the document is loaded and no resource has finished for idle_ms
+    Uses the Resource Timing API, so it needs no proxy or request hooks
+    """
+    return _wait(
+        driver,
+        lambda d: (
+            d.execute_script("return document.readyState") == 'complete'
+            and d.execute_script(_MS_SINCE_LAST_RESOURCE) >= idle_ms
+        ),
+        timeout,
+    )
+
+
+def wait_for_dom_settled(driver, quiet_ms=300, timeout=5):
+    """Wait until the DOM has gone quiet_ms without a mutation (JS rendering finished)"""
+    return _wait(driver, lambda d: d.execute_script(_INSTALL_MUTATION_OBSERVER) >= quiet_ms, timeout)
+
+
+def wait_for_page_ready(driver, selector=None, timeout=10, quiet_ms=300, by=By.CSS_SELECTOR):
+    """
+    Typical post-navigation wait: document loaded, selector present (if given),
+    then DOM settled. Returns False if any step timed out
+    """
+    ready = wait_for_document_ready(driver, timeout)
+    if selector:
+        ready = wait_for_selector(driver, selector, timeout, by=by) is not None and ready
+    return wait_for_dom_settled(driver, quiet_ms, timeout) and ready
@@ -1,7 +1,11 @@
 import os
+import json
+import hashlib
+import time
 from supabase import create_client, Client
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
+from state_paths import state_path
 
 # Initialize and return Supabase client
 def get_supabase_client() -> Client:
@@ -13,12 +17,86 @@ def get_supabase_client() -> Client:
     
     return create_client(supabase_url, supabase_key)
 
+# Incremental syncs trust the local state; every this many days it is dropped and everything is
+# pushed again, so rows removed or edited in Supabase behind the scraper's back are restored
+FULL_SYNC_EVERY_DAYS = float(os.getenv("EVENTBRITE_FULL_SYNC_DAYS", "7"))
+FULL_SYNC_KEY = "_full_sync_at"   # state entry holding the time of the last full sync
+
+# Default location of the per-table incremental sync state
+def default_sync_state_file(table_name: str) -> str:
+    return state_path(f"sync_{table_name}.json")
+
+# Load {event_id: {'changed': ..., 'hash': ...}} from the last successful sync
+def load_sync_state(state_file: str) -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(state_file, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"⚠ Could not read sync state {state_file} ({e}); doing a full sync")
+        return {}
+
+# Write the sync state atomically so an interrupted run never leaves a truncated file
+def save_sync_state(state_file: str, state: Dict[str, Dict[str, Any]]) -> None:
+    tmp_file = f"{state_file}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(state, f, sort_keys=True)
+    os.replace(tmp_file, state_file)
+
+# Fingerprint of the flattened row, so locally derived fields (e.g. venue coordinates) also count as changes
+def _event_hash(event: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(event, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+# Split events into those that are new/changed since the last sync and build the next state
+def filter_changed_events(events: List[Dict[str, Any]], state: Dict[str, Dict[str, Any]]):
+    changed_events = []
+    next_state = {}
+    
+    for event in events:
+        event_id = event.get('event_id')
+        marker = {'changed': event.get('changed'), 'hash': _event_hash(event)}
+        
+        if event_id is None:
+            changed_events.append(event)
+            continue
+        
+        next_state[event_id] = marker
+        previous = state.get(event_id)
+        if marker['changed'] is None or previous != marker:
+            changed_events.append(event)
+    
+    return changed_events, next_state
+
 # Push flattened event data to Supabase table
-def push_events_to_supabase(events: List[Dict[str, Any]], table_name: str = "events_cessnock") -> bool:
+# With incremental=True, events whose Eventbrite `changed` timestamp and content match the
+# last successful sync are skipped before any network write. The sync state is written
+# either way, so a full push also counts as the periodic full sync
+def push_events_to_supabase(events: List[Dict[str, Any]], table_name: str = "events_cessnock",
+                            incremental: bool = False, state_file: Optional[str] = None) -> bool:
     if not events:
         print("No events to push to Supabase.")
         return False
     
+    state_file = state_file or default_sync_state_file(table_name)
+    state = load_sync_state(state_file) if incremental else {}
+    full_synced_at = state.pop(FULL_SYNC_KEY, 0)
+    if time.time() - full_synced_at > FULL_SYNC_EVERY_DAYS * 86400:
+        if incremental:
+            print(f"Last full sync over {FULL_SYNC_EVERY_DAYS:g} days ago - pushing every event")
+        state, full_synced_at = {}, time.time()
+    
+    total = len(events)
+    events, next_state = filter_changed_events(events, state)
+    next_state[FULL_SYNC_KEY] = full_synced_at
+    if incremental:
+        print(f"Incremental sync: {len(events)} new/changed, {total - len(events)} unchanged (skipped)")
+    
+    if not events:
+        save_sync_state(state_file, next_state)
+        print("✓ Supabase already up to date - nothing to push")
+        return True
+    
     try:
         supabase = get_supabase_client()
         
@@ -34,14 +112,25 @@ def push_events_to_supabase(events: List[Dict[str, Any]], table_name: str = "eve
         print(f"  - Table: {table_name}")
         print(f"  - Records affected: {len(response.data)}")
         
+        # Only remember what was actually written
+        save_sync_state(state_file, next_state)
+        
         return True
         
     except Exception as e:
         print(f"✗ Error pushing to Supabase: {e}")
         return False
 
+# Forget deleted events in the incremental sync state, so they are pushed again if they reappear
+def forget_synced_events(state_file: str, event_ids: List[str]) -> None:
+    state = load_sync_state(state_file)
+    forgotten = [event_id for event_id in event_ids if state.pop(event_id, None) is not None]
+    if forgotten:
+        save_sync_state(state_file, state)
+        print(f"  - Cleared {len(forgotten)} deleted event(s) from the sync state")
+
 # Delete past events from table
-def delete_past_events(table_name: str = "events_cessnock") -> bool:
+def delete_past_events(table_name: str = "events_cessnock", state_file: Optional[str] = None) -> bool:
     try:
         supabase = get_supabase_client()
         
@@ -50,9 +139,13 @@ def delete_past_events(table_name: str = "events_cessnock") -> bool:
 
         print(f"Deleting events from '{table_name}' where start_date < {now_local} ...")
 
-        supabase.table(table_name).delete().lt("start_date", now_local).execute()
+        response = supabase.table(table_name).delete().lt("start_date", now_local).execute()
 
         print("✓ Past events removed successfully.")
+        
+        state_file = state_file or default_sync_state_file(table_name)
+        if os.path.exists(state_file):
+            forget_synced_events(state_file, [str(row["event_id"]) for row in response.data or [] if row.get("event_id")])
         return True
 
     except Exception as e:
@@ -0,0 +1,153 @@
+"""
+Free-text recurrence rules ("Every Tuesday 11am (excluding school holidays)",
+"Thursday & Friday 3.30 - 4.30pm fortnightly") compiled once and expanded
+lazily over a date window.
+
+    rule = compile_rule("Every Tuesday 11am (excluding school holidays)")
+    for moment in rule.between(today, today + timedelta(days=30)):
+        ...
+
+compile_rule is cached by text, so the many events sharing a pattern parse it
+once. Term-time rules expand through the precomputed school_terms calendar.
+"""
+
+import heapq
+import re
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+from school_terms import WEEKDAYS, in_term, term_for, term_weekdays
+
+# Seasons a rule can be restricted to
+TERM = 'term'
+HOLIDAYS = 'holidays'
+
+_DAY = r'\b(monday|tuesday|wednesday|thursday|friday|saturday|sunday)s?\b'
+_WEEKDAY_RE = re.compile(_DAY)
+_WEEKDAY_RANGE_RE = re.compile(_DAY + r'\s*(?:-|–|to|through|until)\s*' + _DAY)
+_TIME = r'\b(\d{1,2})(?:[:.](\d{2}))?\s*([ap])?\.?m?\.?'
+_TIME_RANGE_RE = re.compile(_TIME + r'\s*(?:-|–|to)\s*(\d{1,2})(?:[:.](\d{2}))?\s*([ap])\.?m\b')
+_TIME_RE = re.compile(r'\b(\d{1,2})(?:[:.](\d{2}))?\s*([ap])\.?m\b')
+_FORTNIGHTLY_RE = re.compile(r'\bfortnightly\b|\bevery (?:second|other|2nd) week\b|\bevery fortnight\b')
+_TERM_RE = re.compile(r'excl\w* (?:the )?school holidays|not (?:during|in) (?:the )?school holidays|\bterms?\b')
+_HOLIDAYS_RE = re.compile(r'school holidays')
+
+
+def _to_24h(hour, minute, meridiem):
+    hour = hour % 12
+    if meridiem == 'p':
+        hour += 12
+    return time(hour, minute)
+
+
+def _parse_times(text):
+    """(start, end) times from '11am', '2:30pm' or '3.30 - 4.30pm' (end may be None)"""
+    match = _TIME_RANGE_RE.search(text)
+    if match:
+        start_h, start_m, start_mer, end_h, end_m, end_mer = match.groups()
+        start_h, end_h = int(start_h), int(end_h)
+        if start_mer is None:
+            # "3.30 - 4.30pm": the start shares the end's meridiem unless that
+            # would put it after the end ("11 - 12pm" starts at 11am)
+            start_mer = end_mer
+            if start_h % 12 > end_h % 12:
+                start_mer = 'a' if end_mer == 'p' else 'p'
+        if start_h <= 12 and end_h <= 12:
+            return (_to_24h(start_h, int(start_m or 0), start_mer),
+                    _to_24h(end_h, int(end_m or 0), end_mer))
+
+    match = _TIME_RE.search(text)
+    if match:
+        hour, minute, meridiem = match.groups()
+        if int(hour) <= 12:
+            return _to_24h(int(hour), int(minute or 0), meridiem), None
+    return None, None
+
+
+def _weekdays(text):
+    """Weekday numbers named in text, with 'Monday to Friday' ranges expanded"""
+    weekdays = set()
+    for first, last in _WEEKDAY_RANGE_RE.findall(text):
+        span = (WEEKDAYS[last] - WEEKDAYS[first]) % 7
+        weekdays.update((WEEKDAYS[first] + offset) % 7 for offset in range(span + 1))
+    weekdays.update(WEEKDAYS[name] for name in _WEEKDAY_RE.findall(text))
+    return tuple(sorted(weekdays))
+
+
+def _weekly(first, last):
+    while first <= last:
+        yield first
+        first += timedelta(weeks=1)
+
+
+class RecurrenceRule(NamedTuple):
+    text: str
+    weekdays: Tuple[int, ...]
+    start_time: Optional[time]
+    end_time: Optional[time]
+    interval_weeks: int
+    season: Optional[str]
+
+    @property
+    def is_expandable(self):
+        """True when the rule names at least one weekday and a start time"""
+        return bool(self.weekdays) and self.start_time is not None
+
+    def _in_cycle(self, day):
+        # Fortnightly rules count weeks from the start of the term they fall in,
+        # otherwise from a fixed epoch so the cycle is stable between runs
+        term = term_for(day) if self.season == TERM else None
+        anchor = term.start if term else date.min
+        anchor_monday = anchor.toordinal() - anchor.weekday()
+        weeks = (day.toordinal() - day.weekday() - anchor_monday) // 7
+        return weeks % self.interval_weeks == 0
+
+    def _days(self, weekday, first, last):
+        if self.season == TERM:
+            days = iter(term_weekdays(weekday, first, last))
+        else:
+            days = _weekly(first + timedelta(days=(weekday - first.weekday()) % 7), last)
+            if self.season == HOLIDAYS:
+                days = (day for day in days if not in_term(day))
+        if self.interval_weeks > 1:
+            days = (day for day in days if self._in_cycle(day))
+        return days
+
+    def between(self, start, end):
+        """
+        Lazily yield occurrence datetimes (at start_time, or midnight) in order
+        start/end are dates (whole days, inclusive) or datetimes (compared exactly)
+        """
+        if not self.weekdays:
+            return
+        exact = isinstance(start, datetime)
+        first = start.date() if isinstance(start, datetime) else start
+        last = end.date() if isinstance(end, datetime) else end
+
+        streams = [self._days(weekday, first, last) for weekday in self.weekdays]
+        for day in heapq.merge(*streams):
+            moment = datetime.combine(day, self.start_time or time.min)
+            if exact and not (start <= moment <= end):
+                continue
+            yield moment
+
+
+@lru_cache(maxsize=512)
+def _compile(text, season):
+    if season is None:
+        if _TERM_RE.search(text):
+            season = TERM
+        elif _HOLIDAYS_RE.search(text):
+            season = HOLIDAYS
+
+    start_time, end_time = _parse_times(text)
+    interval = 2 if _FORTNIGHTLY_RE.search(text) else 1
+    return RecurrenceRule(text, _weekdays(text), start_time, end_time, interval, season)
+
+
+def compile_rule(text, season=None):
+    """
+    Compile a recurrence phrase into a RecurrenceRule (cached by text)
+    season: force TERM or HOLIDAYS instead of detecting it from the text
+    """
+    return _compile(' '.join((text or '').lower().split()), season)
@@ -0,0 +1,73 @@
+"""
+Run every Selenium-based scraper in one process, sharing a pool of warm
+headless Chrome instances so browser startup is paid once per batch instead
+of once per scraper.
+
+Usage:
+    python run_selenium_scrapers.py                 # all scrapers
+    python run_selenium_scrapers.py lakemac dungog  # a subset
+
+Environment variables:
+    SUPABASE_URL / SUPABASE_KEY   — passed through to each scraper
+    DRIVER_POOL_SIZE              — browsers kept warm (default 2)
+    DRIVER_MAX_PAGE_LOADS         — recycle a browser after this many loads (default 100)
+    DRIVER_BLOCK_RESOURCES        — force a resource blocking profile for every lease
+                                    ('none', 'light' or 'full'; default: per scraper)
+"""
+
+import os
+import sys
+import time
+import importlib
+from driver_pool import DriverPool
+
+# Scraper name → module exposing main(driver_pool=None)
+SCRAPERS = {
+    'lakemac':      'scrape_lakemac_events',
+    'maitland':     'scrape_maitland_events',
+    'dungog':       'scrape_dungog_events',
+    'midcoast':     'scrape_midcoast_events',
+    'singleton':    'scrape_singleton_events',
+    'upperhunter':  'scrape_upperhunter_events',
+    'playgroupnsw': 'scrape_playgroupnsw_events',
+    'playgroupqld': 'scrape_playgroupqld_events',
+}
+
+
+def main(names=None):
+    names = names or list(SCRAPERS)
+    unknown = [n for n in names if n not in SCRAPERS]
+    if unknown:
+        print(f"✗ Unknown scraper(s): {', '.join(unknown)}")
+        print(f"  Available: {', '.join(SCRAPERS)}")
+        return False
+
+    pool_size = int(os.getenv('DRIVER_POOL_SIZE', '2'))
+    max_page_loads = int(os.getenv('DRIVER_MAX_PAGE_LOADS', '100'))
+
+    failed = []
+    with DriverPool(size=pool_size, max_page_loads=max_page_loads, warm=True) as pool:
+        for name in names:
+            print("\n" + "=" * 80)
+            print(f"Running {name} scraper")
+            print("=" * 80)
+            started = time.monotonic()
+            try:
+                module = importlib.import_module(SCRAPERS[name])
+                module.main(driver_pool=pool)
+                print(f"✓ {name} finished in {time.monotonic() - started:.1f}s")
+            except Exception as e:
+                print(f"✗ {name} failed after {time.monotonic() - started:.1f}s: {e}")
+                failed.append(name)
+
+    print("\n" + "=" * 80)
+    print(f"Completed {len(names) - len(failed)}/{len(names)} scrapers")
+    if failed:
+        print(f"Failed: {', '.join(failed)}")
+    print("=" * 80)
+    return not failed
+
+
+if __name__ == "__main__":
+    success = main(sys.argv[1:])
+    exit(0 if success else 1)
@@ -0,0 +1,114 @@
+"""
+NSW (eastern division) school term calendar shared by the scrapers that expand
+term-time recurring events (Lake Mac, Maitland, Port Stephens).
+
+The term table is parsed once at import and indexed per weekday as a sorted
+list of in-term dates, so "every Tuesday in term between A and B" is two
+bisects and a slice instead of re-parsing the table and walking day by day.
+Add new years to SCHOOL_TERM_DATES as they are published.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+from typing import List, NamedTuple, Optional
+
+# NSW School Term Dates - UPDATED with 2027
+SCHOOL_TERM_DATES = {
+    2025: {
+        "terms": {
+            "eastern_nsw": [
+                ("Term 1", "2025-02-06", "2025-04-11"),
+                ("Term 2", "2025-04-30", "2025-07-04"),
+                ("Term 3", "2025-07-22", "2025-09-26"),
+                ("Term 4", "2025-10-14", "2025-12-19"),
+            ]
+        }
+    },
+    2026: {
+        "terms": {
+            "eastern_nsw": [
+                ("Term 1", "2026-01-27", "2026-04-02"),
+                ("Term 2", "2026-04-20", "2026-07-03"),
+                ("Term 3", "2026-07-20", "2026-09-25"),
+                ("Term 4", "2026-10-12", "2026-12-17"),
+            ]
+        }
+    },
+    2027: {
+        "terms": {
+            "eastern_nsw": [
+                ("Term 1", "2027-01-28", "2027-04-09"),
+                ("Term 2", "2027-04-26", "2027-07-02"),
+                ("Term 3", "2027-07-19", "2027-09-24"),
+                ("Term 4", "2027-10-11", "2027-12-20"),
+            ]
+        }
+    }
+}
+
+WEEKDAYS = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6
+}
+
+
+class Term(NamedTuple):
+    year: int
+    name: str
+    start: date
+    end: date
+
+
+def _build_terms(region='eastern_nsw') -> List[Term]:
+    terms = []
+    for year, data in SCHOOL_TERM_DATES.items():
+        for name, start_str, end_str in data['terms'][region]:
+            terms.append(Term(
+                year, name,
+                datetime.strptime(start_str, '%Y-%m-%d').date(),
+                datetime.strptime(end_str, '%Y-%m-%d').date(),
+            ))
+    return sorted(terms, key=lambda t: t.start)
+
+
+def _build_weekday_index(terms) -> List[List[date]]:
+    index = [[] for _ in range(7)]
+    for term in terms:
+        day = term.start
+        while day <= term.end:
+            index[day.weekday()].append(day)
+            day += timedelta(days=1)
+    return index
+
+
+TERMS = _build_terms()
+_TERM_STARTS = [t.start for t in TERMS]
+_WEEKDAY_INDEX = _build_weekday_index(TERMS)
+
+
+def _as_date(value):
+    return value.date() if isinstance(value, datetime) else value
+
+
+def weekday_number(day_name) -> Optional[int]:
+    """'Tuesday' → 1 (Monday is 0); None if not a weekday name"""
+    return WEEKDAYS.get(day_name.strip().lower()) if day_name else None
+
+
+def term_weekdays(weekday, start, end) -> List[date]:
+    """In-term dates falling on weekday (0=Monday) between start and end inclusive"""
+    days = _WEEKDAY_INDEX[weekday]
+    return days[bisect_left(days, _as_date(start)):bisect_right(days, _as_date(end))]
+
+
+def term_for(day) -> Optional[Term]:
+    """The term containing day, or None during school holidays"""
+    day = _as_date(day)
+    i = bisect_right(_TERM_STARTS, day) - 1
+    if i >= 0 and day <= TERMS[i].end:
+        return TERMS[i]
+    return None
+
+
+def in_term(day) -> bool:
+    return term_for(day) is not None
@@ -1,54 +1,41 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
 import re
 import os
-import time
 from datetime import datetime
 from supabase import create_client, Client
+from keyword_matcher import FAMILY_KEYWORDS, KeywordMatcher
+from driver_pool import acquire_driver, release_driver, DEFAULT_USER_AGENT
+from page_waits import wait_for_dom_settled
+from cms_dates import future_occurrences
+from html_parsing import make_soup, strainer
 
 class DungogEventsScraper:
-    def __init__(self):
+    def __init__(self, driver_pool=None):
         self.base_url = "https://www.dungog.nsw.gov.au"
         self.home_url = f"{self.base_url}/Home"
-        self.keywords = [
-            'family', 'toddler', 'babies', 'baby', 'bubs', 'bubba', 
-            'mummabubba', 'kids', 'teen', 'art starter', 'art play', 
-            'art explorers', 'storytime', 'rhymetime', 'dungeons', 
-            'lego', 'code', 'stem', 'steam', 'children', 'school holiday', 
-            'playgroup', 'rock', 'rhyme', 'story stomp', 'little ones', 'story time'
-        ]
+        self.keywords = FAMILY_KEYWORDS + ['little ones', 'story time']
+        self.keyword_matcher = KeywordMatcher(self.keywords)
+        self.driver_pool = driver_pool
         self.driver = None
         
     def setup_driver(self):
-        """Setup Selenium WebDriver with Chrome options"""
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        
-        self.driver = webdriver.Chrome(options=chrome_options)
+        """Lease a Selenium WebDriver from the shared pool (or a private one)"""
+        # Pages are parsed with BeautifulSoup, so skip images, fonts and CSS
+        self.driver_pool, self.driver = acquire_driver(self.driver_pool, user_agent=DEFAULT_USER_AGENT, blocking='full')
         self.driver.implicitly_wait(10)
         
     def close_driver(self):
-        """Close the WebDriver"""
+        """Return the WebDriver to its pool"""
         if self.driver:
-            self.driver.quit()
+            release_driver(self.driver_pool, self.driver)
+            self.driver = None
         
     def contains_keyword(self, text):
         """Check if text contains any of the keywords"""
-        text_lower = text.lower()
-        for keyword in self.keywords:
-            if keyword in text_lower:
-                return True
-        return False
+        return self.keyword_matcher.matches(text)
     
     def scrape_events_list(self):
         """Scrape the events list from the homepage"""
@@ -64,11 +51,11 @@ class DungogEventsScraper:
             print(f"Error waiting for events panel: {e}")
             return []
         
-        # Give it a moment to fully render
-        time.sleep(2)
+        # Let the panel finish rendering
+        wait_for_dom_settled(self.driver)
         
         # Get page source and parse with BeautifulSoup
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+        soup = make_soup(self.driver.page_source, only=strainer('div', id='panel-2'))
         
         # Find the events panel
         events_panel = soup.find('div', id='panel-2')
@@ -95,8 +82,7 @@ class DungogEventsScraper:
             event_date_text = event_date.text.strip() if event_date else ''
             
             # Check if event contains relevant keywords
-            combined_text = f"{title} {description_text}".lower()
-            if self.contains_keyword(combined_text):
+            if self.contains_keyword(title) or self.contains_keyword(description_text):
                 # Make URL absolute
                 if url and not url.startswith('http'):
                     url = self.base_url + url
@@ -126,53 +112,26 @@ class DungogEventsScraper:
             except:
                 pass  # Continue anyway
             
-            time.sleep(1)  # Brief pause for dynamic content
+            wait_for_dom_settled(self.driver)  # Dynamic content
             
             # Parse with BeautifulSoup
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            soup = make_soup(self.driver.page_source)
             
             details = {}
             
             # Get event dates - check for multi-date list first
             all_dates = []
             
-            # Look for multi-date container with future events
-            multi_date_container = soup.find('div', class_='multi-date-list-container')
-            if multi_date_container:
-                # Find only future events (not past events)
-                future_events_list = multi_date_container.find('ul', class_='future-events-list')
-                if future_events_list:
-                    date_items = future_events_list.find_all('li', class_='multi-date-item')
-                    print(f"  Found {len(date_items)} future dates in multi-date list")
-                    
-                    for item in date_items:
-                        # Get data attributes
-                        year = item.get('data-start-year')
-                        month = item.get('data-start-month')
-                        day = item.get('data-start-day')
-                        hour = item.get('data-start-hour')
-                        mins = item.get('data-start-mins')
-                        
-                        if year and month and day:
-                            try:
-                                # Create datetime from data attributes
-                                datetime_obj = datetime(
-                                    int(year), 
-                                    int(month), 
-                                    int(day),
-                                    int(hour) if hour else 0,
-                                    int(mins) if mins else 0
-                                )
-                                
-                                # Get the text content
-                                date_text = item.get_text(strip=True)
-                                
-                                all_dates.append({
-                                    'text': date_text,
-                                    'datetime': datetime_obj
-                                })
-                            except (ValueError, TypeError) as e:
-                                print(f"  Warning: Could not parse date from attributes: {e}")
+            # Look for multi-date container with future events (not past events)
+            occurrences = future_occurrences(soup)
+            if occurrences:
+                print(f"  Found {len(occurrences)} future dates in multi-date list")
+            
+            for occurrence in occurrences:
+                all_dates.append({
+                    'text': occurrence.text,
+                    'datetime': occurrence.start
+                })
             
             # If no multi-date list found, check for single "Next date:" format
             if not all_dates:
@@ -343,8 +302,8 @@ class DungogEventsScraper:
             print("⚠ No events to upload")
 
 
-def main():
-    scraper = DungogEventsScraper()
+def main(driver_pool=None):
+    scraper = DungogEventsScraper(driver_pool=driver_pool)
     events = scraper.scrape_all()
     
     # Get Supabase credentials from environment
@@ -1,61 +1,41 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
 from supabase import create_client, Client
 import json
-import time
 from datetime import datetime, timedelta
 from urllib.parse import urljoin
 import re
+from keyword_matcher import FAMILY_KEYWORDS, KeywordMatcher
+from driver_pool import acquire_driver, release_driver
+from rate_limit import HostRateLimiter
+from page_waits import wait_for_page_ready, wait_for_dom_settled
+from static_fetch import StaticPageFetcher
+from cms_dates import future_occurrences
+from html_parsing import make_soup
+from recurrence import TERM, compile_rule
+from concurrent.futures import ThreadPoolExecutor
+import queue
 
 
-# NSW School Term Dates - UPDATED with 2027
-SCHOOL_TERM_DATES = {
-    2025: {
-        "terms": {
-            "eastern_nsw": [
-                ("Term 1", "2025-02-06", "2025-04-11"),
-                ("Term 2", "2025-04-30", "2025-07-04"),
-                ("Term 3", "2025-07-22", "2025-09-26"),
-                ("Term 4", "2025-10-14", "2025-12-19"),
-            ]
-        }
-    },
-    2026: {
-        "terms": {
-            "eastern_nsw": [
-                ("Term 1", "2026-01-27", "2026-04-02"),
-                ("Term 2", "2026-04-20", "2026-07-03"),
-                ("Term 3", "2026-07-20", "2026-09-25"),
-                ("Term 4", "2026-10-12", "2026-12-17"),
-            ]
-        }
-    },
-    2027: {
-        "terms": {
-            "eastern_nsw": [
-                ("Term 1", "2027-01-28", "2027-04-09"),
-                ("Term 2", "2027-04-26", "2027-07-02"),
-                ("Term 3", "2027-07-19", "2027-09-24"),
-                ("Term 4", "2027-10-11", "2027-12-20"),
-            ]
-        }
-    }
-}
+# Phrases shown on event pages / searches with nothing to list
+NO_RESULTS_RE = re.compile(r'no (?:results|events) found|\b0 results?\b|nothing found', re.IGNORECASE)
 
+# Where the results (or the "no results" message) are rendered; first match wins
+NO_RESULTS_CONTAINERS = ['main', '[role="main"]', '#main-content', '.main-content', 'div.oc-quick-list-grid']
 
 
 class LakeMacSeleniumScraper:
-    def __init__(self, headless=True):
+    def __init__(self, headless=True, driver_pool=None, detail_workers=3, requests_per_second=1.0):
         """
         Initialize Selenium scraper
         Args:
             headless: Run browser in headless mode (no GUI)
+            driver_pool: Shared DriverPool to lease browsers from (optional)
+            detail_workers: Browsers used in parallel to visit event detail pages
+            requests_per_second: Politeness budget per host for detail page loads
         """
         self.base_url = "https://www.lakemac.com.au"
         
@@ -67,12 +47,8 @@ class LakeMacSeleniumScraper:
         ]
         
         # Keywords to filter family/kids events
-        self.family_keywords = [
-            'family', 'toddler', 'babies', 'baby', 'bubs', 'bubba', 'mummabubba',
-            'kids', 'teen', 'art starter', 'art play', 'art explorers', 'storytime',
-            'rhymetime', 'dungeons', 'lego', 'code', 'stem', 'steam', 'children',
-            'school holiday', 'playgroup', 'rock', 'rhyme', 'story stomp'
-        ]
+        self.family_keywords = list(FAMILY_KEYWORDS)
+        self.keyword_matcher = KeywordMatcher(self.family_keywords)
         
         # Venue coordinates for matching locations
         self.venue_coordinates = {
@@ -88,34 +64,72 @@ class LakeMacSeleniumScraper:
             'Windale Hub': {'latitude': -32.9933612, 'longitude': 151.6789841},
         }
         
+        # Phase 2 spreads detail pages over several browsers, throttled per host
+        self.detail_workers = max(1, detail_workers)
+        self.host_limiter = HostRateLimiter(requests_per_second, capacity=self.detail_workers)
+        
+        # Detail pages are parsed from page_source, so extra browsers can skip images, fonts and CSS
+        self.blocking = 'full'
+        
+        # Listing pages are server-rendered: try plain HTTP before the browser
+        self.static_fetcher = StaticPageFetcher()
+        
+        self.driver_pool = driver_pool
         self.driver = self._setup_driver(headless)
     
     def _setup_driver(self, headless):
-        """Setup Chrome WebDriver with options"""
-        chrome_options = Options()
+        """Lease a Chrome WebDriver from the shared pool (or a private one)"""
+        # Keep CSS here: the listing reads titles with WebElement.text, which depends on styles
+        self.driver_pool, driver = acquire_driver(
+            self.driver_pool, headless=headless, pool_size=self.detail_workers, blocking='light'
+        )
+        return driver
+    
+    def _polite_get(self, driver, url):
+        """Load a page once the per-host politeness budget allows it"""
+        self.host_limiter.wait(url)
+        driver.get(url)
+    
+    def _parallel_map(self, func, items):
+        """
+        Run func(driver, item) for every item across up to detail_workers browsers
+        Uses this scraper's own driver plus any extra browsers the pool can spare right now
+        Results are returned in the same order as items
+        """
+        if not items:
+            return []
         
-        if headless:
-            chrome_options.add_argument("--headless=new")
+        extra_drivers = []
+        while len(extra_drivers) < min(self.detail_workers, len(items)) - 1:
+            driver = self.driver_pool.acquire(block=False, blocking=self.blocking)
+            if driver is None:
+                break
+            extra_drivers.append(driver)
+        
+        drivers = queue.Queue()
+        for driver in [self.driver] + extra_drivers:
+            drivers.put(driver)
         
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--window-size=1920,1080")
+        def run(item):
+            driver = drivers.get()
+            try:
+                return func(driver, item)
+            finally:
+                drivers.put(driver)
         
         try:
-            driver = webdriver.Chrome(options=chrome_options)
-            return driver
-        except Exception as e:
-            print(f"Error setting up Chrome driver: {e}")
-            print("\nMake sure you have Chrome and ChromeDriver installed.")
-            raise
+            with ThreadPoolExecutor(max_workers=1 + len(extra_drivers)) as executor:
+                return list(executor.map(run, items))
+        finally:
+            for driver in extra_drivers:
+                self.driver_pool.release(driver)
     
     def _is_family_event(self, event_name):
         """Check if event name contains any family keywords"""
         if not event_name or event_name == 'N/A':
             return False
         
-        event_name_lower = event_name.lower()
-        return any(keyword.lower() in event_name_lower for keyword in self.family_keywords)
+        return self.keyword_matcher.matches(event_name)
     
     def get_all_events(self, wait_time=10, scroll_pages=3):
         """
@@ -131,7 +145,6 @@ class LakeMacSeleniumScraper:
             print(f"\nScraping listing page: {url}")
             events = self.get_basic_events(url, wait_time, scroll_pages)
             all_basic_events.extend(events)
-            time.sleep(2)
         
         # Filter by family keywords
         family_events = [e for e in all_basic_events if self._is_family_event(e.get('name'))]
@@ -143,29 +156,56 @@ class LakeMacSeleniumScraper:
         
         # Phase 2: Visit each event URL to get detailed information
         print("\nPHASE 2: Visiting each event page for details")
+        print(f"({self.detail_workers} browser(s) in parallel, per-host rate limited)")
         print("=" * 80)
         
-        detailed_events = []
-        for i, event in enumerate(family_events, 1):
+        # Pass 1: event pages (in parallel)
+        def fetch_page(driver, indexed_event):
+            i, event = indexed_event
             print(f"\n[{i}/{len(family_events)}] Processing: {event['name']}")
             print(f"  URL: {event['url']}")
-            
-            result = self.get_event_details(event['url'], event['name'])
-            
+            return self._load_event_page(event['url'], event['name'], driver)
+        
+        page_results = self._parallel_map(fetch_page, list(enumerate(family_events, 1)))
+        
+        # Pass 2: sub-events found on listing pages (in parallel, across all listing pages)
+        sub_event_tasks = [
+            (i, sub_event_info)
+            for i, (kind, payload) in enumerate(page_results)
+            if kind == 'sub_events'
+            for sub_event_info in payload
+        ]
+        sub_event_results = self._parallel_map(
+            lambda driver, task: self._process_sub_event(task[1], driver), sub_event_tasks
+        )
+        
+        sub_events_by_page = {}
+        for (i, _), result in zip(sub_event_tasks, sub_event_results):
             if result:
+                # Result can be a single event or list of events (multiple locations)
+                sub_events_by_page.setdefault(i, []).extend(result if isinstance(result, list) else [result])
+        
+        # Reassemble in listing order
+        detailed_events = []
+        for i, (event, (kind, payload)) in enumerate(zip(family_events, page_results)):
+            if kind == 'sub_events':
+                payload = sub_events_by_page.get(i)
+            
+            if payload:
                 # Check if result is a list of sub-events or a single event
-                if isinstance(result, list):
+                if kind == 'sub_events':
                     # Sub-events found - add all of them, skip original
-                    print(f"  ✓ Added {len(result)} sub-events (original event deleted)")
-                    detailed_events.extend(result)
+                    print(f"  ✓ {event['name']}: added {len(payload)} sub-events (original event deleted)")
+                    detailed_events.extend(payload)
+                elif isinstance(payload, list):
+                    detailed_events.extend(payload)
+                    print(f"  ✓ {event['name']}: successfully extracted details")
                 else:
                     # Single event
-                    detailed_events.append(result)
-                    print(f"  ✓ Successfully extracted details")
+                    detailed_events.append(payload)
+                    print(f"  ✓ {event['name']}: successfully extracted details")
             else:
-                print(f"  ✗ No valid event found (might be 'No results found' page)")
-            
-            time.sleep(1.5)  # Be respectful to the server
+                print(f"  ✗ {event['name']}: no valid event found (might be 'No results found' page)")
         
         print(f"\n{'='*80}")
         print(f"FINAL SUMMARY:")
@@ -184,10 +224,17 @@ class LakeMacSeleniumScraper:
     def get_basic_events(self, url, wait_time=10, scroll_pages=3):
         """
         Get basic event info (title and URL only) from listing pages
+        Tries a plain HTTP fetch first and only drives the browser if the
+        listing markup isn't in the static HTML
         """
         try:
             print(f"  Fetching page: {url}")
-            self.driver.get(url)
+            self.host_limiter.wait(url)
+            soup = self.static_fetcher.fetch_soup(url, 'div.list-item-container article h2.list-item-title')
+            if soup is not None:
+                return self._parse_listing_soup(soup, url)
+            
+            self._polite_get(self.driver, url)
             
             # Wait for articles to be present
             try:
@@ -198,7 +245,7 @@ class LakeMacSeleniumScraper:
                 print("  ⚠ Timeout waiting for events to load")
                 return []
             
-            time.sleep(2)  # Let JS finish rendering
+            wait_for_dom_settled(self.driver)  # Let JS finish rendering
             
             # Find all event articles
             articles = self.driver.find_elements(By.CSS_SELECTOR, "div.list-item-container article")
@@ -234,7 +281,37 @@ class LakeMacSeleniumScraper:
             print(f"  Error scraping {url}: {e}")
             return []
     
-    def get_event_details(self, url, original_name):
+    def _parse_listing_soup(self, soup, url):
+        """Extract title + URL for each listing article from static HTML"""
+        articles = soup.select('div.list-item-container article')
+        print(f"  Found {len(articles)} event containers")
+        
+        events = []
+        seen_urls = set()
+        
+        for article in articles:
+            link_elem = article.find('a')
+            title_elem = link_elem.select_one('h2.list-item-title') if link_elem else None
+            if not title_elem:
+                continue
+            
+            name = title_elem.get_text(strip=True)
+            href = link_elem.get('href')
+            
+            if href and name and len(name) > 3:
+                full_url = urljoin(url, href)
+                
+                if full_url not in seen_urls and full_url != url:
+                    events.append({
+                        'name': name,
+                        'url': full_url
+                    })
+                    seen_urls.add(full_url)
+        
+        print(f"  Found {len(events)} events")
+        return events
+    
+    def get_event_details(self, url, original_name, driver=None):
         """
         Visit an event URL and extract detailed information
         Handles different page types:
@@ -247,17 +324,45 @@ class LakeMacSeleniumScraper:
         - Single event dict for direct event pages
         - List of event dicts if sub-events found (original event should be deleted)
         """
+        driver = driver or self.driver
+        kind, payload = self._load_event_page(url, original_name, driver)
+        
+        if kind != 'sub_events':
+            return payload
+        
+        # Process ALL sub-events and return them as a list
+        sub_events = []
+        for sub_event_info in payload:
+            result = self._process_sub_event(sub_event_info, driver)
+            if result:
+                # Result can be a single event or list of events (multiple locations)
+                if isinstance(result, list):
+                    sub_events.extend(result)
+                else:
+                    sub_events.append(result)
+        
+        # Return list to indicate sub-events found (caller should delete original)
+        return sub_events if sub_events else None
+    
+    def _load_event_page(self, url, original_name, driver):
+        """
+        Load an event URL and classify it without following sub-event links
+        Returns (kind, payload):
+        - ('none', None) if no results found or error
+        - ('event', event dict or list of dicts) for direct event pages
+        - ('sub_events', list of {'name', 'url'}) for listing pages
+        """
         try:
-            self.driver.get(url)
-            time.sleep(2)
+            self._polite_get(driver, url)
+            wait_for_page_ready(driver)
             
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
+            page_source = driver.page_source
+            soup = make_soup(page_source)
             
             # Check for "No results found"
             if self._check_no_results(soup):
                 print(f"    → 'No results found' - skipping")
-                return None
+                return 'none', None
             
             # Check if this is a listing page with multiple events
             event_links = self._find_event_listings(soup)
@@ -265,39 +370,32 @@ class LakeMacSeleniumScraper:
             if event_links:
                 print(f"    → Found {len(event_links)} sub-events, processing all...")
                 print(f"    → Original event will be replaced by sub-events")
-                # Process ALL sub-events and return them as a list
-                sub_events = []
-                for sub_event_info in event_links:
-                    result = self._process_sub_event(sub_event_info)
-                    if result:
-                        # Result can be a single event or list of events (multiple locations)
-                        if isinstance(result, list):
-                            sub_events.extend(result)
-                        else:
-                            sub_events.append(result)
-                
-                # Return list to indicate sub-events found (caller should delete original)
-                return sub_events if sub_events else None
+                return 'sub_events', event_links
             
             # This is a direct event page - extract details
             event = self._extract_event_details(soup, url, original_name)
-            return event
+            return 'event', event
             
         except Exception as e:
             print(f"    Error getting details: {e}")
-            return None
+            return 'none', None
     
     def _check_no_results(self, soup):
-        """Check if page shows 'No results found'"""
-        no_results_texts = [
-            'no results found',
-            'no events found',
-            '0 result',
-            'nothing found'
-        ]
+        """
+        Check if page shows 'No results found'
+        Only looks inside the main content (never header/footer/nav) and matches
+        text nodes one at a time instead of building the whole page's text
+        """
+        container = None
+        for selector in NO_RESULTS_CONTAINERS:
+            container = soup.select_one(selector)
+            if container:
+                break
         
-        page_text = soup.get_text().lower()
-        return any(text in page_text for text in no_results_texts)
+        return (container or soup).find(
+            string=lambda text: NO_RESULTS_RE.search(text) is not None
+            and text.find_parent(['header', 'footer', 'nav']) is None
+        ) is not None
     
     def _find_event_listings(self, soup):
         """
@@ -351,19 +449,20 @@ class LakeMacSeleniumScraper:
         
         return unique_links
     
-    def _process_sub_event(self, event_info):
+    def _process_sub_event(self, event_info, driver=None):
         """
         Process a sub-event by visiting its URL
         event_info: dict with 'name' and 'url'
         Returns single event dict or list of event dicts if multiple locations
         """
+        driver = driver or self.driver
         try:
             print(f"      → Visiting sub-event: {event_info['name']}")
-            self.driver.get(event_info['url'])
-            time.sleep(2)
+            self._polite_get(driver, event_info['url'])
+            wait_for_page_ready(driver)
             
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
+            page_source = driver.page_source
+            soup = make_soup(page_source)
             
             # Extract details using the sub-event's name and URL
             result = self._extract_event_details(soup, event_info['url'], event_info['name'])
@@ -411,7 +510,8 @@ class LakeMacSeleniumScraper:
             event['location'] = location
         
         # Check if we need to expand this into multiple date-specific events
-        expanded_events = self._expand_event_by_dates(event)
+        # (works from the soup already parsed for this page - no second page load)
+        expanded_events = self._expand_event_by_dates(event, soup)
         if expanded_events:
             return expanded_events
         
@@ -443,37 +543,18 @@ class LakeMacSeleniumScraper:
         
         return None
     
-    def _expand_event_by_dates(self, event):
+    def _expand_event_by_dates(self, event, soup):
         """
         If an event has multiple dates, expand it into separate events for each date
         Handles two cases:
         1. Multiple specific dates listed (creates one event per future date)
         2. Date range (creates events for first 7 days or until end date, whichever is sooner)
+        soup is the already-parsed event page the event was extracted from
         Returns list of events or None if single date
         """
-        # We need to check the original page for multi-date structure
-        # This requires re-visiting the page to get the multi-date-list
         try:
-            self.driver.get(event['url'])
-            time.sleep(1)
-            
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            # Look for multi-date-list container
-            multi_date_container = soup.find('div', class_='multi-date-list-container')
-            
-            if not multi_date_container:
-                return None
-            
-            # Find future events list
-            future_events = multi_date_container.find('ul', class_='future-events-list')
-            
-            if not future_events:
-                return None
-            
-            # Get all future date items
-            date_items = future_events.find_all('li', class_='multi-date-item')
+            # Parse all future date items from the multi-date-list container
+            date_items = future_occurrences(soup)
             
             if not date_items:
                 return None
@@ -507,28 +588,18 @@ class LakeMacSeleniumScraper:
     def _expand_date_range(self, base_event, date_item):
         """
         Expand a date range into multiple events (max 7 days), starting from today
+        date_item: DateOccurrence parsed from the multi-date-item
         """
-        from datetime import datetime, timedelta
-        
         try:
-            # Parse start and end dates from the event
-            start_year = int(date_item.get('data-start-year'))
-            start_month = int(date_item.get('data-start-month'))
-            start_day = int(date_item.get('data-start-day'))
-            start_hour = int(date_item.get('data-start-hour'))
-            start_mins = int(date_item.get('data-start-mins'))
-            
-            end_year = int(date_item.get('data-end-year'))
-            end_month = int(date_item.get('data-end-month'))
-            end_day = int(date_item.get('data-end-day'))
-            end_hour = int(date_item.get('data-end-hour'))
-            end_mins = int(date_item.get('data-end-mins'))
-            
-            start_date = datetime(start_year, start_month, start_day, start_hour, start_mins)
-            end_date = datetime(end_year, end_month, end_day, end_hour, end_mins)
+            if not date_item.has_time or date_item.end is None:
+                return None
+            
+            start_date = date_item.start
+            end_date = date_item.end
+            end_hour, end_mins = end_date.hour, end_date.minute
             
             # Use today's date as the effective start if the event starts in the past
-            today = datetime.today().replace(hour=start_hour, minute=start_mins, second=0, microsecond=0)
+            today = datetime.today().replace(hour=start_date.hour, minute=start_date.minute, second=0, microsecond=0)
             effective_start = max(start_date, today)
             
             # Calculate duration from effective start
@@ -568,21 +639,14 @@ class LakeMacSeleniumScraper:
     def _create_event_from_date_item(self, base_event, date_item):
         """
         Create a single event from a multi-date-item
+        date_item: DateOccurrence parsed from the multi-date-item
         """
-        from datetime import datetime
-        
         try:
-            start_year = int(date_item.get('data-start-year'))
-            start_month = int(date_item.get('data-start-month'))
-            start_day = int(date_item.get('data-start-day'))
-            start_hour = int(date_item.get('data-start-hour'))
-            start_mins = int(date_item.get('data-start-mins'))
-            
-            end_hour = int(date_item.get('data-end-hour'))
-            end_mins = int(date_item.get('data-end-mins'))
+            if not date_item.has_time or date_item.end is None:
+                return None
             
-            start_date = datetime(start_year, start_month, start_day, start_hour, start_mins)
-            end_time = datetime(start_year, start_month, start_day, end_hour, end_mins)
+            start_date = date_item.start
+            end_time = start_date.replace(hour=date_item.end.hour, minute=date_item.end.minute)
             
             when_text = f"{start_date.strftime('%A, %d %B %Y')} | {start_date.strftime('%I:%M %p')} - {end_time.strftime('%I:%M %p')}"
             
@@ -831,15 +895,16 @@ class LakeMacSeleniumScraper:
             # ALWAYS keep the original with its descriptive text
             expanded_events.append(event)
             
-            # Try to parse and create specific dated instances
-            recurring_dates = self._parse_recurring_pattern(when_text, today, one_month_from_now)
+            # Try to parse and create specific dated instances (always term-time)
+            rule = compile_rule(when_text, season=TERM)
+            recurring_dates = list(rule.between(today, one_month_from_now)) if rule.is_expandable else []
             
-            if recurring_dates and len(recurring_dates) > 0:
+            if recurring_dates:
                 print(f"  → Expanding recurring event: {event['name']}")
                 print(f"     Keeping original + adding {len(recurring_dates)} specific instances")
                 
                 # Create a separate event for each occurrence
-                for occurrence_date, time_str in recurring_dates:
+                for occurrence_date in recurring_dates:
                     new_event = event.copy()
                     # Format: "Tuesday, 12 November 2025, 11:00 AM - Every Tuesday 11am (excluding school holidays)"
                     specific_date_str = f"{occurrence_date.strftime('%A, %d %B %Y, %I:%M %p')}"
@@ -849,89 +914,12 @@ class LakeMacSeleniumScraper:
         
         return expanded_events
     
-    def _parse_recurring_pattern(self, when_text, today, end_date):
-        """
-        Parse recurring event pattern and generate list of occurrence dates
-        Only includes dates between today and end_date (30 days from now)
-        Returns: List of (date, time_string) tuples
-        """
-        # Day of week mapping
-        day_names = {
-            'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-            'friday': 4, 'saturday': 5, 'sunday': 6
-        }
-        
-        # Find the day of week
-        target_day = None
-        for day_name, day_num in day_names.items():
-            if day_name in when_text:
-                target_day = day_num
-                break
-        
-        if target_day is None:
-            return None
-        
-        # Find the time (e.g., "11am", "2:30pm", "10:00 am")
-        time_pattern = r'(\d{1,2})(?::(\d{2}))?\s*([ap]m)'
-        time_match = re.search(time_pattern, when_text)
-        
-        if not time_match:
-            return None
-        
-        hour = int(time_match.group(1))
-        minute = int(time_match.group(2)) if time_match.group(2) else 0
-        am_pm = time_match.group(3)
-        
-        # Convert to 24-hour format
-        if am_pm == 'pm' and hour != 12:
-            hour += 12
-        elif am_pm == 'am' and hour == 12:
-            hour = 0
-        
-        time_str = f"{hour:02d}:{minute:02d}"
-        time_display = f"{int(time_match.group(1)):02d}:{minute:02d} {am_pm.upper()}"
-        
-        # Get all term dates for current and next years
-        occurrences = []
-        
-        for year in [2025, 2026, 2027]:
-            if year not in SCHOOL_TERM_DATES:
-                continue
-            
-            terms = SCHOOL_TERM_DATES[year]["terms"]["eastern_nsw"]
-            
-            for term_name, start_str, end_str in terms:
-                term_start = datetime.strptime(start_str, "%Y-%m-%d").date()
-                term_end = datetime.strptime(end_str, "%Y-%m-%d").date()
-                
-                # Find all occurrences of target_day within this term
-                current_date = term_start
-                
-                # Move to first occurrence of target day
-                while current_date.weekday() != target_day:
-                    current_date += timedelta(days=1)
-                    if current_date > term_end:
-                        break
-                
-                # Add all occurrences of this day in the term
-                while current_date <= term_end:
-                    # Only include dates within our 30-day window
-                    if today <= current_date <= end_date:
-                        occurrence_datetime = datetime.combine(current_date, datetime.min.time())
-                        occurrence_datetime = occurrence_datetime.replace(hour=hour, minute=minute)
-                        occurrences.append((occurrence_datetime, time_display))
-                    
-                    current_date += timedelta(days=7)  # Next week
-        
-        return occurrences if occurrences else None
-    
     def _scroll_page(self, num_scrolls):
         """Scroll page to trigger lazy loading"""
         for i in range(num_scrolls):
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            wait_for_dom_settled(self.driver, quiet_ms=500, timeout=3)  # lazy-loaded items
         self.driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(1)
     
     def upload_to_supabase(self, events, supabase_url, supabase_key, table='events_lakemac'):
         """Upload events to Supabase"""
@@ -966,9 +954,11 @@ class LakeMacSeleniumScraper:
             print("-" * 80)
     
     def close(self):
-        """Close the browser"""
+        """Return the browser to its pool"""
+        self.static_fetcher.close()
         if self.driver:
-            self.driver.quit()
+            release_driver(self.driver_pool, self.driver)
+            self.driver = None
     
     def __enter__(self):
         return self
@@ -977,7 +967,7 @@ class LakeMacSeleniumScraper:
         self.close()
 
 
-def main():
+def main(driver_pool=None):
     import os
     
     print("Lake Macquarie Family/Kids Events Scraper")
@@ -1000,7 +990,12 @@ def main():
         print("ERROR: SUPABASE_URL and SUPABASE_KEY environment variables must be set")
         return None
     
-    with LakeMacSeleniumScraper(headless=True) as scraper:
+    # Detail-page parallelism and per-host politeness budget
+    detail_workers = int(os.getenv('LAKEMAC_DETAIL_WORKERS', '3'))
+    requests_per_second = float(os.getenv('LAKEMAC_REQUESTS_PER_SECOND', '1.0'))
+    
+    with LakeMacSeleniumScraper(headless=True, driver_pool=driver_pool, detail_workers=detail_workers,
+                                requests_per_second=requests_per_second) as scraper:
         events = scraper.get_all_events(wait_time=10, scroll_pages=3)
         
         if events:
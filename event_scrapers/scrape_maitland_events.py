@@ -1,49 +1,19 @@
 import requests
-from bs4 import BeautifulSoup
 import re
 import os
 from datetime import datetime, timedelta
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from supabase import create_client, Client
+from driver_pool import acquire_driver, release_driver
+from http_cache import HttpCache
+from html_parsing import make_soup, strainer
+from recurrence import TERM, compile_rule
 import time
 
-# School term dates for NSW
-SCHOOL_TERM_DATES = {
-    2025: {
-        "terms": {
-            "eastern_nsw": [
-                ("Term 1", "2025-02-06", "2025-04-11"),
-                ("Term 2", "2025-04-30", "2025-07-04"),
-                ("Term 3", "2025-07-22", "2025-09-26"),
-                ("Term 4", "2025-10-14", "2025-12-19"),
-            ]
-        }
-    },
-    2026: {
-        "terms": {
-            "eastern_nsw": [
-                ("Term 1", "2026-01-27", "2026-04-02"),
-                ("Term 2", "2026-04-20", "2026-07-03"),
-                ("Term 3", "2026-07-20", "2026-09-25"),
-                ("Term 4", "2026-10-12", "2026-12-17"),
-            ]
-        }
-    },
-    2027: {
-        "terms": {
-            "eastern_nsw": [
-                ("Term 1", "2027-01-28", "2027-04-09"),
-                ("Term 2", "2027-04-26", "2027-07-02"),
-                ("Term 3", "2027-07-19", "2027-09-24"),
-                ("Term 4", "2027-10-11", "2027-12-20"),
-            ]
-        }
-    }
-}
+# Sent by both the API session and the browser
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
 
 # Branch coordinates
 BRANCH_COORDINATES = {
@@ -54,118 +24,46 @@ BRANCH_COORDINATES = {
 }
 
 class CombinedMaitlandLibraryScraper:
-    def __init__(self, use_selenium=True):
+    def __init__(self, use_selenium=True, driver_pool=None):
         self.base_url = "https://www.maitlandlibrary.com.au"
         self.api_url = "https://maitlandapi.wpengine.com/wp-json/wp/v2/event?share_entity=1012&per_page=100&page=1&product_type=1184"
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            'User-Agent': USER_AGENT
         })
+        # Conditional GETs: pages/API results unchanged since the last run come back as 304
+        self.http = HttpCache(session=self.session)
         self.today = datetime.now()
         self.future_limit = self.today + timedelta(days=30)
         self.use_selenium = use_selenium
+        self.driver_pool = driver_pool
         self.driver = None
         
         if use_selenium:
             self.setup_selenium()
     
     def setup_selenium(self):
-        """Setup Selenium WebDriver"""
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-        
+        """Lease a Selenium WebDriver from the shared pool (or a private one)"""
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
+            self.driver_pool, self.driver = acquire_driver(self.driver_pool, user_agent=USER_AGENT, blocking='full')
             print("✓ Selenium WebDriver initialized")
         except Exception as e:
             print(f"⚠ Could not initialize Selenium: {e}")
             self.use_selenium = False
     
     def close_selenium(self):
-        """Close Selenium WebDriver"""
+        """Return Selenium WebDriver to its pool"""
         if self.driver:
-            self.driver.quit()
-    
-    def get_term_dates_for_day(self, day_of_week):
-        """Get all future dates for a specific day of week within term times"""
-        days_map = {
-            'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-            'friday': 4, 'saturday': 5, 'sunday': 6
-        }
-        
-        target_weekday = days_map.get(day_of_week.lower())
-        if target_weekday is None:
-            return []
-        
-        dates = []
-        for year, data in SCHOOL_TERM_DATES.items():
-            for term_name, start_str, end_str in data['terms']['eastern_nsw']:
-                start_date = datetime.strptime(start_str, '%Y-%m-%d')
-                end_date = datetime.strptime(end_str, '%Y-%m-%d')
-                
-                # Find first occurrence of target weekday in term
-                current = start_date
-                while current.weekday() != target_weekday:
-                    current += timedelta(days=1)
-                    if current > end_date:
-                        break
-                
-                # Add all occurrences of this weekday in the term
-                while current <= end_date:
-                    if self.today <= current <= self.future_limit:
-                        dates.append(current)
-                    current += timedelta(days=7)
-        
-        return sorted(dates)
-    
-    def parse_time(self, time_str):
-        """Parse time string like '10am' or '3.30 - 4.30pm'"""
-        time_str = time_str.strip().lower()
-        
-        # Handle range (take start time)
-        if '-' in time_str:
-            time_str = time_str.split('-')[0].strip()
-        
-        # Parse time
-        try:
-            # Remove spaces
-            time_str = time_str.replace(' ', '')
-            
-            # Handle formats like "10am" or "3.30pm"
-            if 'am' in time_str or 'pm' in time_str:
-                is_pm = 'pm' in time_str
-                time_str = time_str.replace('am', '').replace('pm', '')
-                
-                if '.' in time_str:
-                    hour, minute = time_str.split('.')
-                    hour = int(hour)
-                    minute = int(minute)
-                else:
-                    hour = int(time_str)
-                    minute = 0
-                
-                # Convert to 24-hour
-                if is_pm and hour != 12:
-                    hour += 12
-                elif not is_pm and hour == 12:
-                    hour = 0
-                
-                return hour, minute
-        except:
-            pass
-        
-        return 0, 0
+            release_driver(self.driver_pool, self.driver)
+            self.driver = None
     
     def scrape_recurring_page(self, url, default_event_name=None):
         """Scrape pages with recurring events (storytime, baby bounce, lego club)"""
         print(f"\nScraping recurring events: {url}")
-        response = self.session.get(url)
+        response = self.http.get(url)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = make_soup(response.content, only=strainer('div', class_='node__content'))
         events = []
         
         # Find main content
@@ -252,39 +150,27 @@ class CombinedMaitlandLibraryScraper:
             day_text = cells[1].get_text(strip=True)
             time_text = cells[2].get_text(strip=True)
             
-            # Handle multiple days (e.g., "Thursday & Friday")
-            days = []
-            if '&' in day_text:
-                days = [d.strip() for d in day_text.split('&')]
-            else:
-                days = [day_text]
+            # One rule per distinct "Thursday & Friday" / "3.30 - 4.30pm" pair;
+            # tables repeat the same sessions across branches, so most are cache hits
+            rule = compile_rule(f"{day_text} {time_text}", season=TERM)
             
-            for day in days:
-                # Get all future dates for this day
-                dates = self.get_term_dates_for_day(day)
+            # Create event for each future in-term session
+            for event_datetime in rule.between(self.today, self.future_limit):
+                event = {
+                    'title': event_name,
+                    'url': event_url,
+                    'location': branch,
+                    'event_datetime': event_datetime.isoformat(),
+                    'event_date_text': event_datetime.strftime('%A, %d %B %Y | %I:%M %p'),
+                    'event_type': 'recurring_term_time'
+                }
                 
-                # Parse time
-                hour, minute = self.parse_time(time_text)
+                # Add coordinates if branch is known
+                if branch in BRANCH_COORDINATES:
+                    event['latitude'] = BRANCH_COORDINATES[branch]['latitude']
+                    event['longitude'] = BRANCH_COORDINATES[branch]['longitude']
                 
-                # Create event for each date
-                for date in dates:
-                    event_datetime = date.replace(hour=hour, minute=minute)
-                    
-                    event = {
-                        'title': event_name,
-                        'url': event_url,
-                        'location': branch,
-                        'event_datetime': event_datetime.isoformat(),
-                        'event_date_text': event_datetime.strftime('%A, %d %B %Y | %I:%M %p'),
-                        'event_type': 'recurring_term_time'
-                    }
-                    
-                    # Add coordinates if branch is known
-                    if branch in BRANCH_COORDINATES:
-                        event['latitude'] = BRANCH_COORDINATES[branch]['latitude']
-                        event['longitude'] = BRANCH_COORDINATES[branch]['longitude']
-                    
-                    events.append(event)
+                events.append(event)
         
         return events
     
@@ -293,7 +179,7 @@ class CombinedMaitlandLibraryScraper:
         print(f"\nScraping school holiday events from API...")
         
         try:
-            response = self.session.get(self.api_url)
+            response = self.http.get(self.api_url)
             response.raise_for_status()
             api_events = response.json()
             
@@ -376,6 +262,7 @@ class CombinedMaitlandLibraryScraper:
         finally:
             # Always close Selenium
             self.close_selenium()
+            self.http.report()
         
         # Sort all events by datetime
         all_events.sort(key=lambda x: x['event_datetime'])
@@ -420,8 +307,8 @@ class CombinedMaitlandLibraryScraper:
             print("⚠ No events to upload")
 
 
-def main():
-    scraper = CombinedMaitlandLibraryScraper()
+def main(driver_pool=None):
+    scraper = CombinedMaitlandLibraryScraper(driver_pool=driver_pool)
     events = scraper.scrape_all()
     
     # Get Supabase credentials from environment
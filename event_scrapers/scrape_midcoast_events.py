@@ -1,7 +1,5 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
@@ -11,6 +9,12 @@ import time
 import re
 import os
 from supabase import create_client, Client
+from driver_pool import acquire_driver, release_driver
+from static_fetch import StaticPageFetcher
+from page_waits import wait_for_page_ready
+from keyword_matcher import FAMILY_KEYWORDS, KeywordMatcher
+from cms_dates import future_occurrences
+from html_parsing import make_soup, strainer
 
 # Venue coordinates
 VENUE_COORDINATES = {
@@ -24,35 +28,39 @@ VENUE_COORDINATES = {
     'Gloucester Library': {'latitude': -32.0073153, 'longitude': 151.9562654},
 }
 
-FAMILY_KEYWORDS = [
-    'family', 'toddler', 'babies', 'baby', 'bubs', 'bubba', 'mummabubba',
-    'kids', 'teen', 'art starter', 'art play', 'art explorers', 'storytime',
-    'rhymetime', 'dungeons', 'lego', 'code', 'stem', 'steam', 'children',
-    'school holiday', 'playgroup', 'rock', 'rhyme', 'story stomp'
-]
-
 class SeleniumLibraryScraper:
-    def __init__(self, base_url, filter_words=None, headless=True):
+    def __init__(self, base_url, filter_words=None, headless=True, driver_pool=None):
         self.base_url = base_url
         self.filter_words = [w.lower() for w in filter_words] if filter_words else []
+        self.filter_matcher = KeywordMatcher(self.filter_words)
         self.events = []
 
-        options = Options()
-        if headless:
-            options.add_argument('--headless=new')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--no-sandbox')
-        options.add_argument("--window-size=1920,1080")
-        self.driver = webdriver.Chrome(options=options)
+        # Listing pages are tried over plain HTTP first; the browser is only
+        # leased the first time a page actually needs it
+        self.static_fetcher = StaticPageFetcher()
+        self.headless = headless
+        self.driver_pool = driver_pool
+        self._driver = None
+
+    @property
+    def driver(self):
+        """Lease a browser on first use"""
+        if self._driver is None:
+            # Keep CSS: listing titles are read with WebElement.text, which depends on styles
+            self.driver_pool, self._driver = acquire_driver(self.driver_pool, headless=self.headless, blocking='light')
+        return self._driver
 
     def contains_filter_word(self, title):
         if not self.filter_words:
             return True
-        title_lower = title.lower()
-        return any(word in title_lower for word in self.filter_words)
+        return self.filter_matcher.matches(title)
 
     def get_all_event_links(self):
         print(f"Fetching page: {self.base_url}")
+        soup = self.static_fetcher.fetch_soup(self.base_url, 'div.grid article h2.list-item-title')
+        if soup is not None:
+            return self.parse_event_links(soup)
+
         self.driver.get(self.base_url)
 
         try:
@@ -83,45 +91,52 @@ class SeleniumLibraryScraper:
                 continue
         return event_links
 
-    def parse_date_from_li(self, li):
-        year = li.get_attribute('data-start-year')
-        month = li.get_attribute('data-start-month')
-        day = li.get_attribute('data-start-day')
-        hour = li.get_attribute('data-start-hour')
-        mins = li.get_attribute('data-start-mins')
-        if not all([year, month, day, hour, mins]):
-            return None
-        dt = datetime(int(year), int(month), int(day), int(hour), int(mins))
-        time_str = f"{hour.zfill(2)}:{mins.zfill(2)}"
-        return {'datetime_obj': dt, 'time_str': time_str, 'date_str': dt.strftime("%A, %d %B %Y")}
+    def parse_event_links(self, soup):
+        """Same as the Selenium listing pass, from static HTML"""
+        articles = soup.select("div.grid article")
+        print(f"Found {len(articles)} events on page")
+        event_links = []
+
+        for article in articles:
+            link_elem = article.find('a')
+            title_elem = link_elem.select_one('h2.list-item-title') if link_elem else None
+            if not title_elem or not link_elem.get('href'):
+                continue
+            title = title_elem.get_text(strip=True)
+            event_url = urljoin(self.base_url, link_elem['href'])
+
+            if self.contains_filter_word(title):
+                event_links.append({'title': title, 'url': event_url})
+                print(f"  ✓ {title}")
+        return event_links
 
     def get_event_details(self, event_url, event_title):
         self.driver.get(event_url)
-        time.sleep(1.5)  # let JS render
+        wait_for_page_ready(self.driver)  # let JS render
+        # One page_source read, then parse offline instead of per-field WebDriver calls
+        soup = make_soup(self.driver.page_source, only=strainer('div', class_='multi-location-item'))
         all_instances = []
-        location_items = self.driver.find_elements(By.CSS_SELECTOR, "div.multi-location-item")
         today = datetime.now()
 
-        for loc_item in location_items:
-            try:
-                location = loc_item.find_element(By.TAG_NAME, 'h3').text
-                location = re.split(r',\s*\xa0|,', location)[0].strip()
-                date_items = loc_item.find_elements(By.CSS_SELECTOR, 'ul.future-events-list li.multi-date-item')
-                for date_li in date_items:
-                    parsed = self.parse_date_from_li(date_li)
-                    if parsed and parsed['datetime_obj'] >= today:
-                        dt_obj = parsed['datetime_obj']
-                        start_dt = f"{dt_obj.strftime('%Y-%m-%d')}T{parsed['time_str']}"
-                        all_instances.append({
-                            'title': event_title,
-                            'url': event_url,
-                            'location': location,
-                            'date': parsed['date_str'],
-                            'time': parsed['time_str'],
-                            'start_datetime': start_dt
-                        })
-            except Exception:
+        for loc_item in soup.select("div.multi-location-item"):
+            heading = loc_item.find('h3')
+            if not heading:
                 continue
+            location = heading.get_text(strip=True)
+            location = re.split(r',\s*\xa0|,', location)[0].strip()
+            for occurrence in future_occurrences(loc_item):
+                if not occurrence.has_time or occurrence.start < today:
+                    continue
+                dt_obj = occurrence.start
+                time_str = dt_obj.strftime('%H:%M')
+                all_instances.append({
+                    'title': event_title,
+                    'url': event_url,
+                    'location': location,
+                    'date': dt_obj.strftime("%A, %d %B %Y"),
+                    'time': time_str,
+                    'start_datetime': f"{dt_obj.strftime('%Y-%m-%d')}T{time_str}"
+                })
         return all_instances
 
     def scrape_all(self, delay=1.5):
@@ -152,6 +167,13 @@ class SeleniumLibraryScraper:
                 e['latitude'] = None
                 e['longitude'] = None
 
+    def close(self):
+        """Return the browser to its pool"""
+        self.static_fetcher.close()
+        if self._driver:
+            release_driver(self.driver_pool, self._driver)
+            self._driver = None
+
     def upload_to_supabase(self, supabase_url, supabase_key, table='events_midcoast'):
         if not self.events:
             print("No events to upload.")
@@ -166,10 +188,14 @@ class SeleniumLibraryScraper:
         print(f"Uploaded {len(clean)} records to {table}")
 
 
-def main():
+def main(driver_pool=None):
     BASE_URL = "https://library.midcoast.nsw.gov.au/Whats-on"
-    scraper = SeleniumLibraryScraper(BASE_URL, filter_words=FAMILY_KEYWORDS)
-    scraper.scrape_all()
+    scraper = SeleniumLibraryScraper(BASE_URL, filter_words=FAMILY_KEYWORDS, driver_pool=driver_pool)
+    try:
+        scraper.scrape_all()
+    finally:
+        # Browser is not needed for the upload
+        scraper.close()
     scraper.add_coordinates()
 
     supabase_url = os.environ.get('SUPABASE_URL')
@@ -179,8 +205,6 @@ def main():
     else:
         print("⚠ Supabase credentials missing. Skipping upload.")
 
-    scraper.driver.quit()
-
 
 if __name__ == "__main__":
     main()
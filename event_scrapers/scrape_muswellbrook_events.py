@@ -1,68 +1,93 @@
 import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
 import os
 import time
 from supabase import create_client, Client
+from keyword_matcher import FAMILY_KEYWORDS, KeywordMatcher
+from http_cache import HttpCache
+from page_fingerprint import FingerprintStore
+from concurrent_fetch import ConcurrentFetcher
+from html_parsing import PARSER, make_soup, strainer
 
-def extract_event_details(event_url):
+# Bump when parse_event_details changes so stored records are re-parsed
+# (the HTML parser backend is part of the fingerprint version too)
+PARSER_REVISION = '2'
+
+def extract_event_details(event_url, http=None, fingerprints=None):
     """
     Visit an individual event page and extract datetime and location details
+    http: HttpCache to fetch through (plain requests if omitted)
+    fingerprints: FingerprintStore; an unchanged page reuses last run's details
     """
     try:
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
-        response = requests.get(event_url, headers=headers)
+        if http:
+            response = http.get(event_url)
+        else:
+            response = requests.get(event_url, headers=headers)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Find the event details box
-        details_box = soup.find('div', class_='event-details-box')
-        
-        if not details_box:
-            return None, None, None
-        
-        # Extract datetime
-        datetime_str = None
-        date_start = details_box.find('span', class_='tribe-event-date-start')
-        
-        if date_start:
-            date_text = date_start.text.strip()
-            # Parse format like "November 13 @ 10:00 am"
-            try:
-                # Remove the @ symbol and parse
-                date_text = date_text.replace(' @ ', ' ')
-                event_datetime = datetime.strptime(date_text, '%B %d %I:%M %p')
-                # Add current year (or you could extract it from the page)
-                event_datetime = event_datetime.replace(year=datetime.now().year)
-                datetime_str = event_datetime.strftime('%Y-%m-%d %H:%M')
-            except:
-                # If parsing fails, just store the raw text
-                datetime_str = date_text
-        
-        # Extract location name
-        location_name = None
-        location_link = details_box.find('a', href=lambda x: x and '/venue/' in x)
-        if location_link:
-            location_name = location_link.text.strip()
-        
-        # Extract description from the main content
-        description = None
-        content_div = soup.find('div', class_='tribe-events-single-event-description')
-        if content_div:
-            # Get text from paragraphs
-            paragraphs = content_div.find_all('p')
-            if paragraphs:
-                description = ' '.join([p.text.strip() for p in paragraphs if p.text.strip()])
-        
-        return datetime_str, location_name, description
+        if fingerprints is None:
+            return parse_event_details(response.content)
+        details = fingerprints.get_or_parse(
+            event_url, response.content, lambda: list(parse_event_details(response.content))
+        )
+        return tuple(details)
         
     except Exception as e:
         print(f"Error extracting details from {event_url}: {e}")
         return None, None, None
 
+def parse_event_details(content):
+    """
+    Parse datetime, location name and description from an event page
+    """
+    # Only the details box and description are read
+    soup = make_soup(content, only=strainer('div', class_=['event-details-box', 'tribe-events-single-event-description']))
+    
+    # Find the event details box
+    details_box = soup.find('div', class_='event-details-box')
+    
+    if not details_box:
+        return None, None, None
+    
+    # Extract datetime
+    datetime_str = None
+    date_start = details_box.find('span', class_='tribe-event-date-start')
+    
+    if date_start:
+        date_text = date_start.text.strip()
+        # Parse format like "November 13 @ 10:00 am"
+        try:
+            # Remove the @ symbol and parse
+            date_text = date_text.replace(' @ ', ' ')
+            event_datetime = datetime.strptime(date_text, '%B %d %I:%M %p')
+            # Add current year (or you could extract it from the page)
+            event_datetime = event_datetime.replace(year=datetime.now().year)
+            datetime_str = event_datetime.strftime('%Y-%m-%d %H:%M')
+        except:
+            # If parsing fails, just store the raw text
+            datetime_str = date_text
+    
+    # Extract location name
+    location_name = None
+    location_link = details_box.find('a', href=lambda x: x and '/venue/' in x)
+    if location_link:
+        location_name = location_link.text.strip()
+    
+    # Extract description from the main content
+    description = None
+    content_div = soup.find('div', class_='tribe-events-single-event-description')
+    if content_div:
+        # Get text from paragraphs
+        paragraphs = content_div.find_all('p')
+        if paragraphs:
+            description = ' '.join([p.text.strip() for p in paragraphs if p.text.strip()])
+    
+    return datetime_str, location_name, description
+
 def get_location_coordinates(location_name):
     """
     Map location names to their coordinates
@@ -95,18 +120,18 @@ def scrape_muswellbrook_library_events():
     base_url = "https://libraries.muswellbrook.nsw.gov.au/whats-on/"
     
     # Keywords to filter events
-    keywords = [
-        'family', 'toddler', 'babies', 'baby', 'bubs', 'bubba', 'mummabubba',
-        'kids', 'teen', 'art starter', 'art play', 'art explorers', 'storytime',
-        'rhymetime', 'dungeons', 'lego', 'code', 'stem', 'steam', 'children',
-        'school holiday', 'playgroup', 'rock', 'rhyme', 'story stomp', 'little ones',
-        'story time', 'craft'
-    ]
+    keyword_matcher = KeywordMatcher(FAMILY_KEYWORDS + ['little ones', 'story time', 'craft'])
     
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
     }
     
+    # Pages unchanged since the last run are revalidated (304) instead of re-downloaded
+    http = HttpCache(headers=headers)
+    # Detail pages identical to last run reuse last run's parsed details
+    # (keyed by year too: the parser stamps the current year onto dates)
+    fingerprints = FingerprintStore('muswellbrook', version=f'{datetime.now().year}-{PARSER}-{PARSER_REVISION}')
+    
     all_event_links = []
     page_num = 1
     
@@ -121,10 +146,10 @@ def scrape_muswellbrook_library_events():
                 url = f"{base_url}page/{page_num}/"
             
             print(f"Fetching page {page_num}...")
-            response = requests.get(url, headers=headers)
+            response = http.get(url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content, only=strainer(['div', 'button'], class_=['card', 'pagination__button']))
             
             # Find all event cards
             event_cards = soup.find_all('div', class_='card')
@@ -141,7 +166,7 @@ def scrape_muswellbrook_library_events():
                     event_url = title_link.get('href')
                     
                     # Check if title contains any keyword
-                    if any(keyword.lower() in title.lower() for keyword in keywords):
+                    if keyword_matcher.matches(title):
                         all_event_links.append({
                             'title': title,
                             'url': event_url
@@ -162,12 +187,19 @@ def scrape_muswellbrook_library_events():
     
     print(f"\nFound {len(all_event_links)} matching events. Fetching details...")
     
-    # Now visit each event page to get full details
+    # Now visit the event pages in parallel, rate limited per host
+    fetcher = ConcurrentFetcher.for_source('muswellbrook', max_workers=4, requests_per_second=2.0)
+    details = fetcher.map(
+        lambda event_link: extract_event_details(event_link['url'], http, fingerprints),
+        all_event_links,
+        url_of=lambda event_link: event_link['url'],
+    )
+    
     events = []
-    for i, event_link in enumerate(all_event_links, 1):
+    for i, (event_link, event_details) in enumerate(zip(all_event_links, details), 1):
         print(f"Processing event {i}/{len(all_event_links)}: {event_link['title']}")
         
-        datetime_str, location_name, description = extract_event_details(event_link['url'])
+        datetime_str, location_name, description = event_details or (None, None, None)
         
         # Get location coordinates
         location_data = get_location_coordinates(location_name)
@@ -183,8 +215,10 @@ def scrape_muswellbrook_library_events():
         }
         
         events.append(event)
-        time.sleep(0.5)  # Be polite between requests
     
+    http.report()
+    http.close()
+    fingerprints.save()
     return events
 
 def upload_to_supabase(events, supabase_url, supabase_key, table='events_muswellbrook'):
@@ -1,12 +1,15 @@
 import requests
-from bs4 import BeautifulSoup
 import json
-import time
 from datetime import datetime
 from typing import List, Dict
 import re
 import os
 from supabase import create_client, Client
+from keyword_matcher import FAMILY_KEYWORDS, KeywordMatcher
+from http_cache import HttpCache
+from page_fingerprint import FingerprintStore
+from concurrent_fetch import ConcurrentFetcher
+from html_parsing import PARSER, make_soup, strainer
 
 # Venue mapping with coordinates
 VENUE_COORDINATES = {
@@ -14,35 +17,64 @@ VENUE_COORDINATES = {
     'Wallsend Library': {'latitude': -32.9020955, 'longitude': 151.665831},
 }
 
+# Bump when parse_event_details changes so stored records are re-parsed
+# (the HTML parser backend is part of the fingerprint version too)
+PARSER_REVISION = '2'
+
+# Link text that says nothing about the event it points to
+GENERIC_LINK_TEXT = {
+    '', 'read more', 'more info', 'more information', 'find out more', 'learn more',
+    'view event', 'view details', 'details', 'book now', 'register', 'register now',
+}
+
 class NewcastleEventsScraper:
-    def __init__(self, delay=1):
+    def __init__(self, delay=1, max_workers=4):
         self.base_url = "https://newcastlelibraries.com.au"
         self.events_url = f"{self.base_url}/experience/what-s-on/what-s-on-events-calendar"
         self.headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
         self.delay = delay
+        # Detail pages are fetched in parallel; delay becomes a per-host rate (1 request per delay seconds)
+        self.fetcher = ConcurrentFetcher.for_source(
+            'newcastle', max_workers=max_workers, requests_per_second=1 / delay if delay else 10
+        )
+        # Pages unchanged since the last run are revalidated (304) instead of re-downloaded
+        self.http = HttpCache(headers=self.headers)
+        # Detail pages identical to last run reuse last run's parsed record
+        self.fingerprints = FingerprintStore('newcastle', version=f'{PARSER}-{PARSER_REVISION}')
 
-        self.family_keywords = [
-            'family', 'toddler', 'babies', 'baby', 'bubs', 'bubba', 'mummabubba',
-            'kids', 'teen', 'art starter', 'art play', 'art explorers', 'storytime',
-            'rhymetime', 'dungeons', 'lego', 'code', 'stem', 'steam', 'children',
-            'school holiday', 'playgroup', 'rock', 'rhyme', 'story stomp'
-        ]
+        self.family_keywords = list(FAMILY_KEYWORDS)
+        self.keyword_matcher = KeywordMatcher(self.family_keywords)
 
     def is_family_event(self, title: str) -> bool:
-        return any(keyword in title.lower() for keyword in self.family_keywords)
+        return self.keyword_matcher.matches(title)
 
     def get_event_urls(self) -> List[str]:
+        return [listing['url'] for listing in self.get_event_listings()]
+
+    def get_event_listings(self) -> List[Dict]:
+        """
+        Event URLs from the calendar with the best listing title for each
+        title is None when every link to the event is an image or generic text ("Read more")
+        """
         try:
-            response = requests.get(self.events_url, headers=self.headers)
+            response = self.http.get(self.events_url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            urls = set()
+            # Only links are read from the calendar
+            soup = make_soup(response.content, only=strainer('a', href=True))
+            titles = {}
             for link in soup.find_all('a', href=True):
                 href = link['href']
                 if '/what-s-on-events-calendar/' in href and href != '/experience/what-s-on/what-s-on-events-calendar':
                     full_url = f"{self.base_url}{href}" if href.startswith('/') else href
-                    urls.add(full_url)
-            return sorted(list(urls))
+                    title = link.get_text(' ', strip=True) or link.get('title', '').strip()
+                    if title.lower() in GENERIC_LINK_TEXT:
+                        title = ''
+                    # Several links can point at one event (image, heading, "Read more"): keep the longest text
+                    if len(title) > len(titles.get(full_url) or ''):
+                        titles[full_url] = title
+                    else:
+                        titles.setdefault(full_url, '')
+            return [{'url': url, 'title': titles[url] or None} for url in sorted(titles)]
         except requests.RequestException as e:
             print(f"Error fetching event URLs: {e}")
             return []
@@ -97,52 +129,57 @@ class NewcastleEventsScraper:
 
     def scrape_event_details(self, event_url: str) -> Dict:
         try:
-            response = requests.get(event_url, headers=self.headers)
+            response = self.http.get(event_url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            event = {'url': event_url, 'title': '', 'dates': [], 'location': ''}
-
-            # Title
-            title_tag = soup.find('h1')
-            if title_tag:
-                event['title'] = title_tag.get_text(strip=True)
-
-            # Dates
-            event['dates'] = self.extract_calendar_dates(soup) or self.extract_panel_dates(soup)
-
-            # Look for location in structured data (dl/dt/dd)
-            dl_tags = soup.find_all('dl')
-            for dl in dl_tags:
-                for dt, dd in zip(dl.find_all('dt'), dl.find_all('dd')):
-                    label = dt.get_text(strip=True).lower()
-                    value = dd.get_text(strip=True)
-                    if 'location' in label or 'where' in label or 'venue' in label:
-                        event['location'] = value
-
-            # Alternative selectors
-            if not event['location']:
-                divs = soup.find_all('div', class_=re.compile(r'field|event|info|detail', re.I))
-                for div in divs:
-                    label_tag = div.find(['dt', 'label', 'strong', 'span'], class_=re.compile(r'label|title', re.I))
-                    if label_tag:
-                        label = label_tag.get_text(strip=True).lower()
-                        value_tag = div.find(['dd', 'span', 'div', 'p'])
-                        if value_tag and value_tag != label_tag:
-                            value = value_tag.get_text(strip=True)
-                            if ('location' in label or 'where' in label) and not event['location']:
-                                event['location'] = value
-
-            # Fallback from title
-            if not event['location'] and event['title']:
-                match = re.search(r'-\s*([^-]+Library)', event['title'])
-                if match:
-                    event['location'] = match.group(1).strip()
-
-            return event
+            return self.fingerprints.get_or_parse(
+                event_url, response.content, lambda: self.parse_event_details(event_url, response.content)
+            )
         except requests.RequestException:
             return {'url': event_url, 'error': 'Failed to load'}
 
+    def parse_event_details(self, event_url: str, content: bytes) -> Dict:
+        soup = make_soup(content)
+
+        event = {'url': event_url, 'title': '', 'dates': [], 'location': ''}
+
+        # Title
+        title_tag = soup.find('h1')
+        if title_tag:
+            event['title'] = title_tag.get_text(strip=True)
+
+        # Dates
+        event['dates'] = self.extract_calendar_dates(soup) or self.extract_panel_dates(soup)
+
+        # Look for location in structured data (dl/dt/dd)
+        dl_tags = soup.find_all('dl')
+        for dl in dl_tags:
+            for dt, dd in zip(dl.find_all('dt'), dl.find_all('dd')):
+                label = dt.get_text(strip=True).lower()
+                value = dd.get_text(strip=True)
+                if 'location' in label or 'where' in label or 'venue' in label:
+                    event['location'] = value
+
+        # Alternative selectors
+        if not event['location']:
+            divs = soup.find_all('div', class_=re.compile(r'field|event|info|detail', re.I))
+            for div in divs:
+                label_tag = div.find(['dt', 'label', 'strong', 'span'], class_=re.compile(r'label|title', re.I))
+                if label_tag:
+                    label = label_tag.get_text(strip=True).lower()
+                    value_tag = div.find(['dd', 'span', 'div', 'p'])
+                    if value_tag and value_tag != label_tag:
+                        value = value_tag.get_text(strip=True)
+                        if ('location' in label or 'where' in label) and not event['location']:
+                            event['location'] = value
+
+        # Fallback from title
+        if not event['location'] and event['title']:
+            match = re.search(r'-\s*([^-]+Library)', event['title'])
+            if match:
+                event['location'] = match.group(1).strip()
+
+        return event
+
     def parse_time_to_datetime(self, date_str, time_str):
         if not date_str or not time_str:
             return date_str
@@ -185,20 +222,35 @@ class NewcastleEventsScraper:
 
         return expanded or [event]
 
-    def scrape_all_events(self, expand_dates=True, filter_family=True, filter_past=True) -> List[Dict]:
-        urls = self.get_event_urls()
+    def scrape_all_events(self, expand_dates=True, filter_family=True, filter_past=True,
+                          verify_detail_title=True) -> List[Dict]:
+        """
+        filter_family: only fetch detail pages whose listing title looks family-related
+                       (listings without a usable title are always fetched)
+        verify_detail_title: also check the detail page <h1> before keeping an event
+        """
+        listings = self.get_event_listings()
+        if filter_family:
+            candidates = [l for l in listings if l['title'] is None or self.is_family_event(l['title'])]
+            print(f"{len(candidates)}/{len(listings)} calendar entries are family candidates")
+        else:
+            candidates = listings
+
+        details = self.fetcher.map(self.scrape_event_details, [l['url'] for l in candidates])
+
         all_events = []
-        for url in urls:
-            event = self.scrape_event_details(url)
-            if 'error' in event:
+        for listing, event in zip(candidates, details):
+            if event is None or 'error' in event:
                 continue
-            if filter_family and not self.is_family_event(event['title']):
+            if filter_family and (verify_detail_title or listing['title'] is None) \
+                    and not self.is_family_event(event['title']):
                 continue
             if expand_dates:
                 all_events.extend(self.expand_event_dates(event, filter_past))
             else:
                 all_events.append(event)
-            time.sleep(self.delay)
+        self.http.report()
+        self.fingerprints.save()
         return all_events
 
     def save_to_json(self, events, filename='newcastle_events.json'):
@@ -218,7 +270,10 @@ class NewcastleEventsScraper:
 
 def main():
     scraper = NewcastleEventsScraper(delay=1)
-    events = scraper.scrape_all_events()
+    try:
+        events = scraper.scrape_all_events()
+    finally:
+        scraper.http.close()
     scraper.save_to_json(events)
 
     supabase_url = os.environ.get('SUPABASE_URL')
@@ -1,19 +1,20 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from selenium.webdriver.chrome.options import Options
 from supabase import create_client, Client
-import time
+from driver_pool import acquire_driver, release_driver
+from page_waits import wait_for_dom_settled, wait_for_count_change
+from bulk_extract import extract_cards
 import os
 import re
 from datetime import datetime, timedelta
 
 
 class PlaygroupScraper:
-    def __init__(self):
+    def __init__(self, driver_pool=None):
         self.events = []
+        self.driver_pool = driver_pool
     
     def parse_time_to_datetime(self, day_name, time_info):
         """
@@ -93,15 +94,9 @@ class PlaygroupScraper:
         Args:
             url: The playgroup search results URL
         """
-        # Set up Chrome driver for GitHub Actions
-        options = Options()
-        options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--window-size=1920,1080')
-        
-        driver = webdriver.Chrome(options=options)
+        # Lease a Chrome driver (shared pool in batch runs, private one otherwise)
+        # Keep CSS: the Load More loop relies on is_displayed()
+        pool, driver = acquire_driver(self.driver_pool, blocking='light')
         
         try:
             print(f"Loading URL: {url}")
@@ -114,8 +109,8 @@ class PlaygroupScraper:
             # Click "Load More" button until no more results
             while True:
                 try:
-                    # Wait a bit for content to load
-                    time.sleep(2)
+                    # Wait for content to load
+                    wait_for_dom_settled(driver)
                     
                     # Try to find and click the "Load More" button
                     load_more_btn = driver.find_element(By.ID, "playgroup-filter__results-list-loadmore-btn")
@@ -123,8 +118,12 @@ class PlaygroupScraper:
                     # Check if button is visible and enabled
                     if load_more_btn.is_displayed() and load_more_btn.is_enabled():
                         print("Clicking 'Load More' button...")
+                        loaded = len(driver.find_elements(By.CLASS_NAME, "playgroup-filter__results-list-item"))
                         driver.execute_script("arguments[0].click();", load_more_btn)
-                        time.sleep(2)  # Wait for new content to load
+                        # Wait for new content to load
+                        if not wait_for_count_change(driver, "playgroup-filter__results-list-item", loaded, by=By.CLASS_NAME):
+                            print("'Load More' returned no new results, finished loading.")
+                            break
                     else:
                         print("'Load More' button not clickable, finished loading.")
                         break
@@ -136,69 +135,73 @@ class PlaygroupScraper:
                     print(f"Error clicking 'Load More': {e}")
                     break
             
-            # Now scrape all the events
+            # Now scrape all the events (every card's fields in one round-trip)
             print("Scraping events...")
-            event_elements = driver.find_elements(By.CLASS_NAME, "playgroup-filter__results-list-item")
-            print(f"Found {len(event_elements)} events")
+            cards = extract_cards(driver, ".playgroup-filter__results-list-item", {
+                'name': "h2.card-title a",
+                'url': ("h2.card-title a", 'href'),
+                'address': "address",
+                'maps_url': ("address a[href*='google.com/maps']", 'href'),
+                'series': (".series-list > div", {
+                    'day': "strong",
+                    'time': ".bg-primary div",
+                }),
+            })
+            print(f"Found {len(cards)} events")
             
-            for event_elem in event_elements:
+            for card in cards:
                 try:
                     # Get event name and URL
-                    title_link = event_elem.find_element(By.CSS_SELECTOR, "h2.card-title a")
-                    event_name = title_link.text.strip()  + " Playgroup"
-                    event_url = title_link.get_attribute('href')
+                    if card['name'] is None:
+                        continue
+                    event_name = card['name'] + " Playgroup"
+                    event_url = card['url']
                     
                     # Get location and coordinates
-                    try:
-                        address_elem = event_elem.find_element(By.TAG_NAME, "address")
+                    latitude = None
+                    longitude = None
+                    if card['address'] is not None:
                         # Get the text before the <br> tag (first line of address)
-                        location_text = address_elem.text.split('\n')[0].strip()
+                        location_text = card['address'].split('\n')[0].strip()
                         
                         # Extract coordinates from Google Maps link
-                        try:
-                            maps_link = address_elem.find_element(By.CSS_SELECTOR, "a[href*='google.com/maps']")
-                            maps_url = maps_link.get_attribute('href')
-                            # Extract lat,long from URL like: destination=-33.1360212,151.5840258
-                            latitude = None
-                            longitude = None
-                            if 'destination=' in maps_url:
+                        # URL like: destination=-33.1360212,151.5840258
+                        maps_url = card['maps_url'] or ''
+                        if 'destination=' in maps_url:
+                            try:
                                 coords = maps_url.split('destination=')[1].split('&')[0]
                                 lat, lon = coords.split(',')
                                 latitude = float(lat)
                                 longitude = float(lon)
-                        except (NoSuchElementException, ValueError, IndexError):
-                            latitude = None
-                            longitude = None
-                            
-                    except NoSuchElementException:
+                            except (ValueError, IndexError):
+                                latitude = None
+                                longitude = None
+                    else:
                         location_text = 'N/A'
-                        latitude = None
-                        longitude = None
                     
                     # Get time/day information from series-list
-                    series_list = event_elem.find_elements(By.CSS_SELECTOR, ".series-list > div")
+                    series_list = card['series']
                     
                     if series_list:
                         # Multiple time slots
                         for series in series_list:
-                            try:
-                                day_name = series.find_element(By.TAG_NAME, "strong").text.strip()
-                                time_info = series.find_element(By.CSS_SELECTOR, ".bg-primary div").text.strip()
-                                
-                                # Parse datetime
-                                event_datetime = self.parse_time_to_datetime(day_name, time_info)
-                                
-                                self.events.append({
-                                    'name': event_name,
-                                    'date_readable': time_info,
-                                    'datetime': event_datetime.isoformat() if event_datetime else None,
-                                    'location': location_text,
-                                    'url': event_url,
-                                    'latitude': latitude,
-                                    'longitude': longitude
-                                })
-                            except NoSuchElementException:
+                            day_name = series['day']
+                            time_info = series['time']
+                            if day_name is None or time_info is None:
                                 continue
+                            
+                            # Parse datetime
+                            event_datetime = self.parse_time_to_datetime(day_name, time_info)
+                            
+                            self.events.append({
+                                'name': event_name,
+                                'date_readable': time_info,
+                                'datetime': event_datetime.isoformat() if event_datetime else None,
+                                'location': location_text,
+                                'url': event_url,
+                                'latitude': latitude,
+                                'longitude': longitude
+                            })
                     else:
                         # No specific time info
                         self.events.append({
@@ -216,7 +219,7 @@ class PlaygroupScraper:
                     continue
             
         finally:
-            driver.quit()
+            release_driver(pool, driver)
         
         print(f"Successfully scraped {len(self.events)} events")
 
@@ -247,7 +250,7 @@ class PlaygroupScraper:
             raise
 
 
-def main():
+def main(driver_pool=None):
     # Get environment variables
     supabase_url = os.getenv('SUPABASE_URL')
     supabase_key = os.getenv('SUPABASE_KEY')
@@ -259,7 +262,7 @@ def main():
     url = "https://www.playgroupnsw.org.au/playgroups/find-a-playgroup/?search=LOSTOCK+2311&radius=100"
     
     # Create scraper instance
-    scraper = PlaygroupScraper()
+    scraper = PlaygroupScraper(driver_pool=driver_pool)
     
     # Scrape the playgroups
     print("Starting scraper...")
@@ -1,4 +1,3 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -8,6 +7,10 @@ from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError
 from supabase import create_client, Client
 from zoneinfo import ZoneInfo
+from driver_pool import acquire_driver, release_driver
+from page_waits import wait_for_page_ready, wait_for_dom_settled, wait_for_staleness
+from address_normaliser import location_key
+from geocode_store import GeocodeStore
 import time
 import re
 import os
@@ -20,12 +23,15 @@ MONTHS = (
 )
 
 class PlayMattersScraper:
-    def __init__(self, base_url):
+    def __init__(self, base_url, driver_pool=None):
         self.base_url = base_url
+        self.driver_pool = driver_pool
         self.driver = None
         self.events = []
         self.geolocator = Nominatim(user_agent="playmatters_scraper")
-        self.geocode_cache = {}
+        # Shared with the other geocoding scrapers and kept between runs
+        self.geocode_store = GeocodeStore()
+        self.geocode_errors = set()   # keys that errored this run (not stored)
         
         self.coordinate_lookup = {
             "1 Jones Road\nBirkdale, QLD 4159": (-27.514434, 153.2029941),
@@ -120,14 +126,16 @@ class PlayMattersScraper:
             "Cnr Brookfield Rd and Boscombe Street,\nBrookfield, QLD 4069": (-27.4932037, 152.9142048),
             "Cnr Logan and Kessels Road\nUpper Mount Gravatt, QLD 4122": (-27.5597145, 153.0805483),
         }
+        # Same table keyed canonically, so "Shop 12, 59 Brisbane Road," and
+        # "shop 12 / 59 Brisbane Rd" are one entry (first listed wins)
+        self.coordinate_index = {}
+        for address, coords in self.coordinate_lookup.items():
+            self.coordinate_index.setdefault(location_key(address), coords)
 
     def setup_driver(self):
-        """Initialize the Chrome WebDriver"""
-        options = webdriver.ChromeOptions()
-        options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        self.driver = webdriver.Chrome(options=options)
+        """Lease a Chrome WebDriver from the shared pool (or a private one)"""
+        # Keep CSS: pagination waits on element_to_be_clickable
+        self.driver_pool, self.driver = acquire_driver(self.driver_pool, blocking='light')
         self.driver.implicitly_wait(10)
 
     def parse_datetime(self, date_str, time_str):
@@ -221,23 +229,18 @@ class PlayMattersScraper:
             print("  Date section not found on listing card")
             return None
 
-    def clean_address(self, address):
-        """Clean and normalise address for lookup"""
-        if not address:
-            return ""
-        return '\n'.join(line.strip() for line in address.split('\n') if line.strip())
-
     def lookup_coordinates(self, address):
         """Check if address exists in lookup table"""
-        cleaned = self.clean_address(address)
-        if cleaned in self.coordinate_lookup:
-            return self.coordinate_lookup[cleaned]
-        return None, None
+        return self.coordinate_index.get(location_key(address), (None, None))
 
     def geocode_address(self, address):
         """Get latitude and longitude from address using geocoding"""
-        if address in self.geocode_cache:
-            return self.geocode_cache[address]
+        key = location_key(address)
+        cached = self.geocode_store.lookup(key, source='playmatters')
+        if cached is not None:
+            return cached
+        if key in self.geocode_errors:
+            return None, None
 
         try:
             address_clean = address.replace('\n', ', ')
@@ -246,10 +249,12 @@ class PlayMattersScraper:
                     location = self.geolocator.geocode(address_clean, timeout=10)
                     if location:
                         lat, lng = location.latitude, location.longitude
-                        self.geocode_cache[address] = (lat, lng)
+                        self.geocode_store.put(key, lat, lng, source='playmatters')
                         time.sleep(1)
                         return lat, lng
-                    break
+                    # No match: remembered until the negative TTL lapses
+                    self.geocode_store.put(key, None, None, source='playmatters')
+                    return None, None
                 except GeocoderTimedOut:
                     if attempt < 2:
                         time.sleep(2)
@@ -258,7 +263,7 @@ class PlayMattersScraper:
         except (GeocoderServiceError, Exception) as e:
             print(f"  Geocoding error: {e}")
 
-        self.geocode_cache[address] = (None, None)
+        self.geocode_errors.add(key)
         return None, None
 
     def extract_lat_long_from_page(self):
@@ -291,7 +296,7 @@ class PlayMattersScraper:
             WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located((By.CLASS_NAME, "b-card"))
             )
-            time.sleep(2)
+            wait_for_dom_settled(self.driver)
 
             event_items = self.driver.find_elements(By.CSS_SELECTOR, "li.false")
             print(f"Found {len(event_items)} event items")
@@ -356,7 +361,7 @@ class PlayMattersScraper:
                                 "window.open(arguments[0], '_blank');", event_data['url']
                             )
                             self.driver.switch_to.window(self.driver.window_handles[-1])
-                            time.sleep(2)
+                            wait_for_page_ready(self.driver)
 
                             lat, lng = self.extract_lat_long_from_page()
 
@@ -392,16 +397,18 @@ class PlayMattersScraper:
     def click_pagination(self, page_num):
         """Click on pagination button for given page number"""
         try:
-            time.sleep(2)
-
             pagination_link = WebDriverWait(self.driver, 10).until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, f"a.e-pagi-link[data-page='{page_num}']"))
             )
+            first_card = self.driver.find_element(By.CLASS_NAME, "b-card")
 
             self.driver.execute_script("arguments[0].scrollIntoView(true);", pagination_link)
-            time.sleep(1)
             self.driver.execute_script("arguments[0].click();", pagination_link)
-            time.sleep(3)
+
+            # The results are re-rendered in place: wait for the old cards to go
+            if not wait_for_staleness(self.driver, first_card):
+                print(f"  ⚠ Page {page_num + 1} results did not replace the previous page")
+            wait_for_dom_settled(self.driver)
             return True
 
         except Exception as e:
@@ -415,7 +422,7 @@ class PlayMattersScraper:
         try:
             print(f"Loading initial URL: {self.base_url}")
             self.driver.get(self.base_url)
-            time.sleep(3)
+            wait_for_page_ready(self.driver)
 
             print("\n=== Scraping page 1 ===")
             self.scrape_page()
@@ -430,7 +437,9 @@ class PlayMattersScraper:
                     break
 
         finally:
-            self.driver.quit()
+            release_driver(self.driver_pool, self.driver)
+            self.driver = None
+            self.geocode_store.report()
 
     def upload_to_supabase(self, supabase_url, supabase_key, table='playgroups_qld'):
         """Upload events to Supabase"""
@@ -457,7 +466,7 @@ class PlayMattersScraper:
             raise
 
 
-if __name__ == "__main__":
+def main(driver_pool=None):
     base_url = "https://playmatters.org.au/search?p=4000&s=QLD&ltln=-27.4587,153.0222"
 
     supabase_url = os.getenv('SUPABASE_URL')
@@ -466,7 +475,7 @@ if __name__ == "__main__":
     if not supabase_url or not supabase_key:
         raise ValueError("SUPABASE_URL and SUPABASE_KEY environment variables must be set")
 
-    scraper = PlayMattersScraper(base_url)
+    scraper = PlayMattersScraper(base_url, driver_pool=driver_pool)
     scraper.scrape_all_pages(max_pages=10)
     scraper.upload_to_supabase(supabase_url, supabase_key, table='playgroups_qld')
 
@@ -474,4 +483,8 @@ if __name__ == "__main__":
     if scraper.events:
         print("\nFirst event sample:")
         for key, value in scraper.events[0].items():
-            print(f"  {key}: {value}")
\ No newline at end of file
+            print(f"  {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
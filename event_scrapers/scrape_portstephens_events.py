@@ -1,43 +1,10 @@
 import requests
-from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
-import re
 import os
 from supabase import create_client, Client
-
-# School term dates for NSW
-SCHOOL_TERM_DATES = {
-    2025: {
-        "terms": {
-            "eastern_nsw": [
-                ("Term 1", "2025-02-06", "2025-04-11"),
-                ("Term 2", "2025-04-30", "2025-07-04"),
-                ("Term 3", "2025-07-22", "2025-09-26"),
-                ("Term 4", "2025-10-14", "2025-12-19"),
-            ]
-        }
-    },
-    2026: {
-        "terms": {
-            "eastern_nsw": [
-                ("Term 1", "2026-01-27", "2026-04-02"),
-                ("Term 2", "2026-04-20", "2026-07-03"),
-                ("Term 3", "2026-07-20", "2026-09-25"),
-                ("Term 4", "2026-10-12", "2026-12-17"),
-            ]
-        }
-    },
-    2027: {
-        "terms": {
-            "eastern_nsw": [
-                ("Term 1", "2027-01-28", "2027-04-09"),
-                ("Term 2", "2027-04-26", "2027-07-02"),
-                ("Term 3", "2027-07-19", "2027-09-24"),
-                ("Term 4", "2027-10-11", "2027-12-20"),
-            ]
-        }
-    }
-}
+from http_cache import HttpCache
+from html_parsing import make_soup, strainer
+from recurrence import compile_rule
 
 # Library locations with coordinates
 LOCATIONS = {
@@ -58,104 +25,24 @@ LOCATIONS = {
     }
 }
 
-def get_weekday_number(day_name):
-    """Convert day name to weekday number (0=Monday, 6=Sunday)"""
-    days = {
-        'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-        'friday': 4, 'saturday': 5, 'sunday': 6
-    }
-    return days.get(day_name.lower())
-
 def generate_dates_for_term_schedule(schedule_text, time_text):
     """
     Generate all dates for a term-time recurring event
     Returns list of datetime strings (filtered to future dates within 1 month)
     """
-    dates = []
+    # Only "Every Tuesday ..." schedules repeat; one-off dates are left alone
+    if 'every' not in schedule_text.lower():
+        return []
     
-    # Get current datetime and calculate cutoff (1 month from now)
+    text = schedule_text if time_text in schedule_text else f"{schedule_text} {time_text}"
+    rule = compile_rule(text)
+    if not rule.is_expandable:
+        return []
+    
+    # Term-time or all year round (detected from the text) - only check the next month
     now = datetime.now()
     one_month_later = now + timedelta(days=30)
-    
-    # Extract day of week from schedule text
-    day_match = re.search(r'every\s+(\w+day)', schedule_text.lower())
-    if not day_match:
-        return dates
-    
-    day_name = day_match.group(1)
-    weekday_num = get_weekday_number(day_name)
-    if weekday_num is None:
-        return dates
-    
-    # Check if it's term time or all year
-    is_term_time = 'school term' in schedule_text.lower() or 'term' in schedule_text.lower()
-    
-    # Extract time
-    time_match = re.search(r'(\d{1,2}):?(\d{2})?\s*(am|pm)', time_text.lower())
-    if not time_match:
-        return dates
-    
-    hour = int(time_match.group(1))
-    minute = int(time_match.group(2)) if time_match.group(2) else 0
-    period = time_match.group(3)
-    
-    # Convert to 24-hour format
-    if period == 'pm' and hour != 12:
-        hour += 12
-    elif period == 'am' and hour == 12:
-        hour = 0
-    
-    time_str = f"{hour:02d}:{minute:02d}"
-    
-    # Generate dates for current year and next year
-    current_year = datetime.now().year
-    
-    for year in [current_year, current_year + 1]:
-        if year not in SCHOOL_TERM_DATES:
-            continue
-        
-        if is_term_time:
-            # Generate dates for each term
-            terms = SCHOOL_TERM_DATES[year]["terms"]["eastern_nsw"]
-            for term_name, start_date, end_date in terms:
-                start = datetime.strptime(start_date, '%Y-%m-%d')
-                end = datetime.strptime(end_date, '%Y-%m-%d')
-                
-                # Find first occurrence of the weekday in the term
-                current = start
-                while current.weekday() != weekday_num:
-                    current += timedelta(days=1)
-                    if current > end:
-                        break
-                
-                # Add all occurrences of that weekday in the term
-                while current <= end:
-                    event_datetime = datetime.strptime(f"{current.strftime('%Y-%m-%d')} {time_str}", '%Y-%m-%d %H:%M')
-                    
-                    # Only add if future-dated and within 1 month
-                    if now < event_datetime <= one_month_later:
-                        dates.append(f"{current.strftime('%Y-%m-%d')} {time_str}")
-                    
-                    current += timedelta(weeks=1)
-        else:
-            # All year round - only check the next month
-            start = now.date()
-            end = one_month_later.date()
-            
-            current = datetime.combine(start, datetime.min.time())
-            while current.weekday() != weekday_num:
-                current += timedelta(days=1)
-            
-            while current.date() <= end:
-                event_datetime = datetime.strptime(f"{current.strftime('%Y-%m-%d')} {time_str}", '%Y-%m-%d %H:%M')
-                
-                # Only add if future-dated and within 1 month
-                if now < event_datetime <= one_month_later:
-                    dates.append(f"{current.strftime('%Y-%m-%d')} {time_str}")
-                
-                current += timedelta(weeks=1)
-    
-    return dates
+    return [moment.strftime('%Y-%m-%d %H:%M') for moment in rule.between(now, one_month_later)]
 
 def parse_location_names(location_text):
     """Parse location text and return list of location keys"""
@@ -180,10 +67,17 @@ def scrape_portstephens_library_events():
     
     try:
         print("Fetching Port Stephens library programs...")
-        response = requests.get(url, headers=headers)
+        # Revalidates against last run's copy (304) instead of re-downloading
+        http = HttpCache(headers=headers)
+        try:
+            response = http.get(url)
+            http.report()
+        finally:
+            http.close()
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # Only the programs container is read, so only build that subtree
+        soup = make_soup(response.content, only=strainer('div', id='content_container_125662'))
         
         # Find the regular programs content
         content_div = soup.find('div', id='content_container_125662')
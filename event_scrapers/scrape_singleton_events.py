@@ -1,14 +1,17 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from datetime import datetime
-import time
+from urllib.parse import urljoin
 import re
 import os
 from supabase import create_client, Client
+from driver_pool import acquire_driver, release_driver
+from static_fetch import StaticPageFetcher
+from page_waits import wait_for_dom_settled
+from bulk_extract import extract_cards
+from keyword_matcher import FAMILY_KEYWORDS as SHARED_FAMILY_KEYWORDS, KeywordMatcher
 
 # Singleton Library coordinates
 SINGLETON_COORDINATES = {
@@ -16,34 +19,35 @@ SINGLETON_COORDINATES = {
     'longitude': 151.1667
 }
 
-FAMILY_KEYWORDS = [
-    'family', 'toddler', 'babies', 'baby', 'bubs', 'bubba', 'mummabubba',
-    'kids', 'teen', 'art starter', 'art play', 'art explorers', 'storytime',
-    'rhymetime', 'dungeons', 'lego', 'code', 'stem', 'steam', 'children',
-    'school holiday', 'playgroup', 'rock', 'rhyme', 'story stomp', 'little ones'
-]
+FAMILY_KEYWORDS = SHARED_FAMILY_KEYWORDS + ['little ones']
 
 
 class SingletonLibraryScraper:
-    def __init__(self, base_url, filter_words=None, headless=True):
+    def __init__(self, base_url, filter_words=None, headless=True, driver_pool=None):
         self.base_url = base_url
         self.filter_words = [w.lower() for w in filter_words] if filter_words else []
+        self.filter_matcher = KeywordMatcher(self.filter_words)
         self.events = []
 
-        options = Options()
-        if headless:
-            options.add_argument('--headless=new')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument("--window-size=1920,1080")
-        self.driver = webdriver.Chrome(options=options)
+        # Listing pages are tried over plain HTTP first; the browser is only
+        # leased the first time a page actually needs it
+        self.static_fetcher = StaticPageFetcher()
+        self.headless = headless
+        self.driver_pool = driver_pool
+        self._driver = None
+
+    @property
+    def driver(self):
+        """Lease a browser on first use"""
+        if self._driver is None:
+            # Keep CSS: cards are read as rendered text (innerText), which depends on styles
+            self.driver_pool, self._driver = acquire_driver(self.driver_pool, headless=self.headless, blocking='light')
+        return self._driver
 
     def contains_filter_word(self, title):
         if not self.filter_words:
             return True
-        title_lower = title.lower()
-        return any(word in title_lower for word in self.filter_words)
+        return self.filter_matcher.matches(title)
 
     def extract_time_from_description(self, description):
         """
@@ -86,6 +90,91 @@ class SingletonLibraryScraper:
     def scrape_all(self):
         """Scrape all events from the page"""
         print(f"Fetching events from: {self.base_url}")
+        soup = self.static_fetcher.fetch_soup(self.base_url, '.list-item-container .list-item-title')
+        if soup is not None:
+            all_events = self.parse_event_items(soup)
+        else:
+            all_events = self.scrape_event_items()
+
+        if all_events is None:
+            return []
+
+        all_events.sort(key=lambda x: x['datetime'])
+        self.events = all_events
+        return all_events
+
+    def build_event(self, title, description, day, month, year, event_url):
+        """
+        Turn the fields of one listing card into an event dict
+        Returns None if the card has no usable date
+        """
+        if not (day and month and year):
+            return None
+
+        date_str = f"{day} {month} {year}"
+        try:
+            # Parse date to datetime object
+            event_date = datetime.strptime(date_str, '%d %b %Y')
+        except Exception as e:
+            print(f"  ⚠ Error parsing date '{date_str}': {e}")
+            return None
+
+        # Try to extract time from description
+        time_str = self.extract_time_from_description(description)
+        if time_str:
+            # Combine date and time
+            datetime_str = f"{event_date.strftime('%Y-%m-%d')} {time_str}"
+        else:
+            # Just date, default to 10:00
+            datetime_str = f"{event_date.strftime('%Y-%m-%d')} 10:00"
+
+        return {
+            'title': title,
+            'description': description,
+            'datetime': datetime_str,
+            'location': 'Singleton Library',
+            'latitude': SINGLETON_COORDINATES['latitude'],
+            'longitude': SINGLETON_COORDINATES['longitude'],
+            'url': event_url
+        }
+
+    def parse_event_items(self, soup):
+        """Extract matching events from static listing HTML"""
+        event_items = soup.select('.list-item-container')
+        print(f"Found {len(event_items)} total events")
+
+        all_events = []
+
+        for item in event_items:
+            title_elem = item.select_one('.list-item-title')
+            if not title_elem:
+                continue
+            title = title_elem.get_text(strip=True)
+
+            # Check if title contains any keyword
+            if not self.contains_filter_word(title):
+                continue
+
+            desc_elem = item.select_one('.list-item-block-desc')
+            description = desc_elem.get_text(' ', strip=True) if desc_elem else ''
+
+            date_elem = item.select_one('.list-item-block-date')
+            parts = [date_elem.select_one(cls) if date_elem else None
+                     for cls in ('.part-date', '.part-month', '.part-year')]
+            day, month, year = [p.get_text(strip=True) if p else '' for p in parts]
+
+            link_elem = item.find('a', href=True)
+            event_url = urljoin(self.base_url, link_elem['href']) if link_elem else ''
+
+            event = self.build_event(title, description, day, month, year, event_url)
+            if event:
+                all_events.append(event)
+                print(f"  ✓ {title}")
+
+        return all_events
+
+    def scrape_event_items(self):
+        """Selenium fallback when the listing isn't in the static HTML"""
         self.driver.get(self.base_url)
 
         try:
@@ -94,97 +183,49 @@ class SingletonLibraryScraper:
             )
         except TimeoutException:
             print("⚠ Timeout waiting for events to load")
-            return []
+            return None
 
-        time.sleep(2)  # Let page fully render
+        wait_for_dom_settled(self.driver)  # Let page fully render
         
-        # Get all events
-        event_items = self.driver.find_elements(By.CLASS_NAME, 'list-item-container')
-        print(f"Found {len(event_items)} total events")
+        # Get all events (every card's fields in one round-trip)
+        cards = extract_cards(self.driver, '.list-item-container', {
+            'title': '.list-item-title',
+            'description': '.list-item-block-desc',
+            'day': '.list-item-block-date .part-date',
+            'month': '.list-item-block-date .part-month',
+            'year': '.list-item-block-date .part-year',
+            'url': ('a', 'href'),
+        })
+        print(f"Found {len(cards)} total events")
         
         all_events = []
         
-        for item in event_items:
-            try:
-                # Extract title
-                title_elem = item.find_element(By.CLASS_NAME, 'list-item-title')
-                title = title_elem.text.strip()
-                
-                # Check if title contains any keyword
-                if not self.contains_filter_word(title):
-                    continue
-                
-                # Extract description
-                description = ''
-                try:
-                    desc_elem = item.find_element(By.CLASS_NAME, 'list-item-block-desc')
-                    description = desc_elem.text.strip()
-                except:
-                    pass
-                
-                # Extract date
-                datetime_str = ''
-                try:
-                    date_elem = item.find_element(By.CLASS_NAME, 'list-item-block-date')
-                    
-                    day = date_elem.find_element(By.CLASS_NAME, 'part-date').text.strip()
-                    month = date_elem.find_element(By.CLASS_NAME, 'part-month').text.strip()
-                    year = date_elem.find_element(By.CLASS_NAME, 'part-year').text.strip()
-                    
-                    if day and month and year:
-                        date_str = f"{day} {month} {year}"
-                        try:
-                            # Parse date to datetime object
-                            event_date = datetime.strptime(date_str, '%d %b %Y')
-                            
-                            # Try to extract time from description
-                            time_str = self.extract_time_from_description(description)
-                            if time_str:
-                                # Combine date and time
-                                datetime_str = f"{event_date.strftime('%Y-%m-%d')} {time_str}"
-                            else:
-                                # Just date, default to 10:00
-                                datetime_str = f"{event_date.strftime('%Y-%m-%d')} 10:00"
-                        except Exception as e:
-                            print(f"  ⚠ Error parsing date '{date_str}': {e}")
-                            continue
-                except Exception as e:
-                    print(f"  ⚠ Error extracting date: {e}")
-                    continue
-                
-                if not datetime_str:
-                    continue
-                
-                # Extract event URL
-                event_url = ''
-                try:
-                    link_elem = item.find_element(By.TAG_NAME, 'a')
-                    event_url = link_elem.get_attribute('href')
-                except:
-                    pass
-                
-                # Create event dictionary
-                event = {
-                    'title': title,
-                    'description': description,
-                    'datetime': datetime_str,
-                    'location': 'Singleton Library',
-                    'latitude': SINGLETON_COORDINATES['latitude'],
-                    'longitude': SINGLETON_COORDINATES['longitude'],
-                    'url': event_url
-                }
-                
-                all_events.append(event)
-                print(f"  ✓ {title}")
-                
-            except Exception as e:
-                print(f"  ⚠ Error parsing event: {e}")
+        for card in cards:
+            title = card['title']
+            
+            # Check if title contains any keyword
+            if not title or not self.contains_filter_word(title):
                 continue
+            
+            event = self.build_event(
+                title, card['description'] or '', card['day'], card['month'], card['year'], card['url'] or ''
+            )
+            if not event:
+                print(f"  ⚠ No usable date for: {title}")
+                continue
+            
+            all_events.append(event)
+            print(f"  ✓ {title}")
         
-        all_events.sort(key=lambda x: x['datetime'])
-        self.events = all_events
         return all_events
 
+    def close(self):
+        """Return the browser to its pool"""
+        self.static_fetcher.close()
+        if self._driver:
+            release_driver(self.driver_pool, self._driver)
+            self._driver = None
+
     def upload_to_supabase(self, supabase_url, supabase_key, table='events_singleton'):
         """Upload events to Supabase"""
         if not self.events:
@@ -211,10 +252,14 @@ class SingletonLibraryScraper:
             raise
 
 
-def main():
+def main(driver_pool=None):
     BASE_URL = "https://www.singleton.nsw.gov.au/Live/Residents/Library/Whats-on-at-the-Library"
-    scraper = SingletonLibraryScraper(BASE_URL, filter_words=FAMILY_KEYWORDS)
-    scraper.scrape_all()
+    scraper = SingletonLibraryScraper(BASE_URL, filter_words=FAMILY_KEYWORDS, driver_pool=driver_pool)
+    try:
+        scraper.scrape_all()
+    finally:
+        # Browser is not needed for the upload
+        scraper.close()
 
     supabase_url = os.environ.get('SUPABASE_URL')
     supabase_key = os.environ.get('SUPABASE_KEY')
@@ -223,8 +268,6 @@ def main():
     else:
         print("⚠ Supabase credentials missing. Skipping upload.")
 
-    scraper.driver.quit()
-
 
 if __name__ == "__main__":
     main()
@@ -1,14 +1,18 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from datetime import datetime
+from urllib.parse import urljoin, urldefrag
 import time
 import re
 import os
 from supabase import create_client, Client
+from driver_pool import acquire_driver, release_driver
+from static_fetch import StaticPageFetcher
+from page_waits import wait_for_staleness, wait_for_dom_settled
+from bulk_extract import extract_cards
+from keyword_matcher import FAMILY_KEYWORDS as SHARED_FAMILY_KEYWORDS, KeywordMatcher
 
 # Venue coordinates
 VENUE_COORDINATES = {
@@ -18,38 +22,43 @@ VENUE_COORDINATES = {
     'Aberdeen Library': {'latitude': -32.1667, 'longitude': 150.8833}
 }
 
-FAMILY_KEYWORDS = [
-    'family', 'toddler', 'babies', 'baby', 'bubs', 'bubba', 'mummabubba',
-    'kids', 'teen', 'art starter', 'art play', 'art explorers', 'storytime',
-    'rhymetime', 'dungeons', 'lego', 'code', 'stem', 'steam', 'children',
-    'school holiday', 'playgroup', 'rock', 'rhyme', 'story stomp', 'little ones',
-    'story time', 'craft'
-]
+FAMILY_KEYWORDS = SHARED_FAMILY_KEYWORDS + ['little ones', 'story time', 'craft']
 
 class UpperHunterLibraryScraper:
-    def __init__(self, base_url, filter_words=None, headless=True):
+    def __init__(self, base_url, filter_words=None, headless=True, driver_pool=None):
         self.base_url = base_url
         self.filter_words = [w.lower() for w in filter_words] if filter_words else []
+        self.filter_matcher = KeywordMatcher(self.filter_words)
         self.events = []
 
-        options = Options()
-        if headless:
-            options.add_argument('--headless=new')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument("--window-size=1920,1080")
-        self.driver = webdriver.Chrome(options=options)
+        # Listing pages are tried over plain HTTP first; the browser is only
+        # leased the first time a page actually needs it
+        self.static_fetcher = StaticPageFetcher()
+        self.headless = headless
+        self.driver_pool = driver_pool
+        self._driver = None
+
+    @property
+    def driver(self):
+        """Lease a browser on first use"""
+        if self._driver is None:
+            # Keep CSS: the next-page link is clicked like a user would
+            self.driver_pool, self._driver = acquire_driver(self.driver_pool, headless=self.headless, blocking='light')
+        return self._driver
 
     def contains_filter_word(self, title):
         if not self.filter_words:
             return True
-        title_lower = title.lower()
-        return any(word in title_lower for word in self.filter_words)
+        return self.filter_matcher.matches(title)
 
     def get_all_event_links(self):
         """Collect all event links from all pages"""
         print(f"Fetching events from: {self.base_url}")
+        soup = self.static_fetcher.fetch_soup(self.base_url, '.list-item-container article .list-item-title')
+        event_links = self.get_all_event_links_static(soup) if soup is not None else None
+        if event_links is not None:
+            return event_links
+
         self.driver.get(self.base_url)
 
         try:
@@ -66,44 +75,25 @@ class UpperHunterLibraryScraper:
         while True:
             print(f"Processing page {page_num}...")
             
-            # Get all events on current page
-            event_items = self.driver.find_elements(By.CLASS_NAME, 'list-item-container')
+            # Get all events on current page (every card's fields in one round-trip)
+            cards = extract_cards(self.driver, '.list-item-container', {
+                'title': 'article a .list-item-title',
+                'url': ('article a', 'href'),
+                # Get description and location from list page
+                'description': 'article a .list-item-block-desc',
+                'location_text': '.list-item-address',
+            })
             
-            for item in event_items:
-                try:
-                    article = item.find_element(By.TAG_NAME, 'article')
-                    link = article.find_element(By.TAG_NAME, 'a')
-                    title_elem = link.find_element(By.CLASS_NAME, 'list-item-title')
-                    
-                    title = title_elem.text.strip()
-                    event_url = link.get_attribute('href')
-                    
-                    if self.contains_filter_word(title):
-                        # Get description and location from list page
-                        description = ''
-                        location_text = ''
-                        
-                        try:
-                            desc_elem = link.find_element(By.CLASS_NAME, 'list-item-block-desc')
-                            description = desc_elem.text.strip()
-                        except:
-                            pass
-                        
-                        try:
-                            location_elem = item.find_element(By.CLASS_NAME, 'list-item-address')
-                            location_text = location_elem.text.strip()
-                        except:
-                            pass
-                        
-                        event_links.append({
-                            'title': title,
-                            'url': event_url,
-                            'description': description,
-                            'location_text': location_text
-                        })
-                        print(f"  ✓ {title}")
-                except Exception as e:
-                    continue
+            for card in cards:
+                title = card['title']
+                if title and self.contains_filter_word(title):
+                    event_links.append({
+                        'title': title,
+                        'url': card['url'],
+                        'description': card['description'] or '',
+                        'location_text': card['location_text'] or ''
+                    })
+                    print(f"  ✓ {title}")
             
             # Check for next page
             try:
@@ -113,11 +103,14 @@ class UpperHunterLibraryScraper:
                     break
                 
                 next_link = self.driver.find_element(By.CSS_SELECTOR, 'a.page-link.next')
+                first_item = self.driver.find_element(By.CLASS_NAME, 'list-item-container')
                 next_link.click()
-                time.sleep(1)
+                # Wait for the old listing to be replaced, not just present
+                wait_for_staleness(self.driver, first_item)
                 WebDriverWait(self.driver, 10).until(
                     EC.presence_of_all_elements_located((By.CLASS_NAME, "list-item-container"))
                 )
+                wait_for_dom_settled(self.driver)
                 page_num += 1
             except Exception:
                 print(f"Reached last page at page {page_num}")
@@ -126,6 +119,75 @@ class UpperHunterLibraryScraper:
         print(f"Found {len(event_links)} matching events")
         return event_links
 
+    def get_all_event_links_static(self, soup, max_pages=50):
+        """
+        Walk the paginated listing over plain HTTP by following the next-page link
+        Returns None if pagination is JS-driven (no real href) or a page can't be fetched,
+        so the caller re-walks the listing with Selenium
+        """
+        event_links = []
+        page_num = 1
+        page_url = self.base_url
+        seen_pages = {page_url}
+
+        while True:
+            print(f"Processing page {page_num}...")
+            event_links.extend(self.parse_event_links(soup))
+
+            next_link = soup.select_one('a.page-link.next')
+            if soup.select_one('li.disabled span.next') or not next_link or page_num >= max_pages:
+                print(f"Reached last page at page {page_num}")
+                break
+
+            href = next_link.get('href', '')
+            if not href or href.startswith(('#', 'javascript')):
+                print("⚠ Pagination needs JavaScript, falling back to Selenium")
+                return None
+
+            page_url = urldefrag(urljoin(page_url, href)).url
+            if page_url in seen_pages:
+                print(f"Reached last page at page {page_num}")
+                break
+            seen_pages.add(page_url)
+
+            soup = self.static_fetcher.fetch_soup(page_url, '.list-item-container')
+            if soup is None:
+                # Returning the pages so far would silently drop the rest
+                print(f"⚠ Could not fetch page {page_num + 1} over HTTP, falling back to Selenium")
+                return None
+            page_num += 1
+
+        print(f"Found {len(event_links)} matching events")
+        return event_links
+
+    def parse_event_links(self, soup):
+        """Extract matching events (title, URL, description, location) from one listing page"""
+        event_links = []
+
+        for item in soup.select('.list-item-container'):
+            link = item.select_one('article a')
+            title_elem = link.select_one('.list-item-title') if link else None
+            if not title_elem:
+                continue
+
+            title = title_elem.get_text(strip=True)
+            if not self.contains_filter_word(title):
+                continue
+
+            # Get description and location from list page
+            desc_elem = link.select_one('.list-item-block-desc')
+            location_elem = item.select_one('.list-item-address')
+
+            event_links.append({
+                'title': title,
+                'url': urljoin(self.base_url, link.get('href', '')),
+                'description': desc_elem.get_text(' ', strip=True) if desc_elem else '',
+                'location_text': location_elem.get_text('\n', strip=True) if location_elem else ''
+            })
+            print(f"  ✓ {title}")
+
+        return event_links
+
     def parse_location(self, location_text):
         """Parse location text and return location name"""
         if not location_text:
@@ -218,6 +280,13 @@ class UpperHunterLibraryScraper:
                 e['latitude'] = None
                 e['longitude'] = None
 
+    def close(self):
+        """Return the browser to its pool"""
+        self.static_fetcher.close()
+        if self._driver:
+            release_driver(self.driver_pool, self._driver)
+            self._driver = None
+
     def upload_to_supabase(self, supabase_url, supabase_key, table='events_upperhunter'):
         """Upload events to Supabase"""
         if not self.events:
@@ -233,10 +302,14 @@ class UpperHunterLibraryScraper:
         print(f"Uploaded {len(clean)} records to {table}")
 
 
-def main():
+def main(driver_pool=None):
     BASE_URL = "https://www.upperhunter.nsw.gov.au/Events-Activities"
-    scraper = UpperHunterLibraryScraper(BASE_URL, filter_words=FAMILY_KEYWORDS)
-    scraper.scrape_all()
+    scraper = UpperHunterLibraryScraper(BASE_URL, filter_words=FAMILY_KEYWORDS, driver_pool=driver_pool)
+    try:
+        scraper.scrape_all()
+    finally:
+        # Browser is not needed for the upload
+        scraper.close()
     scraper.add_coordinates()
 
     supabase_url = os.environ.get('SUPABASE_URL')
@@ -246,8 +319,6 @@ def main():
     else:
         print("⚠ Supabase credentials missing. Skipping upload.")
 
-    scraper.driver.quit()
-
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,13 @@
+import os
+
+# Directory for local state that should survive between runs (persisted by the CI cache)
+STATE_DIR = os.getenv(
+    'SCRAPER_STATE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.scraper_state')
+)
+
+
+# Return the path of a state file, creating the state directory if needed
+def state_path(filename):
+    os.makedirs(STATE_DIR, exist_ok=True)
+    return os.path.join(STATE_DIR, filename)
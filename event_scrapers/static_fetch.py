@@ -0,0 +1,69 @@
+"""
+HTTP-first page fetching for the CMS-based council scrapers.
+
+Lake Mac, Upper Hunter, MidCoast and Singleton all run on the same CMS, whose
+listing markup (div.list-item-container article, h2.list-item-title,
+li.multi-date-item) is mostly server-rendered. StaticPageFetcher downloads a
+page with plain requests and only hands back the parsed soup if the selector
+the scraper depends on is present; otherwise the caller falls back to driving
+headless Chrome.
+
+Environment variables:
+    SCRAPER_FETCH_MODE — 'auto' (default: HTTP first, Selenium fallback)
+                         or 'selenium' (skip the HTTP attempt)
+"""
+
+import os
+import requests
+from driver_pool import DEFAULT_USER_AGENT
+from html_parsing import make_soup
+
+FETCH_MODE = os.getenv('SCRAPER_FETCH_MODE', 'auto').lower()
+
+
+class StaticPageFetcher:
+    """
+    Keep-alive HTTP client that returns a page's soup only when it carries the
+    markup a scraper needs
+    Args:
+        user_agent: sent with every request (a desktop Chrome user agent by default)
+        timeout: per-request timeout in seconds
+        enabled: set False to always report a miss (forces the Selenium path)
+    """
+
+    def __init__(self, user_agent=DEFAULT_USER_AGENT, timeout=20, enabled=None):
+        self.timeout = timeout
+        self.enabled = FETCH_MODE != 'selenium' if enabled is None else enabled
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': user_agent,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-AU,en;q=0.9',
+        })
+
+    def fetch_soup(self, url, required_selector):
+        """
+        GET url and parse it
+        Returns the BeautifulSoup document, or None if HTTP fetching is disabled,
+        the request failed, or required_selector is missing (JS-rendered page)
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"  ⚠ HTTP fetch failed ({e}), falling back to Selenium")
+            return None
+
+        soup = make_soup(response.content)
+        if soup.select_one(required_selector) is None:
+            print(f"  ⚠ '{required_selector}' not in static HTML, falling back to Selenium")
+            return None
+
+        print("  ✓ Fetched over HTTP (no browser needed)")
+        return soup
+
+    def close(self):
+        self.session.close()
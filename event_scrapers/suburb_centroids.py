@@ -0,0 +1,131 @@
+"""
+Suburb + postcode centroids for suburb-level geocode fallbacks.
+
+When a full street address can't be geocoded, callers fall back to the suburb.
+Answering that from a local table is an O(1) dict lookup instead of another
+rate-limited Nominatim request, and services in the same suburb share it.
+
+The table is a small CSV (suburb,postcode,state,latitude,longitude,addresses)
+derived from the gazetteer index: each centroid is the mean position of the
+suburb's addresses, so it sits where people actually live rather than at the
+geometric middle of a mostly-empty polygon.
+
+    python suburb_centroids.py build --states QLD NSW
+
+Environment variables:
+    SUBURB_CENTROIDS_CSV — table location (default suburb_centroids.csv next to this file)
+"""
+
+import argparse
+import csv
+import os
+import sqlite3
+import sys
+from address_normaliser import canonical_place
+from gazetteer import DEFAULT_DB_PATH as GAZETTEER_DB_PATH
+
+DEFAULT_CSV_PATH = os.getenv(
+    'SUBURB_CENTROIDS_CSV',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'suburb_centroids.csv')
+)
+
+FIELDS = ['suburb', 'postcode', 'state', 'latitude', 'longitude', 'addresses']
+
+
+class SuburbCentroids:
+    """
+    In-memory centroid table
+    Args:
+        rows: iterable of dicts with FIELDS
+    """
+
+    def __init__(self, rows=()):
+        self.by_postcode = {}   # (suburb, postcode) → (lat, lng)
+        self.by_state = {}      # (suburb, state) → (lat, lng, addresses), most addresses wins
+        for row in rows:
+            suburb = canonical_place(row['suburb'])
+            coords = (float(row['latitude']), float(row['longitude']))
+            self.by_postcode[(suburb, canonical_place(row['postcode']))] = coords
+
+            state_key = (suburb, canonical_place(row.get('state')))
+            weight = int(row.get('addresses') or 0)
+            if state_key not in self.by_state or weight > self.by_state[state_key][2]:
+                self.by_state[state_key] = coords + (weight,)
+
+    @classmethod
+    def load(cls, path=DEFAULT_CSV_PATH):
+        """The table at path (empty if it hasn't been built)"""
+        try:
+            with open(path, encoding='utf-8', newline='') as f:
+                centroids = cls(csv.DictReader(f))
+        except FileNotFoundError:
+            return cls()
+        except (OSError, KeyError, ValueError) as e:
+            print(f"⚠ Could not read suburb centroids {path} ({e}); using Nominatim for suburb fallbacks")
+            return cls()
+        print(f"✓ Suburb centroids loaded: {len(centroids)} suburbs")
+        return centroids
+
+    def __len__(self):
+        return len(self.by_postcode)
+
+    def lookup(self, suburb, postcode='', state=''):
+        """(lat, lng) for the suburb, or None if it isn't in the table"""
+        suburb = canonical_place(suburb)
+        coords = self.by_postcode.get((suburb, canonical_place(postcode)))
+        if coords is None and state:
+            entry = self.by_state.get((suburb, canonical_place(state)))
+            coords = entry[:2] if entry else None
+        return coords
+
+
+def build_table(db_path=GAZETTEER_DB_PATH, csv_path=DEFAULT_CSV_PATH, states=None):
+    """
+    Write the centroid CSV from a built gazetteer index
+    Returns the number of suburbs written
+    """
+    query = '''
+        SELECT suburb, postcode, COALESCE(state, ''), AVG(latitude), AVG(longitude), COUNT(*)
+        FROM addresses
+        {where}
+        GROUP BY suburb, postcode, state
+        ORDER BY state, suburb, postcode
+    '''
+    params = [s.upper() for s in states] if states else []
+    where = f"WHERE state IN ({', '.join('?' * len(params))})" if params else ''
+
+    db = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+    try:
+        rows = db.execute(query.format(where=where), params).fetchall()
+    finally:
+        db.close()
+
+    tmp_path = f"{csv_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDS)
+        for suburb, postcode, state, lat, lng, count in rows:
+            writer.writerow([suburb, postcode, state, f"{lat:.6f}", f"{lng:.6f}", count])
+    os.replace(tmp_path, csv_path)
+    print(f"✓ Wrote {len(rows):,} suburb centroids → {csv_path}")
+    return len(rows)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='Build the suburb centroid table from the gazetteer')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build')
+    build.add_argument('--db', default=GAZETTEER_DB_PATH, help='gazetteer index to aggregate')
+    build.add_argument('--out', default=DEFAULT_CSV_PATH)
+    build.add_argument('--states', nargs='*', help='keep only these states, e.g. QLD NSW')
+
+    args = parser.parse_args(argv)
+    if not os.path.exists(args.db):
+        print(f"✗ No gazetteer at {args.db}; build it first with gazetteer.py build")
+        return False
+    return build_table(args.db, args.out, args.states) > 0
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main(sys.argv[1:]) else 1)
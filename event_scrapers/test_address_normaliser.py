@@ -0,0 +1,55 @@
+import doctest
+import unittest
+
+import address_normaliser
+from address_normaliser import address_key, canonical_street, location_key, rekey, split_location
+
+
+class CanonicalStreetTest(unittest.TestCase):
+    def test_unit_prefix_before_street_number_is_dropped(self):
+        self.assertEqual(canonical_street('Shop 12, 59 Brisbane Road,'), '59 brisbane road')
+        self.assertEqual(canonical_street('shop 12 / 59 Brisbane Rd'), '59 brisbane road')
+        self.assertEqual(canonical_street('Unit 3 45 Main St'), '45 main street')
+        self.assertEqual(canonical_street('Shop 3A, 45 Main Rd'), '45 main road')
+        self.assertEqual(canonical_street('12/59 Brisbane Rd'), '59 brisbane road')
+
+    def test_unit_number_without_street_number_is_kept_whole(self):
+        self.assertEqual(canonical_street('Lot 25 Smith Rd'), 'lot 25 smith road')
+        self.assertEqual(canonical_street('Unit 12 Main St'), 'unit 12 main street')
+        self.assertEqual(canonical_street('Shop 10 Westfield Carindale'), 'shop 10 westfield carindale')
+        self.assertEqual(canonical_street('Lot 101 Mount Cotton Road'), 'lot 101 mount cotton road')
+
+    def test_abbreviations_ranges_and_leading_place_names(self):
+        self.assertEqual(canonical_street('12-54 Goodna Rd'), '12 goodna road')
+        self.assertEqual(canonical_street('Cultural Precinct, 10 Stanley Pl'), '10 stanley place')
+        self.assertEqual(canonical_street('Cnr Park Rd & Villa St'), 'corner park road and villa street')
+
+
+class KeyTest(unittest.TestCase):
+    def test_address_key(self):
+        self.assertEqual(address_key('Shop 12, 59 Brisbane Rd', 'REDBANK', '4301'), '59 brisbane road|redbank|4301')
+
+    def test_rekey_legacy_lower_cased_key(self):
+        self.assertEqual(rekey('shop 3, 45 main rd.|springwood|4127'), '45 main road|springwood|4127')
+
+    def test_location_variants_share_a_key(self):
+        variants = [
+            'Shop 12, 59 Brisbane Road\nRedbank, QLD 4301',
+            'Shop 12, 59 Brisbane Road,\nRedbank, QLD 4301',
+            'shop 12 / 59 Brisbane Rd\nRedbank, QLD 4301',
+        ]
+        self.assertEqual({location_key(v) for v in variants}, {'59 brisbane road|redbank|4301'})
+
+    def test_split_location(self):
+        self.assertEqual(split_location('1 Jones Road\nBirkdale, QLD 4159'),
+                         ('1 Jones Road', 'birkdale', 'qld', '4159'))
+        self.assertEqual(split_location('Somewhere'), ('Somewhere', '', '', ''))
+
+
+class DoctestTest(unittest.TestCase):
+    def test_module_doctests(self):
+        self.assertEqual(doctest.testmod(address_normaliser).failed, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
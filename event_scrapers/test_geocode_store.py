@@ -0,0 +1,70 @@
+import os
+import tempfile
+import time
+import unittest
+
+from geocode_store import GeocodeStore
+
+
+class FakeTable:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def table(self, name):
+        return self
+
+    def select(self, columns):
+        return self
+
+    def range(self, start, end):
+        self.page = self.rows[start:end + 1]
+        return self
+
+    def execute(self):
+        return type('Response', (), {'data': self.page})
+
+
+class GeocodeStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = GeocodeStore(os.path.join(self.tmp.name, 'geocodes.sqlite'), negative_ttl_days=30)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_positive_answers_are_shared(self):
+        self.store.put('1 main street|redbank|4301', -27.6, 152.87, source='playmatters')
+        self.assertEqual(self.store.lookup('1 main street|redbank|4301', source='nominatim'), (-27.6, 152.87))
+
+    def test_negatives_only_count_for_their_own_source(self):
+        self.store.put('1 main street|redbank|4301', None, None, source='playmatters')
+        self.assertEqual(self.store.lookup('1 main street|redbank|4301', source='playmatters'), (None, None))
+        self.assertIsNone(self.store.lookup('1 main street|redbank|4301', source='nominatim'))
+        self.assertIsNone(self.store.lookup('1 main street|redbank|4301'))
+
+    def test_stale_negatives_are_retried(self):
+        stale = time.time() - 31 * 86400
+        self.store.put_many([('1 main street|redbank|4301', None, None)], source='nominatim', updated_at=stale)
+        self.assertIsNone(self.store.lookup('1 main street|redbank|4301', source='nominatim'))
+
+    def test_lookup_many_returns_only_answerable_keys(self):
+        self.store.put('a|x|1', 1.0, 2.0, source='nominatim')
+        self.store.put('b|x|1', None, None, source='nominatim')
+        found = self.store.lookup_many(['a|x|1', 'b|x|1', 'c|x|1'], source='nominatim')
+        self.assertEqual(found, {'a|x|1': (1.0, 2.0), 'b|x|1': (None, None)})
+
+    def test_sync_fills_negatives_but_keeps_local_positives(self):
+        self.store.put('a|x|1', None, None, source='nominatim')
+        self.store.put('b|x|1', 5.0, 6.0, source='gazetteer')
+        self.store.sync_from_supabase(FakeTable([
+            {'address_key': 'a|x|1', 'latitude': 1.0, 'longitude': 2.0},
+            {'address_key': 'b|x|1', 'latitude': 7.0, 'longitude': 8.0},
+            {'address_key': 'c|x|1', 'latitude': 3.0, 'longitude': 4.0},
+        ]))
+        found = self.store.lookup_many(['a|x|1', 'b|x|1', 'c|x|1'], source='nominatim')
+        self.assertEqual(found, {'a|x|1': (1.0, 2.0), 'b|x|1': (5.0, 6.0), 'c|x|1': (3.0, 4.0)})
+
+
+if __name__ == '__main__':
+    unittest.main()
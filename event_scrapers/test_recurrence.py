@@ -0,0 +1,78 @@
+import unittest
+from datetime import date, datetime, time
+
+from recurrence import HOLIDAYS, TERM, _parse_times, compile_rule
+
+
+class ParseTimesTest(unittest.TestCase):
+    def test_single_times(self):
+        self.assertEqual(_parse_times('11am'), (time(11, 0), None))
+        self.assertEqual(_parse_times('2:30pm'), (time(14, 30), None))
+        self.assertEqual(_parse_times('12pm'), (time(12, 0), None))
+        self.assertEqual(_parse_times('no time here'), (None, None))
+
+    def test_start_shares_end_meridiem(self):
+        self.assertEqual(_parse_times('3.30 - 4.30pm'), (time(15, 30), time(16, 30)))
+        self.assertEqual(_parse_times('12:30 - 1pm'), (time(12, 30), time(13, 0)))
+
+    def test_start_before_noon_end(self):
+        self.assertEqual(_parse_times('11 - 12pm'), (time(11, 0), time(12, 0)))
+        self.assertEqual(_parse_times('9 - 12pm'), (time(9, 0), time(12, 0)))
+        self.assertEqual(_parse_times('10am - 2pm'), (time(10, 0), time(14, 0)))
+
+
+class WeekdayTest(unittest.TestCase):
+    def test_listed_days(self):
+        self.assertEqual(compile_rule('Thursday & Friday 3.30 - 4.30pm').weekdays, (3, 4))
+        self.assertEqual(compile_rule('Every Tuesday 11am').weekdays, (1,))
+
+    def test_day_ranges_are_expanded(self):
+        self.assertEqual(compile_rule('Monday to Friday 10am').weekdays, (0, 1, 2, 3, 4))
+        self.assertEqual(compile_rule('Mondays-Wednesdays 9am').weekdays, (0, 1, 2))
+        self.assertEqual(compile_rule('Friday – Monday 9am').weekdays, (0, 4, 5, 6))
+
+    def test_season_detection(self):
+        self.assertEqual(compile_rule('Every Tuesday 11am (excluding school holidays)').season, TERM)
+        self.assertEqual(compile_rule('Tuesdays in the school holidays 10am').season, HOLIDAYS)
+        self.assertIsNone(compile_rule('Every Tuesday 11am').season)
+
+
+class BetweenTest(unittest.TestCase):
+    def test_date_bounds_are_inclusive(self):
+        rule = compile_rule('Monday to Friday 10am')
+        moments = list(rule.between(date(2026, 10, 16), date(2026, 10, 19)))
+        self.assertEqual(moments, [datetime(2026, 10, 16, 10), datetime(2026, 10, 19, 10)])
+
+    def test_datetime_bounds_are_exact(self):
+        rule = compile_rule('Every Tuesday 11am')
+        moments = list(rule.between(datetime(2026, 10, 20, 12), datetime(2026, 10, 27, 11)))
+        self.assertEqual(moments, [datetime(2026, 10, 27, 11)])
+
+    def test_term_rule_skips_holidays(self):
+        rule = compile_rule('Every Tuesday 11am (excluding school holidays)')
+        moments = list(rule.between(date(2026, 9, 22), date(2026, 10, 13)))
+        self.assertEqual(moments, [datetime(2026, 9, 22, 11), datetime(2026, 10, 13, 11)])
+
+
+class FortnightlyTest(unittest.TestCase):
+    def test_term_rule_counts_from_term_start(self):
+        # Term 4 2026 starts Monday 12 October: weeks 1, 3, 5, ...
+        rule = compile_rule('Tuesday 10am fortnightly during term')
+        moments = list(rule.between(date(2026, 9, 1), date(2026, 11, 10)))
+        self.assertEqual(moments, [
+            datetime(2026, 9, 1, 10), datetime(2026, 9, 15, 10),      # Term 3 (from 20 July)
+            datetime(2026, 10, 13, 10), datetime(2026, 10, 27, 10), datetime(2026, 11, 10, 10),
+        ])
+
+    def test_non_term_cycle_is_stable_across_windows(self):
+        rule = compile_rule('Every second week Wednesday 9am')
+        wide = set(rule.between(date(2026, 1, 1), date(2026, 12, 31)))
+        for start in (date(2026, 3, 2), date(2026, 3, 9), date(2026, 3, 10)):
+            narrow = list(rule.between(start, date(2026, 4, 30)))
+            self.assertTrue(narrow)
+            self.assertTrue(set(narrow) <= wide)
+        self.assertTrue(all((b - a).days == 14 for a, b in zip(sorted(wide), sorted(wide)[1:])))
+
+
+if __name__ == '__main__':
+    unittest.main()